@@ -1,4 +1,8 @@
-"""Scripts for updating honeybee-energy-standards with the latest OpenStudio Standards."""
+"""Scripts for updating honeybee-energy-standards with the latest OpenStudio Standards.
 
-# load all functions that extends honeybee-energy library
-import standards_update._extend_honeybee_energy
+The classmethods that create honeybee-energy objects from standards gem dictionaries
+are added by standards_update._extend_honeybee_energy, which is imported by each
+module that uses them rather than here. Importing honeybee_energy loads the whole
+standards library, which modules that only read the JSON data (eg. the catalogs
+of the _lib package and the validator of the _util package) do not need.
+"""
@@ -3,16 +3,11 @@ import json
 
 from honeybee.model import Model
 
+from standards_update._lib._assign import clean_space_type, EXCLUDED_SPACE_TYPES
+
 ref_blgd_folder = 'H:/My Drive/LadybugTools/Baseline_Models/hbjson'
 output_file = 'honeybee_energy_standards/building_mix.json'
 
-# programs to exclude
-EX_PROGRAM =(
-    'Outpatient Hall_infil',
-    'LargeHotel Corridor2',
-    'LargeHotel Retail2'
-)
-
 building_mix = {}
 
 for hbjson_file in os.listdir(ref_blgd_folder):
@@ -25,16 +20,8 @@ for hbjson_file in os.listdir(ref_blgd_folder):
     bld_area_dict = {}
     for room in model.rooms:
         if 'space_type' in room.user_data and not room.exclude_floor_area:
-            space_type = room.user_data['space_type']
-            if space_type.startswith('SmallHotel'):
-                space_type = space_type.replace('123', '').replace('4', '')
-                space_type = space_type.replace('Front', '').replace('Rear', '')
-            elif space_type.startswith('StripMall'):
-                space_type = space_type.replace('Strip mall', '').replace('type', 'Type')
-            elif space_type.startswith('MidriseApartment') or space_type.startswith('HighriseApartment'):
-                space_type = space_type.replace('_topfloor', '').replace('_NS', '').replace('_WE', '')
-
-            if space_type not in EX_PROGRAM:
+            space_type = clean_space_type(room.user_data['space_type'])
+            if space_type not in EXCLUDED_SPACE_TYPES:
                 try:
                     bld_area_dict[space_type] += room.floor_area * room.multiplier
                 except KeyError:
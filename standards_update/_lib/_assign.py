@@ -0,0 +1,175 @@
+# coding=utf-8
+"""Assign standards program types and construction sets to all rooms of a Model at once.
+
+Each unique program type and construction set is only loaded from the library
+once and the same locked instance is assigned to every room that uses it, which
+is much faster and uses much less memory than loading objects room by room.
+"""
+import time
+
+import honeybee_energy.lib.programtypes as program_lib
+import honeybee_energy.lib.constructionsets as constr_set_lib
+
+# space types of the DOE reference buildings that are excluded from the building mix
+EXCLUDED_SPACE_TYPES = (
+    'Outpatient Hall_infil',
+    'LargeHotel Corridor2',
+    'LargeHotel Retail2'
+)
+
+
+def clean_space_type(space_type):
+    """Remove the variations from a space type of the DOE reference buildings.
+
+    For example, the SmallHotel space types distinguish between floors and the
+    apartment space types distinguish between the top floor and the orientation,
+    none of which have their own program type.
+
+    Args:
+        space_type: Text for a space type as it appears in the user_data of the
+            rooms of the DOE reference building models (eg. 'SmallHotel - Corridor4').
+    """
+    if space_type.startswith('SmallHotel'):
+        space_type = space_type.replace('123', '').replace('4', '')
+        space_type = space_type.replace('Front', '').replace('Rear', '')
+    elif space_type.startswith('StripMall'):
+        space_type = space_type.replace('Strip mall', '').replace('type', 'Type')
+    elif space_type.startswith('MidriseApartment') or \
+            space_type.startswith('HighriseApartment'):
+        space_type = space_type.replace('_topfloor', '').replace('_NS', '')
+        space_type = space_type.replace('_WE', '')
+    return space_type
+
+
+def space_type_program(space_type, building_type, vintage='2019'):
+    """Get the identifier of the program type for a space type of a reference building.
+
+    Args:
+        space_type: Text for a space type as it appears in the user_data of the
+            rooms of the DOE reference building models (eg. 'LargeOffice - OpenOffice').
+        building_type: Text for the building type of the program type
+            (eg. 'LargeOffice').
+        vintage: Text for the vintage of the program type. (Default: '2019').
+
+    Returns:
+        Text for the identifier of the program type (eg. '2019::LargeOffice::OpenOffice').
+        None if the space type is excluded from the program types.
+    """
+    space_type = clean_space_type(space_type)
+    if space_type in EXCLUDED_SPACE_TYPES:
+        return None
+    space_type = space_type.replace(building_type, '', 1).replace('-', '').strip()
+    return '{}::{}::{}'.format(vintage, building_type, space_type)
+
+
+def _resolve(identifiers, lib_function):
+    """Load each unique identifier once and get a dictionary of locked objects."""
+    objects, missing = {}, []
+    for obj_id in set(identifiers):
+        try:
+            obj = lib_function(obj_id)
+        except ValueError:
+            missing.append(obj_id)
+            continue
+        obj.lock()
+        objects[obj_id] = obj
+    return objects, missing
+
+
+def assign_standards(model, program_types=None, construction_sets=None,
+                     building_type=None, vintage='2019'):
+    """Assign standards program types and construction sets to the rooms of a Model.
+
+    All identifiers are resolved before any room is edited and, if any of them
+    are not found in the library, a ValueError listing all of them is raised
+    without changing the model.
+
+    Args:
+        model: A honeybee Model to which the standards will be assigned.
+        program_types: A dictionary with room identifiers as keys and program type
+            identifiers as values. If None, the program types will be derived from
+            the 'space_type' in the user_data of each room along with the
+            building_type and vintage, in the same way as the building_mix.json.
+            Rooms that are not in the dictionary or have no space_type will keep
+            their current program type. (Default: None).
+        construction_sets: Either a single construction set identifier to be
+            assigned to all rooms or a dictionary with room identifiers as keys
+            and construction set identifiers as values. If None, the construction
+            sets of the rooms will not be changed. (Default: None).
+        building_type: Text for the building type of the program types to be
+            derived from the space_type of the rooms (eg. 'LargeOffice'). Required
+            if program_types is None. (Default: None).
+        vintage: Text for the vintage of the program types to be derived from
+            the space_type of the rooms. (Default: '2019').
+
+    Returns:
+        A dictionary of statistics about the assignment with the following keys.
+
+        -   rooms -- The number of rooms in the model.
+
+        -   program_types -- The number of unique program type instances assigned.
+
+        -   construction_sets -- The number of unique construction set
+            instances assigned.
+
+        -   unassigned -- A list of the identifiers of rooms that were not
+            assigned a program type.
+
+        -   resolve_time -- Seconds taken to load the objects from the library.
+
+        -   assign_time -- Seconds taken to assign the objects to the rooms.
+    """
+    start = time.time()
+    rooms = model.rooms
+
+    # determine the program type and construction set of each room
+    if program_types is None:
+        assert building_type is not None, 'A building_type is required to derive ' \
+            'program types from the space_type of the rooms.'
+        program_types = {}
+        for room in rooms:
+            if room.user_data is not None and 'space_type' in room.user_data:
+                p_id = space_type_program(
+                    room.user_data['space_type'], building_type, vintage)
+                if p_id is not None:
+                    program_types[room.identifier] = p_id
+    if construction_sets is None:
+        construction_sets = {}
+    elif not isinstance(construction_sets, dict):
+        construction_sets = {room.identifier: construction_sets for room in rooms}
+
+    # load each unique object from the library once
+    p_types, p_missing = _resolve(
+        program_types.values(), program_lib.program_type_by_identifier)
+    c_sets, c_missing = _resolve(
+        construction_sets.values(), constr_set_lib.construction_set_by_identifier)
+    if p_missing or c_missing:
+        msg = ['"{}" was not found in the program type library.'.format(p_id)
+               for p_id in sorted(p_missing)]
+        msg.extend('"{}" was not found in the construction set library.'.format(c_id)
+                   for c_id in sorted(c_missing))
+        raise ValueError('{} standards objects were not found:\n{}'.format(
+            len(msg), '\n'.join(msg)))
+    resolve_time = time.time() - start
+
+    # assign the objects to the rooms
+    start = time.time()
+    unassigned = []
+    for room in rooms:
+        try:
+            room.properties.energy.program_type = p_types[program_types[room.identifier]]
+        except KeyError:
+            unassigned.append(room.identifier)
+        try:
+            room.properties.energy.construction_set = \
+                c_sets[construction_sets[room.identifier]]
+        except KeyError:
+            pass
+    return {
+        'rooms': len(rooms),
+        'program_types': len(p_types),
+        'construction_sets': len(c_sets),
+        'unassigned': unassigned,
+        'resolve_time': resolve_time,
+        'assign_time': time.time() - start
+    }
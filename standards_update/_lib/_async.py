@@ -0,0 +1,159 @@
+# coding=utf-8
+"""Asynchronous versions of the functions to get objects from the library by identifier.
+
+The functions of the honeybee_energy.lib are run in an executor such that reading
+and parsing the standards data does not block the event loop. Concurrent requests
+for the same object are coalesced such that it is only loaded once. Note that
+the functions of the honeybee_energy.lib are looked up each time they are called
+such that these functions also work after standards_update._change_to_standards_data
+has been imported.
+"""
+import asyncio
+
+import honeybee_energy.lib.materials as mat_lib
+import honeybee_energy.lib.constructions as constr_lib
+import honeybee_energy.lib.constructionsets as constr_set_lib
+import honeybee_energy.lib.schedules as sch_lib
+import honeybee_energy.lib.programtypes as program_lib
+
+_in_flight = {}  # dictionary of futures for the objects currently being loaded
+
+
+async def _object_by_identifier(lib_module, function_name, obj_cache, identifier,
+                                executor=None):
+    """Get an object from a honeybee_energy.lib module in an executor.
+
+    Args:
+        lib_module: The honeybee_energy.lib module containing the function.
+        function_name: Text for the name of the function that gets the object.
+        obj_cache: The dictionary in which the lib_module stores loaded objects.
+        identifier: Text for the identifier of the object.
+        executor: An optional concurrent.futures.Executor in which the object
+            will be loaded. If None, the default executor of the loop will be used.
+    """
+    try:  # see if the object has already been loaded to a Python object
+        return obj_cache[identifier]
+    except KeyError:
+        pass
+
+    loop = asyncio.get_running_loop()
+    key = (loop, function_name, identifier)
+    try:  # see if the object is already being loaded by another request
+        future = _in_flight[key]
+    except KeyError:
+        lib_function = getattr(lib_module, function_name)
+        future = loop.run_in_executor(executor, lib_function, identifier)
+        _in_flight[key] = future
+        future.add_done_callback(lambda f: _in_flight.pop(key, None))
+    # shield the future such that cancelling one request does not cancel the others
+    return await asyncio.shield(future)
+
+
+async def aopaque_material_by_identifier(material_identifier, executor=None):
+    """Get an opaque material from the library given the material identifier.
+
+    Args:
+        material_identifier: A text string for the identifier of the material.
+        executor: An optional concurrent.futures.Executor in which the material
+            will be loaded. If None, the default executor of the loop will be used.
+    """
+    return await _object_by_identifier(
+        mat_lib, 'opaque_material_by_identifier', mat_lib._opaque_materials,
+        material_identifier, executor)
+
+
+async def awindow_material_by_identifier(material_identifier, executor=None):
+    """Get a window material from the library given the material identifier.
+
+    Args:
+        material_identifier: A text string for the identifier of the material.
+        executor: An optional concurrent.futures.Executor in which the material
+            will be loaded. If None, the default executor of the loop will be used.
+    """
+    return await _object_by_identifier(
+        mat_lib, 'window_material_by_identifier', mat_lib._window_materials,
+        material_identifier, executor)
+
+
+async def aopaque_construction_by_identifier(construction_identifier, executor=None):
+    """Get an opaque construction from the library given the construction identifier.
+
+    Args:
+        construction_identifier: A text string for the identifier of the construction.
+        executor: An optional concurrent.futures.Executor in which the construction
+            will be loaded. If None, the default executor of the loop will be used.
+    """
+    return await _object_by_identifier(
+        constr_lib, 'opaque_construction_by_identifier',
+        constr_lib._opaque_constructions, construction_identifier, executor)
+
+
+async def awindow_construction_by_identifier(construction_identifier, executor=None):
+    """Get a window construction from the library given the construction identifier.
+
+    Args:
+        construction_identifier: A text string for the identifier of the construction.
+        executor: An optional concurrent.futures.Executor in which the construction
+            will be loaded. If None, the default executor of the loop will be used.
+    """
+    return await _object_by_identifier(
+        constr_lib, 'window_construction_by_identifier',
+        constr_lib._window_constructions, construction_identifier, executor)
+
+
+async def aconstruction_set_by_identifier(construction_set_identifier, executor=None):
+    """Get a construction_set from the library given its identifier.
+
+    Args:
+        construction_set_identifier: A text string for the identifier of
+            the ConstructionSet.
+        executor: An optional concurrent.futures.Executor in which the construction
+            set will be loaded. If None, the default executor of the loop will be used.
+    """
+    return await _object_by_identifier(
+        constr_set_lib, 'construction_set_by_identifier',
+        constr_set_lib._construction_sets, construction_set_identifier, executor)
+
+
+async def aschedule_by_identifier(schedule_identifier, executor=None):
+    """Get a schedule from the library given its identifier.
+
+    Args:
+        schedule_identifier: A text string for the identifier of the schedule.
+        executor: An optional concurrent.futures.Executor in which the schedule
+            will be loaded. If None, the default executor of the loop will be used.
+    """
+    return await _object_by_identifier(
+        sch_lib, 'schedule_by_identifier', sch_lib._schedules,
+        schedule_identifier, executor)
+
+
+async def aprogram_type_by_identifier(program_type_identifier, executor=None):
+    """Get a program_type from the library given its identifier.
+
+    Args:
+        program_type_identifier: A text string for the identifier of the ProgramType.
+        executor: An optional concurrent.futures.Executor in which the program type
+            will be loaded. If None, the default executor of the loop will be used.
+    """
+    return await _object_by_identifier(
+        program_lib, 'program_type_by_identifier', program_lib._program_types,
+        program_type_identifier, executor)
+
+
+async def agather(async_function, identifiers, executor=None):
+    """Get several objects from the library at once.
+
+    Args:
+        async_function: One of the asynchronous functions of this module to be
+            used to get each object (eg. aprogram_type_by_identifier).
+        identifiers: A list of text for the identifiers of the objects. Duplicate
+            identifiers will only be loaded once.
+        executor: An optional concurrent.futures.Executor in which the objects
+            will be loaded. If None, the default executor of the loop will be used.
+
+    Returns:
+        A list of the objects in the same order as the input identifiers.
+    """
+    return await asyncio.gather(
+        *(async_function(obj_id, executor) for obj_id in identifiers))
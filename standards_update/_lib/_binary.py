@@ -0,0 +1,231 @@
+# coding=utf-8
+"""Binary catalog of the standards data that can be read with a memory map.
+
+Opening a binary catalog only reads its header and each record is found through
+a hash table in the file, meaning that only the pages of the records that are
+actually used are read from disk. The file has the following layout, where all
+integers are unsigned and little-endian:
+
+    * header -- 8 byte magic text (b'HBESCAT1'), 4 byte format version,
+        4 byte number of hash table slots, 8 byte number of records.
+    * hash table -- One 24 byte slot for each hash table slot, containing an 8 byte
+        hash of the key, an 8 byte offset of the key from the start of the file,
+        a 4 byte length of the key and a 4 byte length of the record. Empty slots
+        have a key length of zero. Collisions are resolved by linear probing.
+    * records -- The key of each record (the object type and identifier separated
+        by a null character) followed by the compact JSON of the record.
+"""
+import os
+import json
+import mmap
+import struct
+import hashlib
+
+from standards_update._lib._catalog import load_catalog, closure
+
+MAGIC = b'HBESCAT1'
+VERSION = 1
+_HEADER = struct.Struct('<8sIIQ')
+_SLOT = struct.Struct('<QQII')
+
+
+def _key(obj_type, identifier):
+    """Get the bytes of the key used to store a record."""
+    return '{}\x00{}'.format(obj_type, identifier).encode('utf-8')
+
+
+def _hash(key):
+    """Get a 64 bit hash of a key that is the same across all processes."""
+    return struct.unpack('<Q', hashlib.blake2b(key, digest_size=8).digest())[0]
+
+
+def write_binary_catalog(dest_file, data_dir=None):
+    """Write a binary catalog of all objects in a standards library.
+
+    Args:
+        dest_file: Path to the binary catalog file to be written.
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the installed
+            honeybee_energy_standards data will be used.
+
+    Returns:
+        The path to the binary catalog file.
+    """
+    entries = []
+    for obj_type, obj_dicts in load_catalog(data_dir).items():
+        for obj_id, obj_dict in obj_dicts.items():
+            record = json.dumps(obj_dict, separators=(',', ':')).encode('utf-8')
+            entries.append((_key(obj_type, obj_id), record))
+
+    # build the hash table with twice as many slots as records
+    slot_count = 1
+    while slot_count < len(entries) * 2:
+        slot_count *= 2
+    slots = [None] * slot_count
+    offset = _HEADER.size + _SLOT.size * slot_count
+    for key, record in entries:
+        key_hash = _hash(key)
+        i = key_hash % slot_count
+        while slots[i] is not None:
+            i = (i + 1) % slot_count
+        slots[i] = (key_hash, offset, len(key), len(record))
+        offset += len(key) + len(record)
+
+    with open(dest_file, 'wb') as fp:
+        fp.write(_HEADER.pack(MAGIC, VERSION, slot_count, len(entries)))
+        empty_slot = _SLOT.pack(0, 0, 0, 0)
+        fp.write(b''.join(_SLOT.pack(*s) if s is not None else empty_slot
+                          for s in slots))
+        for key, record in entries:
+            fp.write(key)
+            fp.write(record)
+    return dest_file
+
+
+class _BinaryRecords(object):
+    """Read-only mapping of the records of one object type in a BinaryCatalog."""
+    __slots__ = ('_catalog', '_obj_type')
+
+    def __init__(self, catalog, obj_type):
+        self._catalog = catalog
+        self._obj_type = obj_type
+
+    def __getitem__(self, identifier):
+        record = self._catalog._find(_key(self._obj_type, identifier))
+        if record is None:
+            raise KeyError(identifier)
+        return json.loads(record.decode('utf-8'))
+
+    def __contains__(self, identifier):
+        return self._catalog._find(_key(self._obj_type, identifier)) is not None
+
+    def __iter__(self):
+        return iter(self._catalog.identifiers(self._obj_type))
+
+
+class BinaryCatalog(object):
+    """Reader of a binary catalog file that uses a memory map.
+
+    Args:
+        file_path: Path to a binary catalog file written with write_binary_catalog.
+
+    Properties:
+        * file_path
+        * record_count
+    """
+    __slots__ = ('_file_path', '_file', '_map', '_slot_count', '_record_count')
+
+    def __init__(self, file_path):
+        self._file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # the file is empty
+            self._file.close()
+            raise ValueError('"{}" is not a binary catalog.'.format(file_path))
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError('"{}" is not a binary catalog.'.format(file_path))
+        magic, version, self._slot_count, self._record_count = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError('"{}" is not a binary catalog of version {}.'.format(
+                file_path, VERSION))
+
+    @property
+    def file_path(self):
+        """Get the path to the binary catalog file."""
+        return self._file_path
+
+    @property
+    def record_count(self):
+        """Get an integer for the number of records in the catalog."""
+        return self._record_count
+
+    def record(self, obj_type, identifier):
+        """Get the abridged dictionary of an object in the catalog.
+
+        Args:
+            obj_type: Text for the type of object (eg. 'program_type').
+            identifier: Text for the identifier of the object.
+        """
+        try:
+            return self[obj_type][identifier]
+        except KeyError:
+            raise ValueError('"{}" was not found in the {} library.'.format(
+                identifier, obj_type.replace('_', ' ')))
+
+    def identifiers(self, obj_type):
+        """Get a list of the identifiers of all objects of a given type.
+
+        Note that this reads the whole hash table and so it is much slower than
+        getting individual records. Identifiers are in the order of the source data.
+
+        Args:
+            obj_type: Text for the type of object (eg. 'program_type').
+        """
+        prefix = '{}\x00'.format(obj_type).encode('utf-8')
+        obj_ids = []
+        for i in range(self._slot_count):
+            _, key_offset, key_len, _ = \
+                _SLOT.unpack_from(self._map, _HEADER.size + i * _SLOT.size)
+            if key_len != 0:
+                key = self._map[key_offset:key_offset + key_len]
+                if key.startswith(prefix):
+                    obj_ids.append((key_offset, key[len(prefix):].decode('utf-8')))
+        return [obj_id for _, obj_id in sorted(obj_ids)]  # order the records were written
+
+    def closure(self, obj_type, identifiers):
+        """Get a group of objects along with all of the objects that they reference.
+
+        Args:
+            obj_type: Text for the type of objects requested (eg. 'program_type').
+            identifiers: A list of identifiers for the objects requested.
+
+        Returns:
+            A tuple with a dictionary of the objects organized by type and a list
+            of the requested identifiers that were not found. See the closure
+            function of standards_update._lib._catalog for more information.
+        """
+        return closure(self, obj_type, identifiers)
+
+    def close(self):
+        """Close the memory map and the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _find(self, key):
+        """Get the bytes of the record for a key. None if the key is not found."""
+        key_hash = _hash(key)
+        table_start = _HEADER.size
+        i = key_hash % self._slot_count
+        while True:
+            slot_hash, key_offset, key_len, record_len = \
+                _SLOT.unpack_from(self._map, table_start + i * _SLOT.size)
+            if key_len == 0:  # empty slot; the key is not in the catalog
+                return None
+            if slot_hash == key_hash and \
+                    self._map[key_offset:key_offset + key_len] == key:
+                start = key_offset + key_len
+                return self._map[start:start + record_len]
+            i = (i + 1) % self._slot_count
+
+    def __getitem__(self, obj_type):
+        return _BinaryRecords(self, obj_type)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'BinaryCatalog: {} [{} records]'.format(
+            os.path.basename(self._file_path), self._record_count)
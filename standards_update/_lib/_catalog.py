@@ -0,0 +1,130 @@
+# coding=utf-8
+"""Load the abridged records of a standards library and get the closure of objects.
+
+This module only works with the abridged dictionaries of the JSON data and does
+not import honeybee_energy, which parses the whole standards library when it is
+imported. It can therefore be used by the server, shared memory and binary
+catalogs without costing the processes that read them the time and memory
+of loading the honeybee_energy.lib.
+"""
+import os
+
+import honeybee_energy_standards
+
+from standards_update._lib._loadjson import load_json, load_folder
+
+# the types of objects in the catalog along with the files in which they are found
+OBJECT_TYPES = {
+    'opaque_material': ('constructions', 'opaque_material.json'),
+    'window_material': ('constructions', 'window_material.json'),
+    'opaque_construction': ('constructions', 'opaque_construction.json'),
+    'window_construction': ('constructions', 'window_construction.json'),
+    'construction_set': ('constructionsets', None),
+    'schedule': ('schedules', 'schedule.json'),
+    'program_type': ('programtypes', None)
+}
+
+
+def load_catalog(data_dir=None):
+    """Load all of the objects of a standards library into a dictionary.
+
+    Args:
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the installed
+            honeybee_energy_standards data will be used.
+
+    Returns:
+        A dictionary with the OBJECT_TYPES as keys and dictionaries of the
+        abridged object dictionaries with identifiers as keys as values.
+    """
+    if data_dir is None:
+        data_dir = os.path.dirname(honeybee_energy_standards.__file__)
+    catalog = {}
+    for obj_type, (folder, file_name) in OBJECT_TYPES.items():
+        obj_dir = os.path.join(data_dir, folder)
+        if file_name is not None:
+            try:
+                catalog[obj_type] = load_json(os.path.join(obj_dir, file_name))
+            except FileNotFoundError:
+                catalog[obj_type] = {}
+        else:
+            catalog[obj_type] = {}
+            for obj_dicts in load_folder(obj_dir).values():
+                catalog[obj_type].update(obj_dicts)
+    return catalog
+
+
+def _references(obj_dict, key_check):
+    """Get the identifiers referenced by an abridged dictionary under matching keys."""
+    refs = []
+    for key, val in obj_dict.items():
+        if isinstance(val, dict):
+            refs.extend(_references(val, key_check))
+        elif key_check(key):
+            if isinstance(val, str):
+                refs.append(val)
+            elif isinstance(val, list):
+                refs.extend(v for v in val if isinstance(v, str))
+    return refs
+
+
+def closure(catalog, obj_type, identifiers):
+    """Get a group of objects along with all of the objects that they reference.
+
+    Args:
+        catalog: A dictionary of objects produced by the load_catalog function
+            or any object that returns the dictionary of an object type with
+            the [] operator (eg. a SharedCatalog or BinaryCatalog).
+        obj_type: Text for the type of objects requested. Must be one of the
+            OBJECT_TYPES.
+        identifiers: A list of identifiers for the objects requested.
+
+    Returns:
+        A tuple with two elements.
+
+        -   objects -- A dictionary with the OBJECT_TYPES as keys and dictionaries
+            of the abridged object dictionaries with identifiers as keys as values.
+            This includes the requested objects and everything they reference.
+
+        -   missing -- A list of the requested identifiers that were not found.
+    """
+    objects = {o_type: {} for o_type in OBJECT_TYPES}
+    missing = []
+
+    def add_objects(o_types, obj_ids, required):
+        added = []
+        for obj_id in obj_ids:
+            for o_type in o_types:
+                try:
+                    objects[o_type][obj_id] = catalog[o_type][obj_id]
+                    added.append(objects[o_type][obj_id])
+                    break
+                except KeyError:
+                    pass
+            else:
+                if required:
+                    missing.append(obj_id)
+        return added
+
+    if obj_type not in OBJECT_TYPES:
+        raise ValueError('Object type "{}" is not recognized. Choose from:\n{}'.format(
+            obj_type, tuple(OBJECT_TYPES.keys())))
+    requested = add_objects((obj_type,), identifiers, True)
+    if obj_type == 'program_type':
+        for p_dict in requested:
+            sch_ids = _references(
+                p_dict, lambda key: key == 'schedule' or key.endswith('_schedule'))
+            add_objects(('schedule',), sch_ids, False)
+    elif obj_type in ('construction_set', 'opaque_construction', 'window_construction'):
+        constrs = requested
+        if obj_type == 'construction_set':
+            constr_ids = []
+            for c_dict in requested:
+                constr_ids.extend(
+                    _references(c_dict, lambda key: key.endswith('_construction')))
+            constrs = add_objects(
+                ('opaque_construction', 'window_construction'), constr_ids, False)
+        for c_dict in constrs:
+            add_objects(('opaque_material', 'window_material'),
+                        c_dict.get('materials', []), False)
+    return objects, missing
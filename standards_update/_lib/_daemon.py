@@ -0,0 +1,357 @@
+# coding=utf-8
+"""Local server that holds the standards library in memory and serves it over a socket.
+
+One server can be started per machine to load the standards data once and serve
+the abridged records to any number of simulation workers, which would otherwise
+each parse the data and build their own caches. The server is started with:
+
+    python -m standards_update._lib._daemon /tmp/honeybee_standards.sock
+
+Each worker can then make the honeybee_energy.lib load objects from the server with:
+
+    from standards_update._lib._daemon import StandardsClient
+    StandardsClient('/tmp/honeybee_standards.sock').install()
+
+Requests and responses are single lines of JSON. The server only works with the
+abridged dictionaries of the data and the client only imports honeybee_energy
+when it is installed or builds its first object. When the client is installed
+before honeybee_energy is imported, honeybee_energy is made to skip its standards
+extension folders, such that the workers never pay the cost of honeybee_energy
+parsing the standards library and the data is only loaded once by the server.
+Note that Unix domain sockets are not available on all platforms (eg. older
+versions of Windows).
+"""
+import os
+import sys
+import json
+import socket
+import threading
+import socketserver
+import importlib.abc
+import importlib.machinery
+
+from standards_update._lib._catalog import load_catalog, closure
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handler for the requests made to the StandardsServer."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line.decode('utf-8'))
+                command = request.get('command')
+                if command == 'ping':
+                    response = {'status': 'ok'}
+                elif command in ('records', 'closure'):
+                    obj_type, obj_ids = request['type'], request['identifiers']
+                    objects, missing = closure(self.server.catalog, obj_type, obj_ids)
+                    if command == 'records':
+                        objects = {obj_type: objects[obj_type]}
+                    response = {'objects': objects, 'missing': missing}
+                else:
+                    response = {'error': 'Command "{}" is not recognized.'.format(command)}
+            except Exception as e:
+                response = {'error': str(e)}
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class _SkipExtensionsLoader(importlib.abc.Loader):
+    """Loader of honeybee_energy.config that empties its standards extension folders."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+        # the setter of standards_extension_folders searches the default locations
+        # when given an empty list so the attribute behind it is set directly
+        module.folders._standards_extension_folders = []
+
+
+class _SkipExtensionsFinder(importlib.abc.MetaPathFinder):
+    """Import hook that makes honeybee_energy skip its standards extension folders.
+
+    The hook removes itself from sys.meta_path once honeybee_energy.config is found.
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != 'honeybee_energy.config':
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is not None:
+            spec.loader = _SkipExtensionsLoader(spec.loader)
+        return spec
+
+
+class StandardsServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Server that holds a standards library in memory and serves it over a Unix socket.
+
+    Args:
+        socket_path: Path to the Unix socket file to be created for the server.
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the installed
+            honeybee_energy_standards data will be used.
+
+    Properties:
+        * socket_path
+        * catalog
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path, data_dir=None):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        self.catalog = load_catalog(data_dir)
+        self.socket_path = socket_path
+        socketserver.UnixStreamServer.__init__(self, socket_path, _RequestHandler)
+
+    def start(self):
+        """Start serving requests in a background thread and return the thread."""
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def stop(self):
+        """Stop serving requests and remove the socket file."""
+        self.shutdown()
+        self.server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'StandardsServer: {}'.format(self.socket_path)
+
+
+class StandardsClient(object):
+    """Client to get objects from a StandardsServer running on the same machine.
+
+    All objects loaded through the client are locked and stored in the
+    honeybee_energy.lib such that each one is only requested once.
+
+    Args:
+        socket_path: Path to the Unix socket file of a running StandardsServer.
+
+    Properties:
+        * socket_path
+    """
+
+    def __init__(self, socket_path):
+        self.socket_path = socket_path
+        self._socket = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def request(self, command, obj_type=None, identifiers=None):
+        """Send a request to the server and get its response.
+
+        Args:
+            command: Text for the command. Choose from 'ping', 'records', 'closure'.
+            obj_type: Text for the type of objects requested. Must be one of
+                the OBJECT_TYPES.
+            identifiers: A list of identifiers for the objects requested.
+
+        Returns:
+            A dictionary of the response. For 'records' and 'closure', this has
+            an 'objects' key with the abridged dictionaries of the objects
+            organized by type and a 'missing' key with a list of the requested
+            identifiers that were not found.
+        """
+        request = {'command': command}
+        if obj_type is not None:
+            request['type'] = obj_type
+            request['identifiers'] = list(identifiers)
+        with self._lock:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.connect(self.socket_path)
+                self._file = self._socket.makefile('rb')
+            self._socket.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            response = json.loads(self._file.readline().decode('utf-8'))
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response
+
+    def opaque_material_by_identifier(self, material_identifier):
+        """Get an opaque material from the server given its identifier."""
+        return self._object_by_identifier('opaque_material', material_identifier)
+
+    def window_material_by_identifier(self, material_identifier):
+        """Get a window material from the server given its identifier."""
+        return self._object_by_identifier('window_material', material_identifier)
+
+    def opaque_construction_by_identifier(self, construction_identifier):
+        """Get an opaque construction from the server given its identifier."""
+        return self._object_by_identifier('opaque_construction', construction_identifier)
+
+    def window_construction_by_identifier(self, construction_identifier):
+        """Get a window construction from the server given its identifier."""
+        return self._object_by_identifier('window_construction', construction_identifier)
+
+    def construction_set_by_identifier(self, construction_set_identifier):
+        """Get a construction set from the server given its identifier."""
+        return self._object_by_identifier('construction_set', construction_set_identifier)
+
+    def schedule_by_identifier(self, schedule_identifier):
+        """Get a schedule from the server given its identifier."""
+        return self._object_by_identifier('schedule', schedule_identifier)
+
+    def program_type_by_identifier(self, program_type_identifier):
+        """Get a program type from the server given its identifier."""
+        return self._object_by_identifier('program_type', program_type_identifier)
+
+    def install(self):
+        """Make the honeybee_energy.lib get all standards objects from the server.
+
+        If honeybee_energy has not yet been imported, it is made to skip the
+        standards extension folders that it finds on the machine (eg. the
+        honeybee_energy_standards package) such that it does not parse the
+        standards library that is served. In this case, the identifiers of the
+        served objects are not in the tuples of the honeybee_energy.lib (eg.
+        PROGRAM_TYPES) but they can all be loaded with the *_by_identifier
+        functions. If honeybee_energy has already been imported, it will have
+        already parsed its standards library and this only replaces the functions.
+        """
+        if 'honeybee_energy' not in sys.modules:
+            sys.meta_path.insert(0, _SkipExtensionsFinder())
+        import honeybee_energy.lib.materials as mat_lib
+        import honeybee_energy.lib.constructions as constr_lib
+        import honeybee_energy.lib.constructionsets as constr_set_lib
+        import honeybee_energy.lib.schedules as sch_lib
+        import honeybee_energy.lib.programtypes as program_lib
+
+        mat_lib.opaque_material_by_identifier = self.opaque_material_by_identifier
+        mat_lib.window_material_by_identifier = self.window_material_by_identifier
+        constr_lib.opaque_construction_by_identifier = \
+            self.opaque_construction_by_identifier
+        constr_lib.window_construction_by_identifier = \
+            self.window_construction_by_identifier
+        constr_set_lib.construction_set_by_identifier = \
+            self.construction_set_by_identifier
+        sch_lib.schedule_by_identifier = self.schedule_by_identifier
+        program_lib.program_type_by_identifier = self.program_type_by_identifier
+
+    def close(self):
+        """Close the connection to the server."""
+        with self._lock:
+            if self._socket is not None:
+                self._file.close()
+                self._socket.close()
+                self._socket, self._file = None, None
+
+    def _object_by_identifier(self, obj_type, identifier):
+        """Get an object of a given type from the lib or the server."""
+        from honeybee_energy.material.dictutil import dict_to_material
+        from honeybee_energy.construction.opaque import OpaqueConstruction
+        from honeybee_energy.construction.window import WindowConstruction
+        from honeybee_energy.constructionset import ConstructionSet
+        from honeybee_energy.programtype import ProgramType
+
+        cache = self._cache(obj_type)
+        try:  # see if the object has already been loaded to a Python object
+            return cache[identifier]
+        except KeyError:  # object needs to be requested from the server
+            response = self.request('closure', obj_type, [identifier])
+        if response['missing']:
+            raise ValueError('"{}" was not found in the {} library.'.format(
+                identifier, obj_type.replace('_', ' ')))
+
+        # create the Python objects from the dictionaries, starting with the leaves
+        objects = response['objects']
+        materials, constrs, schedules = {}, {}, {}
+        for o_type in ('opaque_material', 'window_material'):
+            for obj_id, obj_dict in objects[o_type].items():
+                materials[obj_id] = self._lock_and_cache(
+                    o_type, obj_id, dict_to_material, obj_dict)
+        constr_classes = (('opaque_construction', OpaqueConstruction),
+                          ('window_construction', WindowConstruction))
+        for o_type, constr_class in constr_classes:
+            for obj_id, obj_dict in objects[o_type].items():
+                constrs[obj_id] = self._lock_and_cache(
+                    o_type, obj_id,
+                    lambda d: constr_class.from_dict_abridged(d, materials), obj_dict)
+        for obj_id, obj_dict in objects['schedule'].items():
+            schedules[obj_id] = self._lock_and_cache(
+                'schedule', obj_id, self._schedule_from_dict, obj_dict)
+        for obj_id, obj_dict in objects['construction_set'].items():
+            self._lock_and_cache(
+                'construction_set', obj_id,
+                lambda d: ConstructionSet.from_dict_abridged(d, constrs), obj_dict)
+        for obj_id, obj_dict in objects['program_type'].items():
+            self._lock_and_cache(
+                'program_type', obj_id,
+                lambda d: ProgramType.from_dict_abridged(d, schedules), obj_dict)
+        return cache[identifier]
+
+    def _lock_and_cache(self, obj_type, identifier, from_dict, obj_dict):
+        """Get an object from the lib or create, lock and cache it from a dictionary."""
+        cache = self._cache(obj_type)
+        try:
+            return cache[identifier]
+        except KeyError:
+            obj = from_dict(obj_dict)
+            obj.lock()
+            cache[identifier] = obj  # load faster next time
+            return obj
+
+    @staticmethod
+    def _schedule_from_dict(sch_dict):
+        """Create a schedule object from an abridged dictionary."""
+        from honeybee_energy.schedule.dictutil import dict_abridged_to_schedule
+        import honeybee_energy.lib.scheduletypelimits as stl_lib
+
+        try:
+            type_limit = stl_lib.schedule_type_limit_by_identifier(
+                sch_dict['schedule_type_limit'])
+        except KeyError:
+            type_limit = stl_lib.fractional
+        return dict_abridged_to_schedule(sch_dict, {type_limit.identifier: type_limit})
+
+    @staticmethod
+    def _cache(obj_type):
+        """Get the dictionary of the honeybee_energy.lib used to store an object type."""
+        import honeybee_energy.lib.materials as mat_lib
+        import honeybee_energy.lib.constructions as constr_lib
+        import honeybee_energy.lib.constructionsets as constr_set_lib
+        import honeybee_energy.lib.schedules as sch_lib
+        import honeybee_energy.lib.programtypes as program_lib
+
+        return {
+            'opaque_material': mat_lib._opaque_materials,
+            'window_material': mat_lib._window_materials,
+            'opaque_construction': constr_lib._opaque_constructions,
+            'window_construction': constr_lib._window_constructions,
+            'construction_set': constr_set_lib._construction_sets,
+            'schedule': sch_lib._schedules,
+            'program_type': program_lib._program_types
+        }[obj_type]
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'StandardsClient: {}'.format(self.socket_path)
+
+
+if __name__ == '__main__':
+    server = StandardsServer(
+        sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print('Serving the standards library at {}'.format(server.socket_path))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(server.socket_path)
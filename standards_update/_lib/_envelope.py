@@ -0,0 +1,265 @@
+# coding=utf-8
+"""Resistance of all opaque constructions computed at once from arrays of material data.
+
+The resistance of each material is stored once in an array and the layers of all
+constructions are stored in a single index array, with an array of offsets noting
+where the layers of each construction start. The R-values of all constructions
+are then summed without creating any honeybee objects, which is much faster than
+building each OpaqueConstruction. When NumPy is installed, the sums are computed
+with one vectorized gather and segmented sum over the arrays. Otherwise, they are
+summed in a single Python pass over the same arrays, which gives identical results.
+
+The same material_resistance function is used by the construction set cleaner,
+which works with the IP standards gem dictionaries, such that both compute the
+resistance of materials in the same way. It also uses the insulation_r_value
+function to pick the Typical Insulation of the '{construction}-R{n}' constructions
+that the construction loader synthesizes on demand.
+"""
+from __future__ import division
+
+import os
+import re
+import math
+from array import array
+
+try:  # NumPy is an optional dependency that vectorizes the sums of the layers
+    import numpy
+except ImportError:
+    numpy = None
+
+import honeybee_energy_standards
+
+from standards_update._lib._loadjson import load_json
+
+# identifier of the insulation layer that is adjusted to meet R-value criteria
+INSULATION_ID = 'Typical Insulation'
+# pattern of the identifiers of insulation-adjusted constructions and materials
+_R_VARIANT = re.compile(r'^(.+)-R(\d+)$')
+
+
+def material_resistance(material_dict):
+    """Get the thermal resistance of an opaque material dictionary.
+
+    Standard materials with mass get their resistance from their thickness divided
+    by their conductivity while no mass materials and air gaps have a resistance
+    property. The result is in the units of the input dictionary.
+
+    Args:
+        material_dict: Either an EnergyMaterial, EnergyMaterialNoMass or
+            EnergyMaterialVegetation dictionary in SI units or a material
+            dictionary from the standards gem in IP units.
+    """
+    for r_key in ('r_value', 'resistance'):  # honeybee and standards gem no mass keys
+        try:
+            return material_dict[r_key]
+        except KeyError:
+            pass
+    try:
+        return material_dict['thickness'] / material_dict['conductivity']
+    except KeyError:
+        raise ValueError('Material "{}" has neither a resistance nor a thickness '
+                         'and conductivity.'.format(_identifier(material_dict)))
+
+
+def _thermal_absorptance(material_dict):
+    """Get the thermal absorptance of an opaque material dictionary.
+
+    Vegetation materials blend the emissivity of the leaves with the thermal
+    absorptance of the soil by the leaf area index in the same way as honeybee.
+    """
+    try:
+        leaf_area = material_dict['leaf_area_index']
+    except KeyError:
+        return material_dict.get('thermal_absorptance', 0.9)
+    leaf_emiss = material_dict.get('leaf_emissivity', 0.95)
+    if leaf_area >= 1:
+        return leaf_emiss
+    soil_absorp = material_dict.get('soil_thermal_absorptance', 0.9)
+    return (leaf_emiss * leaf_area) + (soil_absorp * (1 - leaf_area))
+
+
+def insulation_variant(identifier):
+    """Split the identifier of an insulation-adjusted construction or material.
+
+    Args:
+        identifier: Text for an identifier like 'Typical IEAD Roof-R32' or
+            'Typical Insulation-R7'.
+
+    Returns:
+        A tuple with the identifier of the base object and an integer for the
+        R-value in h-ft2-F/Btu. None if the identifier does not follow the
+        '{identifier}-R{n}' pattern.
+    """
+    match = _R_VARIANT.match(identifier)
+    if match is None:
+        return None
+    return match.group(1), int(match.group(2))
+
+
+def insulation_r_value(target_r, base_r):
+    """Get the whole-number R-value of the Typical Insulation that meets a target.
+
+    Args:
+        target_r: The R-value that the construction must meet in h-ft2-F/Btu.
+        base_r: The R-value of the base construction in h-ft2-F/Btu, including
+            its original Typical Insulation layer.
+    """
+    return int(math.ceil(target_r - base_r))
+
+
+def _identifier(obj_dict):
+    """Get the identifier of a honeybee or standards gem dictionary."""
+    return obj_dict['identifier'] if 'identifier' in obj_dict else obj_dict['name']
+
+
+class OpaqueResistances(object):
+    """Array store of opaque material resistances along with the layers of constructions.
+
+    Args:
+        material_dicts: A dictionary with material identifiers as keys and
+            opaque material dictionaries as values. These can either be
+            honeybee dictionaries in SI units or standards gem dictionaries in
+            IP units. Materials that are not used by any construction can be
+            included.
+        construction_dicts: A dictionary with construction identifiers as keys and
+            OpaqueConstructionAbridged dictionaries or standards gem construction
+            dictionaries as values. Both have a list of material identifiers
+            under a 'materials' key.
+
+    Properties:
+        * material_identifiers
+        * construction_identifiers
+        * resistances
+    """
+    __slots__ = ('_mat_ids', '_constr_ids', '_resistances', '_emissivities',
+                 '_offsets', '_layers', '_r_values')
+
+    def __init__(self, material_dicts, construction_dicts):
+        # store the resistance of each material in an array
+        self._mat_ids = tuple(material_dicts.keys())
+        self._resistances = array(
+            'd', (material_resistance(m_dict) for m_dict in material_dicts.values()))
+        self._emissivities = array(
+            'd', (_thermal_absorptance(m_dict) for m_dict in material_dicts.values()))
+
+        # store the material layers of each construction in one index array
+        mat_index = {mat_id: i for i, mat_id in enumerate(self._mat_ids)}
+        self._constr_ids = tuple(construction_dicts.keys())
+        self._offsets = array('l', [0])
+        self._layers = array('l')
+        missing = []
+        for constr_id, c_dict in construction_dicts.items():
+            if len(c_dict['materials']) == 0:
+                raise ValueError('Construction "{}" has no materials.'.format(constr_id))
+            for mat_id in c_dict['materials']:
+                try:
+                    self._layers.append(mat_index[mat_id])
+                except KeyError:
+                    missing.append('"{}" of construction "{}"'.format(mat_id, constr_id))
+            self._offsets.append(len(self._layers))
+        if missing:
+            raise ValueError('{} materials were not found:\n{}'.format(
+                len(missing), '\n'.join(missing)))
+        self._r_values = None
+
+    @classmethod
+    def from_data_folder(cls, data_dir=None):
+        """Create the store from the opaque constructions of a standards data folder.
+
+        Args:
+            data_dir: Path to a folder of Honeybee JSONs with the same structure as
+                honeybee_energy_standards. If None, the installed
+                honeybee_energy_standards data will be used.
+        """
+        if data_dir is None:
+            data_dir = os.path.dirname(honeybee_energy_standards.__file__)
+        constr_dir = os.path.join(data_dir, 'constructions')
+        return cls(load_json(os.path.join(constr_dir, 'opaque_material.json')),
+                   load_json(os.path.join(constr_dir, 'opaque_construction.json')))
+
+    @property
+    def material_identifiers(self):
+        """Get a tuple of the material identifiers aligned with the resistances."""
+        return self._mat_ids
+
+    @property
+    def construction_identifiers(self):
+        """Get a tuple of the construction identifiers in the store."""
+        return self._constr_ids
+
+    @property
+    def resistances(self):
+        """Get an array of the resistance of each material."""
+        return self._resistances
+
+    def r_values(self):
+        """Get a dictionary of the R-value of every construction without air films.
+
+        The R-values are computed for all constructions at once the first time
+        they are requested and are in the units of the material dictionaries.
+        """
+        return dict(self._computed_r_values())
+
+    def u_values(self):
+        """Get a dictionary of the U-value of every construction without air films.
+
+        Constructions with an R-value of zero have a U-value of infinity.
+        """
+        return {constr_id: 1 / r_val if r_val != 0 else float('inf')
+                for constr_id, r_val in self._computed_r_values().items()}
+
+    def u_factors(self):
+        """Get a dictionary of the U-factor of every construction including air films.
+
+        The air films use the same simple heat transfer coefficients of ISO 10292
+        as the u_factor of honeybee OpaqueConstruction objects, where the interior
+        film depends on the thermal absorptance of the innermost material. This
+        is only meaningful when the material dictionaries are in SI units.
+        """
+        r_vals = self._computed_r_values().values()
+        emiss, layers, offsets = self._emissivities, self._layers, self._offsets
+        if numpy is not None:
+            inner = numpy.asarray(layers)[numpy.asarray(offsets)[1:] - 1]
+            in_h = 3.6 + (4.4 * numpy.asarray(emiss)[inner] / 0.84)
+            u_facs = 1 / (numpy.fromiter(r_vals, float) + (1 / 23) + (1 / in_h))
+            return dict(zip(self._constr_ids, u_facs.tolist()))
+        u_facs = {}
+        for i, (constr_id, r_val) in enumerate(zip(self._constr_ids, r_vals)):
+            in_h = 3.6 + (4.4 * emiss[layers[offsets[i + 1] - 1]] / 0.84)
+            u_facs[constr_id] = 1 / (r_val + (1 / 23) + (1 / in_h))
+        return u_facs
+
+    def r_value(self, construction_identifier):
+        """Get the R-value of a single construction without air films.
+
+        Args:
+            construction_identifier: Text for the identifier of a construction.
+        """
+        try:
+            return self._computed_r_values()[construction_identifier]
+        except KeyError:
+            raise ValueError('"{}" was not found in the opaque constructions.'.format(
+                construction_identifier))
+
+    def _computed_r_values(self):
+        """Get the dictionary of R-values, computing them if they have not been."""
+        if self._r_values is None:
+            resist, layers, offsets = self._resistances, self._layers, self._offsets
+            if numpy is not None and len(layers) != 0:
+                layer_r = numpy.asarray(resist)[numpy.asarray(layers)]
+                r_vals = numpy.add.reduceat(layer_r, numpy.asarray(offsets)[:-1])
+                r_vals = r_vals.tolist()
+            else:
+                r_vals = [
+                    sum(resist[layers[j]] for j in range(offsets[i], offsets[i + 1]))
+                    for i in range(len(self._constr_ids))]
+            self._r_values = dict(zip(self._constr_ids, r_vals))
+        return self._r_values
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'OpaqueResistances: [{} materials] [{} constructions]'.format(
+            len(self._mat_ids), len(self._constr_ids))
@@ -0,0 +1,299 @@
+# coding=utf-8
+"""Disk cache of the IDF text of standards objects.
+
+The IDF strings that honeybee-energy generates for materials, constructions,
+schedules and program type loads are stored in one JSON file per object type
+inside a folder for the versions of honeybee-energy-standards and honeybee-energy
+that produced them. A new version of either package therefore starts a new cache
+while the cache of the old versions is left untouched.
+
+Loads are written for a placeholder zone and the zone identifier is spliced in
+when they are requested such that one cached fragment serves every zone. The
+ServiceHotWater load is not cached since its IDF depends on the floor area of
+the room to which it is assigned. The humidistat of a setpoint is cached under
+its own 'humidistat' key next to the 'setpoint' thermostat.
+
+Saving holds an exclusive lock on a .lock file in the cache folder while the
+files on disk are read, merged with the new objects and replaced such that
+concurrent simulation runs never lose each other's objects.
+"""
+import os
+import re
+import json
+import tempfile
+from contextlib import contextmanager
+
+try:  # POSIX file locks
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows file locks
+    fcntl = None
+    import msvcrt
+
+import honeybee_energy.lib.materials as mat_lib
+import honeybee_energy.lib.constructions as constr_lib
+import honeybee_energy.lib.schedules as sched_lib
+import honeybee_energy.lib.programtypes as program_lib
+
+from standards_update._lib._version import honeybee_energy_version, standards_version
+
+OBJECT_TYPES = ('material', 'construction', 'schedule', 'program_type')
+LOAD_TYPES = ('people', 'lighting', 'electric_equipment', 'gas_equipment',
+              'infiltration', 'ventilation', 'setpoint')
+_ZONE = '__HBES_ZONE__'
+_FIELD = re.compile(r'^ (.*)([,;])( +)(!- .*)$')
+
+
+def _splice_zone(template, zone_identifier):
+    """Replace the placeholder zone in the IDF text of a load.
+
+    The padding between each value and its comment is recomputed in the same way
+    as honeybee_energy.writer.generate_idf_string such that the result is the
+    same as writing the load for the zone directly.
+    """
+    lines = template.split('\n')
+    for i, line in enumerate(lines):
+        if _ZONE not in line:
+            continue
+        match = _FIELD.match(line)
+        if match is None:
+            lines[i] = line.replace(_ZONE, zone_identifier)
+            continue
+        value = match.group(1).replace(_ZONE, zone_identifier)
+        space_count = 25 - len(value)
+        spaces = space_count * ' ' if space_count > 0 else ' '
+        lines[i] = ' {}{}{}{}'.format(value, match.group(2), spaces, match.group(4))
+    return '\n'.join(lines)
+
+
+@contextmanager
+def _file_lock(lock_path):
+    """Hold an exclusive lock on a file, waiting for other processes to release it."""
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _material_idf(identifier):
+    """Get the IDF string of an opaque or window material."""
+    try:
+        return mat_lib.opaque_material_by_identifier(identifier).to_idf()
+    except ValueError:
+        return mat_lib.window_material_by_identifier(identifier).to_idf()
+
+
+def _construction_idf(identifier):
+    """Get the IDF string of an opaque or window construction."""
+    try:
+        return constr_lib.opaque_construction_by_identifier(identifier).to_idf()
+    except ValueError:
+        return constr_lib.window_construction_by_identifier(identifier).to_idf()
+
+
+def _schedule_idf(identifier):
+    """Get a list with the year, week and day IDF strings of a schedule."""
+    schedule = sched_lib.schedule_by_identifier(identifier)
+    year_schedule, week_schedules = schedule.to_idf()
+    if week_schedules is None:  # Schedule:Constant without any day schedules
+        return [year_schedule, [], []]
+    day_schedules = [day.to_idf(schedule.schedule_type_limit)
+                     for day in schedule.day_schedules]
+    return [year_schedule, week_schedules, day_schedules]
+
+
+def _program_type_idf(identifier):
+    """Get a dictionary of load IDF strings for the placeholder zone."""
+    program = program_lib.program_type_by_identifier(identifier)
+    loads = {}
+    for load_type in LOAD_TYPES:
+        load = getattr(program, load_type)
+        if load is not None:
+            loads[load_type] = load.to_idf(_ZONE)
+    if program.setpoint is not None:
+        humidistat = program.setpoint.to_idf_humidistat(_ZONE)
+        if humidistat is not None:
+            loads['humidistat'] = humidistat
+    return loads
+
+
+class IDFCache(object):
+    """Disk cache of the IDF text of standards objects.
+
+    Objects that are not in the cache are translated with honeybee-energy when
+    they are first requested and they are written to disk when the save method
+    is called. Saving locks the cache and merges the new objects with any that
+    other processes have saved in the meantime such that many simulation runs
+    can share one cache.
+
+    Note that, when the standards data is used from a clone of the repository,
+    its version is 'unknown' and the cache should be cleared after editing the data.
+
+    Args:
+        cache_dir: Path to the folder in which the cache is stored. If None,
+            a honeybee_energy_standards folder in the user's .cache folder
+            will be used. (Default: None).
+
+    Properties:
+        * cache_dir
+        * version_dir
+    """
+    __slots__ = ('_cache_dir', '_version_dir', '_data', '_unsaved')
+
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(
+                os.path.expanduser('~'), '.cache', 'honeybee_energy_standards')
+        self._cache_dir = cache_dir
+        self._version_dir = os.path.join(cache_dir, 'idf_{}_{}'.format(
+            standards_version(), honeybee_energy_version()))
+        self._data = {}
+        self._unsaved = {}
+
+    @property
+    def cache_dir(self):
+        """Get the path to the folder in which the cache is stored."""
+        return self._cache_dir
+
+    @property
+    def version_dir(self):
+        """Get the path to the folder of the cache for the current package versions."""
+        return self._version_dir
+
+    def material_idf(self, identifier):
+        """Get the IDF string of an opaque or window material.
+
+        Args:
+            identifier: Text for the identifier of the material.
+        """
+        return self._get('material', identifier, _material_idf)
+
+    def construction_idf(self, identifier):
+        """Get the IDF string of an opaque or window construction.
+
+        Args:
+            identifier: Text for the identifier of the construction.
+        """
+        return self._get('construction', identifier, _construction_idf)
+
+    def schedule_idf(self, identifier):
+        """Get the IDF strings of a schedule.
+
+        Args:
+            identifier: Text for the identifier of the schedule.
+
+        Returns:
+            A tuple with three elements
+
+            -   year_schedule: Text for the Schedule:Year or Schedule:Constant
+                of the schedule, which is the same as the first item returned
+                from the to_idf method of the ScheduleRuleset.
+
+            -   week_schedules: A list of Schedule:Week:Daily strings referenced
+                in the year_schedule. Empty for a Schedule:Constant.
+
+            -   day_schedules: A list of Schedule:Day:Interval strings referenced
+                in the week_schedules. Empty for a Schedule:Constant.
+        """
+        year_schedule, week_schedules, day_schedules = \
+            self._get('schedule', identifier, _schedule_idf)
+        return year_schedule, list(week_schedules), list(day_schedules)
+
+    def program_type_idf(self, identifier, zone_identifier):
+        """Get the IDF strings of the loads of a program type for a given zone.
+
+        Args:
+            identifier: Text for the identifier of the program type.
+            zone_identifier: Text for the identifier of the zone to which the
+                loads are assigned.
+
+        Returns:
+            A dictionary with the load attributes of the program type as keys
+            (eg. 'people', 'lighting') and the IDF strings of the loads for the
+            zone as values. The ZoneControl:Humidistat of the setpoint is under
+            a 'humidistat' key if the setpoint has humidity schedules. Loads that
+            the program type does not have and the service_hot_water are excluded.
+        """
+        loads = self._get('program_type', identifier, _program_type_idf)
+        return {load_type: _splice_zone(load_idf, zone_identifier)
+                for load_type, load_idf in loads.items()}
+
+    def save(self):
+        """Write all objects added since the cache was loaded to disk.
+
+        Returns:
+            An integer for the number of objects that were written.
+        """
+        count = 0
+        if all(len(new_objs) == 0 for new_objs in self._unsaved.values()):
+            return count
+        os.makedirs(self._version_dir, exist_ok=True)
+        with _file_lock(os.path.join(self._version_dir, '.lock')):
+            for obj_type, new_objs in self._unsaved.items():
+                if len(new_objs) == 0:
+                    continue
+                data = self._read(obj_type)  # objects saved by other processes
+                data.update(new_objs)
+                self._write(obj_type, data)
+                self._data[obj_type] = data
+                count += len(new_objs)
+        self._unsaved = {}
+        return count
+
+    def clear(self):
+        """Delete the cache of the current package versions from disk and memory."""
+        for obj_type in OBJECT_TYPES:
+            f_path = self._file_path(obj_type)
+            if os.path.isfile(f_path):
+                os.remove(f_path)
+        self._data = {}
+        self._unsaved = {}
+
+    def _get(self, obj_type, identifier, idf_function):
+        """Get an object from the cache or translate it if it is not cached."""
+        try:
+            data = self._data[obj_type]
+        except KeyError:
+            data = self._data[obj_type] = self._read(obj_type)
+        try:
+            return data[identifier]
+        except KeyError:
+            obj_idf = data[identifier] = idf_function(identifier)
+            self._unsaved.setdefault(obj_type, {})[identifier] = obj_idf
+            return obj_idf
+
+    def _file_path(self, obj_type):
+        """Get the path to the cache file of an object type."""
+        return os.path.join(self._version_dir, '{}.json'.format(obj_type))
+
+    def _read(self, obj_type):
+        """Read the cache file of an object type into a dictionary."""
+        try:
+            with open(self._file_path(obj_type), 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):  # missing or partially-written file
+            return {}
+
+    def _write(self, obj_type, data):
+        """Write the cache file of an object type such that readers never see it partially."""
+        handle, temp_path = tempfile.mkstemp(dir=self._version_dir, suffix='.tmp')
+        with os.fdopen(handle, 'w') as fp:
+            json.dump(data, fp, separators=(',', ':'))
+        os.replace(temp_path, self._file_path(obj_type))
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'IDFCache: {}'.format(self._version_dir)
@@ -0,0 +1,285 @@
+# coding=utf-8
+"""Counters and timings of the object_by_identifier functions of the standards library.
+
+Instrumentation is disabled by default, in which case the functions of the _lib
+modules are the original ones and there is no overhead of any kind. Calling
+enable() replaces each of them (along with any honeybee_energy.lib function that
+points to them) with a wrapper that records the following:
+
+    * hits -- Calls that returned an object that was already loaded to Python.
+    * misses -- Calls that built a new object from the standards data.
+    * errors -- Calls for objects that were not found in the library.
+    * build time -- Seconds taken to build each object, both including and
+        excluding the time taken to build the objects that it references
+        (eg. the materials of a construction or the schedules of a program type).
+
+The seconds taken to parse each standards data file are recorded by load_json
+when the _lib modules are imported, such that the time spent parsing files can
+be compared to the time spent in from_standards_dict. Calling disable() restores
+the original functions.
+
+Note that enable() replaces the functions by setting the attributes of the modules,
+meaning that only callers that look the functions up on their module at call time
+(eg. mat_lib.opaque_material_by_identifier(...)) are instrumented. Code that
+imported a function with "from ... import opaque_material_by_identifier" before
+enable() was called keeps a reference to the original function and its calls are
+not recorded.
+
+The counters and timings are guarded by a lock such that calls made from several
+threads (eg. by the loaders of the _async module) are all recorded.
+"""
+import os
+import json
+import time
+import heapq
+import threading
+import functools
+
+import honeybee_energy.lib.materials as hb_mat_lib
+import honeybee_energy.lib.constructions as hb_constr_lib
+import honeybee_energy.lib.constructionsets as hb_constr_set_lib
+import honeybee_energy.lib.schedules as hb_sched_lib
+import honeybee_energy.lib.programtypes as hb_program_lib
+
+import standards_update._lib.materials as mat_lib
+import standards_update._lib.constructions as constr_lib
+import standards_update._lib.constructionsets as constr_set_lib
+import standards_update._lib.schedules as sched_lib
+import standards_update._lib.programtypes as program_lib
+from standards_update._lib._loadjson import parse_times
+
+
+def _identifier_key(*args, **kwargs):
+    """Get the cache key of a function that accepts a single identifier."""
+    return args[0] if args else next(iter(kwargs.values()))
+
+
+def _climate_zone_key(vintage, climate_zone, construction_type='SteelFramed'):
+    """Get the cache key of construction_set_by_climate_zone."""
+    return (vintage, climate_zone, construction_type)
+
+
+# the instrumented functions with their object types, caches and cache key functions
+_FUNCTIONS = (
+    (mat_lib, hb_mat_lib, 'opaque_material_by_identifier', 'opaque_material',
+     hb_mat_lib._opaque_materials, _identifier_key),
+    (mat_lib, hb_mat_lib, 'window_material_by_identifier', 'window_material',
+     hb_mat_lib._window_materials, _identifier_key),
+    (constr_lib, hb_constr_lib, 'opaque_construction_by_identifier',
+     'opaque_construction', hb_constr_lib._opaque_constructions, _identifier_key),
+    (constr_lib, hb_constr_lib, 'window_construction_by_identifier',
+     'window_construction', hb_constr_lib._window_constructions, _identifier_key),
+    (constr_set_lib, hb_constr_set_lib, 'construction_set_by_identifier',
+     'construction_set', hb_constr_set_lib._construction_sets, _identifier_key),
+    (constr_set_lib, None, 'construction_set_by_climate_zone',
+     'construction_set_by_climate_zone', constr_set_lib._resolved_sets,
+     _climate_zone_key),
+    (sched_lib, hb_sched_lib, 'schedule_by_identifier', 'schedule',
+     hb_sched_lib._schedules, _identifier_key),
+    (program_lib, hb_program_lib, 'program_type_by_identifier', 'program_type',
+     hb_program_lib._program_types, _identifier_key)
+)
+
+_originals = {}  # original functions by name while instrumentation is enabled
+_counts = {}  # dictionary of hits, misses and errors for each object type
+_builds = []  # object type, identifier, inclusive and exclusive seconds of each build
+_events = []  # Chrome trace events of each build when tracing is enabled
+_state = {'trace': False}
+_local = threading.local()  # stack of the nested builds of each thread
+_lock = threading.Lock()  # lock used to record the calls made from any thread
+
+
+def _instrumented(function, obj_type, cache, key_function):
+    """Wrap an object_by_identifier function such that it records its calls."""
+    counts = _counts.setdefault(obj_type, {'hits': 0, 'misses': 0, 'errors': 0})
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        key = key_function(*args, **kwargs)
+        if key in cache:
+            with _lock:
+                counts['hits'] += 1
+            return function(*args, **kwargs)
+
+        # build the object and record the time taken to build it
+        try:
+            stack = _local.stack
+        except AttributeError:
+            stack = _local.stack = []
+        stack.append(0)  # seconds taken to build the objects referenced by this one
+        start = time.time()
+        try:
+            obj = function(*args, **kwargs)
+        except Exception:
+            stack.pop()
+            with _lock:
+                counts['errors'] += 1
+            raise
+        seconds = time.time() - start
+        own_seconds = seconds - stack.pop()
+        if stack:
+            stack[-1] += seconds
+        identifier = key if isinstance(key, str) else '::'.join(str(k) for k in key)
+        with _lock:
+            counts['misses'] += 1
+            _builds.append((obj_type, identifier, seconds, own_seconds))
+            if _state['trace']:
+                _events.append({
+                    'name': identifier, 'cat': obj_type, 'ph': 'X',
+                    'ts': start * 1e6, 'dur': seconds * 1e6,
+                    'pid': os.getpid(), 'tid': threading.current_thread().ident
+                })
+        return obj
+    return wrapper
+
+
+def enable(trace=False):
+    """Replace the object_by_identifier functions with ones that record their calls.
+
+    Only the attributes of the _lib and honeybee_energy.lib modules are replaced,
+    so functions that were imported by name before this is called are not
+    instrumented.
+
+    Args:
+        trace: Boolean to note whether a Chrome trace event should be recorded for
+            each build such that it can be written with write_trace. (Default: False).
+    """
+    _state['trace'] = trace
+    if _originals:
+        return  # instrumentation is already enabled
+    for lib_module, hb_lib_module, func_name, obj_type, cache, key_function in \
+            _FUNCTIONS:
+        function = getattr(lib_module, func_name)
+        _originals[func_name] = function
+        wrapper = _instrumented(function, obj_type, cache, key_function)
+        setattr(lib_module, func_name, wrapper)
+        if hb_lib_module is not None and \
+                getattr(hb_lib_module, func_name) is function:
+            setattr(hb_lib_module, func_name, wrapper)
+
+
+def disable():
+    """Restore the original object_by_identifier functions.
+
+    The recorded counters and timings are kept until reset is called.
+    """
+    for lib_module, hb_lib_module, func_name, _, _, _ in _FUNCTIONS:
+        try:
+            function = _originals.pop(func_name)
+        except KeyError:
+            continue  # instrumentation is not enabled
+        wrapper = getattr(lib_module, func_name)
+        setattr(lib_module, func_name, function)
+        if hb_lib_module is not None and getattr(hb_lib_module, func_name) is wrapper:
+            setattr(hb_lib_module, func_name, function)
+    _state['trace'] = False
+
+
+def is_enabled():
+    """Get a boolean for whether instrumentation is currently enabled."""
+    return len(_originals) != 0
+
+
+def reset():
+    """Clear all recorded counters, timings and trace events."""
+    with _lock:
+        for counts in _counts.values():
+            for key in counts:
+                counts[key] = 0
+        del _builds[:]
+        del _events[:]
+
+
+def report(top=10):
+    """Get a summary of the recorded counters and timings.
+
+    Args:
+        top: Integer for the number of slowest builds to include. (Default: 10).
+
+    Returns:
+        A dictionary with the following keys.
+
+        -   objects -- A dictionary with a key for each object type and values
+            that are dictionaries of the hits, misses, errors, build_time (the
+            seconds taken to build the objects including their references) and
+            own_time (the seconds excluding their references, which is the time
+            spent in from_standards_dict).
+
+        -   parse_time -- A dictionary with the paths of the parsed data files
+            as keys and the seconds taken to parse them as values.
+
+        -   total_parse_time -- The seconds taken to parse all data files.
+
+        -   total_build_time -- The seconds taken to build all objects, excluding
+            the time counted for their references.
+
+        -   slowest -- A list of the slowest builds as tuples of the object type,
+            identifier and seconds taken including the references.
+    """
+    with _lock:
+        counts_copy = {obj_type: dict(counts) for obj_type, counts in _counts.items()}
+        builds = list(_builds)
+    objects = {}
+    for obj_type, counts in counts_copy.items():
+        obj_report = objects[obj_type] = counts
+        obj_report['build_time'] = 0
+        obj_report['own_time'] = 0
+    for obj_type, _, seconds, own_seconds in builds:
+        objects[obj_type]['build_time'] += seconds
+        objects[obj_type]['own_time'] += own_seconds
+    parse_time = {f_path: seconds for f_path, (_, seconds) in parse_times.items()}
+    slowest = heapq.nlargest(top, builds, key=lambda build: build[2])
+    return {
+        'objects': objects,
+        'parse_time': parse_time,
+        'total_parse_time': sum(parse_time.values()),
+        'total_build_time': sum(build[3] for build in builds),
+        'slowest': [(obj_type, obj_id, seconds) for obj_type, obj_id, seconds, _
+                    in slowest]
+    }
+
+
+def print_report(top=10):
+    """Print a summary of the recorded counters and timings.
+
+    Args:
+        top: Integer for the number of slowest builds to print. (Default: 10).
+    """
+    summary = report(top)
+    print('Parsed {} files in {:.3f}s. Built objects in {:.3f}s.'.format(
+        len(summary['parse_time']), summary['total_parse_time'],
+        summary['total_build_time']))
+    for obj_type, obj_report in sorted(summary['objects'].items()):
+        print('  {}: {} hits, {} misses, {} errors, {:.3f}s building '
+              '({:.3f}s excluding references)'.format(
+                  obj_type, obj_report['hits'], obj_report['misses'],
+                  obj_report['errors'], obj_report['build_time'],
+                  obj_report['own_time']))
+    for obj_type, obj_id, seconds in summary['slowest']:
+        print('  {:.4f}s -- {} "{}"'.format(seconds, obj_type, obj_id))
+
+
+def write_trace(file_path):
+    """Write the recorded builds and file parsing to a Chrome trace event JSON.
+
+    The file can be opened with chrome://tracing or https://ui.perfetto.dev.
+    Builds are only recorded as trace events when instrumentation is enabled
+    with trace set to True.
+
+    Args:
+        file_path: Path to the JSON file to be written.
+
+    Returns:
+        The path to the JSON file.
+    """
+    events = []
+    for f_path, (start, seconds) in parse_times.items():
+        events.append({
+            'name': os.path.basename(f_path), 'cat': 'parse', 'ph': 'X',
+            'ts': start * 1e6, 'dur': seconds * 1e6, 'pid': os.getpid(), 'tid': 0
+        })
+    with _lock:
+        events.extend(_events)
+    with open(file_path, 'w') as fp:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fp)
+    return file_path
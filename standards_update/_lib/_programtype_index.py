@@ -0,0 +1,319 @@
+# coding=utf-8
+"""Columnar index of the numeric loads of program types for fast range queries.
+
+The index is stored as JSON columns such that it can be read with any JSON reader
+and diffed along with the rest of the data. When NumPy is installed, the columns
+are loaded into arrays on the first query such that ranges and distances are
+computed over whole columns at once. Otherwise, the same queries are run with a
+Python pass over the columns, which gives identical results.
+"""
+import os
+import json
+import heapq
+
+try:  # NumPy is an optional dependency that vectorizes the queries of the columns
+    import numpy
+except ImportError:
+    numpy = None
+
+import honeybee_energy_standards
+
+from standards_update._lib._loadjson import load_json, load_folder
+
+# name of the index file in the data folder
+INDEX_FILE = 'programtypes_index.json'
+
+# the fields of the index along with the load and attribute they come from
+INDEX_FIELDS = (
+    ('people_per_area', 'people', 'people_per_area'),
+    ('lighting_per_area', 'lighting', 'watts_per_area'),
+    ('electric_equipment_per_area', 'electric_equipment', 'watts_per_area'),
+    ('gas_equipment_per_area', 'gas_equipment', 'watts_per_area'),
+    ('service_hot_water_per_area', 'service_hot_water', 'flow_per_area'),
+    ('infiltration_per_exterior_area', 'infiltration', 'flow_per_exterior_area'),
+    ('ventilation_per_person', 'ventilation', 'flow_per_person'),
+    ('ventilation_per_area', 'ventilation', 'flow_per_area'),
+    ('ventilation_air_changes', 'ventilation', 'air_changes_per_hour'),
+    ('ventilation_per_zone', 'ventilation', 'flow_per_zone')
+)
+
+
+class ProgramTypeIndex(object):
+    """Columnar index of the numeric loads of program types.
+
+    Each field of the index is stored as a list of values that is aligned with
+    the list of program type identifiers. Loads that a program type does not
+    have are given a value of zero.
+
+    Args:
+        identifiers: A list of program type identifiers.
+        columns: A dictionary with the names of the INDEX_FIELDS as keys and
+            lists of values aligned with the identifiers as values.
+
+    Properties:
+        * identifiers
+        * fields
+        * columns
+    """
+    __slots__ = ('_identifiers', '_columns', '_normalized', '_arrays')
+
+    def __init__(self, identifiers, columns):
+        self._identifiers = tuple(identifiers)
+        for field, _, _ in INDEX_FIELDS:
+            assert len(columns[field]) == len(self._identifiers), 'Column "{}" ' \
+                'does not have one value for each identifier.'.format(field)
+        self._columns = {field: tuple(columns[field]) for field, _, _ in INDEX_FIELDS}
+        self._normalized = None
+        self._arrays = None
+
+    @classmethod
+    def from_program_type_dicts(cls, program_type_dicts):
+        """Create the index from a dictionary of ProgramTypeAbridged dictionaries.
+
+        Args:
+            program_type_dicts: A dictionary with program type identifiers as keys
+                and ProgramTypeAbridged dictionaries as values.
+        """
+        columns = {field: [] for field, _, _ in INDEX_FIELDS}
+        for p_dict in program_type_dicts.values():
+            for field, load, attr in INDEX_FIELDS:
+                try:
+                    val = p_dict[load][attr]
+                except (KeyError, TypeError):  # load is not in the program type
+                    val = 0
+                columns[field].append(val)
+        return cls(program_type_dicts.keys(), columns)
+
+    @classmethod
+    def from_data_folder(cls, data_dir):
+        """Create the index from the programtypes JSONs of a standards data folder.
+
+        Args:
+            data_dir: Path to a folder of Honeybee JSONs with the same structure
+                as honeybee_energy_standards.
+        """
+        p_dicts = {}
+        for p_type_data in load_folder(os.path.join(data_dir, 'programtypes')).values():
+            p_dicts.update(p_type_data)
+        return cls.from_program_type_dicts(p_dicts)
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load the index from a JSON file written with the to_file method.
+
+        Args:
+            file_path: Path to a programtypes_index.json file.
+        """
+        data = load_json(file_path)
+        return cls(data['identifiers'], data['columns'])
+
+    @property
+    def identifiers(self):
+        """Get a tuple of the program type identifiers in the index."""
+        return self._identifiers
+
+    @property
+    def fields(self):
+        """Get a tuple of the names of the fields in the index."""
+        return tuple(field for field, _, _ in INDEX_FIELDS)
+
+    @property
+    def columns(self):
+        """Get a dictionary with field names as keys and tuples of values as values."""
+        return self._columns
+
+    def values(self, identifier):
+        """Get a dictionary of the indexed values for a given program type.
+
+        Args:
+            identifier: Text for the identifier of a program type in the index.
+        """
+        try:
+            i = self._identifiers.index(identifier)
+        except ValueError:
+            raise ValueError(
+                '"{}" was not found in the program type index.'.format(identifier))
+        return {field: col[i] for field, col in self._columns.items()}
+
+    def query(self, vintage=None, building_type=None, **ranges):
+        """Get the identifiers of all program types that have loads in given ranges.
+
+        Args:
+            vintage: Optional text for the vintage of the program types
+                (eg. '2019'). If None, all vintages will be included.
+            building_type: Optional text for the building type of the program
+                types (eg. 'LargeOffice'). If None, all building types will be
+                included.
+            ranges: Keyword arguments with the names of index fields as keys and
+                (minimum, maximum) tuples of values as values. Both bounds are
+                inclusive and either can be None to leave it unbounded. For
+                example, lighting_per_area=(5, 8), people_per_area=(0.1, None).
+
+        Returns:
+            A list of the identifiers of the program types that meet all criteria.
+        """
+        for field in ranges:
+            self._check_field(field)
+        if numpy is not None:
+            mask = self._row_mask(vintage, building_type)
+            arrays = self._column_arrays()
+            for field, (minimum, maximum) in ranges.items():
+                if minimum is not None:
+                    mask &= arrays[field] >= minimum
+                if maximum is not None:
+                    mask &= arrays[field] <= maximum
+            return [self._identifiers[i] for i in numpy.flatnonzero(mask).tolist()]
+
+        rows = range(len(self._identifiers))
+        if vintage is not None or building_type is not None:
+            rows = [i for i in rows if self._matches(i, vintage, building_type)]
+        for field, (minimum, maximum) in ranges.items():
+            col = self._columns[field]
+            if minimum is not None:
+                rows = [i for i in rows if col[i] >= minimum]
+            if maximum is not None:
+                rows = [i for i in rows if col[i] <= maximum]
+        return [self._identifiers[i] for i in rows]
+
+    def nearest(self, count=5, vintage=None, building_type=None, **target):
+        """Get the identifiers of the program types with loads closest to a target.
+
+        Closeness is the Euclidean distance over the fields of the target, where
+        each field is divided by its standard deviation across the index such
+        that fields with large values (eg. lighting_per_area) do not outweigh
+        those with small values (eg. people_per_area).
+
+        Args:
+            count: Integer for the number of program types to return. (Default: 5).
+            vintage: Optional text for the vintage of the program types
+                (eg. '2019'). If None, all vintages will be included.
+            building_type: Optional text for the building type of the program
+                types (eg. 'LargeOffice'). If None, all building types will be
+                included.
+            target: Keyword arguments with the names of index fields as keys and
+                the target values as values. For example, people_per_area=0.05,
+                lighting_per_area=8, electric_equipment_per_area=10.
+
+        Returns:
+            A list of the identifiers of the closest program types, starting
+            with the closest one.
+        """
+        assert len(target) != 0, 'At least one target value must be specified.'
+        for field in target:
+            self._check_field(field)
+        if self._normalized is None:
+            self._normalized = self._normalize()
+        targets = []
+        for field, value in target.items():
+            col, scale = self._normalized[field]
+            targets.append((col, value / scale))
+
+        if numpy is not None:
+            rows = numpy.flatnonzero(self._row_mask(vintage, building_type))
+            distance = numpy.zeros(len(self._identifiers))
+            for col, val in targets:
+                distance += (col - val) ** 2
+            order = numpy.argsort(distance[rows], kind='stable')[:count]
+            return [self._identifiers[i] for i in rows[order].tolist()]
+
+        rows = range(len(self._identifiers))
+        if vintage is not None or building_type is not None:
+            rows = [i for i in rows if self._matches(i, vintage, building_type)]
+        closest = heapq.nsmallest(
+            count, rows, key=lambda i: sum((col[i] - val) ** 2 for col, val in targets))
+        return [self._identifiers[i] for i in closest]
+
+    def to_dict(self):
+        """Get the index as a dictionary that can be written to JSON."""
+        return {
+            'identifiers': list(self._identifiers),
+            'columns': {field: list(col) for field, col in self._columns.items()}
+        }
+
+    def to_file(self, file_path):
+        """Write the index to a JSON file.
+
+        Args:
+            file_path: Path to the JSON file to be written.
+        """
+        with open(file_path, 'w') as fp:
+            json.dump(self.to_dict(), fp)
+        return file_path
+
+    def _normalize(self):
+        """Get the columns of the index divided by their standard deviation.
+
+        The columns are NumPy arrays when NumPy is installed and tuples otherwise.
+        """
+        normalized = {}
+        count = len(self._identifiers)
+        for field, col in self._columns.items():
+            mean = sum(col) / count if count else 0
+            std = (sum((v - mean) ** 2 for v in col) / count) ** 0.5 if count else 0
+            scale = std if std > 0 else 1
+            norm_col = tuple(v / scale for v in col)
+            if numpy is not None:
+                norm_col = numpy.asarray(norm_col)
+            normalized[field] = (norm_col, scale)
+        return normalized
+
+    def _check_field(self, field):
+        """Raise an error if a field is not one of the fields of the index."""
+        if field not in self._columns:
+            raise ValueError('"{}" is not a field of the program type index. '
+                             'Choose from:\n{}'.format(field, self.fields))
+
+    def _column_arrays(self):
+        """Get a dictionary of the columns of the index as NumPy arrays."""
+        if self._arrays is None:
+            self._arrays = {field: numpy.asarray(col, dtype=float)
+                            for field, col in self._columns.items()}
+        return self._arrays
+
+    def _row_mask(self, vintage, building_type):
+        """Get a NumPy array of booleans for the rows of a vintage and building type."""
+        count = len(self._identifiers)
+        if vintage is None and building_type is None:
+            return numpy.ones(count, dtype=bool)
+        return numpy.fromiter(
+            (self._matches(i, vintage, building_type) for i in range(count)),
+            dtype=bool, count=count)
+
+    def _matches(self, i, vintage, building_type):
+        """Check whether the program type at an index is of a vintage and building."""
+        id_parts = self._identifiers[i].split('::')
+        if vintage is not None and id_parts[0] != vintage:
+            return False
+        if building_type is not None and \
+                (len(id_parts) < 3 or id_parts[1] != building_type):
+            return False
+        return True
+
+    def __len__(self):
+        return len(self._identifiers)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'ProgramTypeIndex: [{} program types]'.format(len(self))
+
+
+_index = []  # list to hold the index once it has been loaded
+
+
+def program_type_index():
+    """Get the ProgramTypeIndex of the honeybee_energy_standards data.
+
+    The index is loaded from the programtypes_index.json of the data when it
+    exists and otherwise it is built from the program type JSONs. In both cases,
+    it is only loaded once and is re-used on subsequent calls.
+    """
+    if len(_index) == 0:
+        data_dir = os.path.dirname(honeybee_energy_standards.__file__)
+        try:
+            _index.append(ProgramTypeIndex.from_file(os.path.join(data_dir, INDEX_FILE)))
+        except FileNotFoundError:
+            _index.append(ProgramTypeIndex.from_data_folder(data_dir))
+    return _index[0]
@@ -0,0 +1,215 @@
+# coding=utf-8
+"""Registry of the building and space types of program types across all vintages.
+
+The programtypes_registry folder has one JSON for each vintage, which lists the
+space types of every building type in that vintage. This module merges them into
+a single programtypes_registry.json where each space type of a building type has
+an integer with one bit for each vintage in which it is available. The whole
+registry is loaded with one small read and space types can be listed and
+checked without loading the registry of each vintage.
+"""
+import os
+import json
+
+import honeybee_energy_standards
+
+from standards_update._lib._loadjson import load_json, load_folder
+
+# name of the merged registry file in the data folder
+REGISTRY_FILE = 'programtypes_registry.json'
+
+# vintages of the data in chronological order
+VINTAGES = ('pre_1980', '1980_2004', '2004', '2007', '2010', '2013', '2016', '2019')
+
+
+def _vintage_order(vintage):
+    """Get a key that sorts vintages chronologically and unknown vintages last."""
+    try:
+        return (VINTAGES.index(vintage), vintage)
+    except ValueError:
+        return (len(VINTAGES), vintage)
+
+
+class ProgramTypeRegistry(object):
+    """Registry of the space types of each building type across all vintages.
+
+    Args:
+        vintages: A list of the vintages of the registry (eg. '2019').
+        building_types: A dictionary with building types as keys and dictionaries
+            as values. Each of these has the space types of the building type
+            as keys and integers as values, where bit i of the integer is set
+            when the space type is available in the vintage at index i.
+
+    Properties:
+        * vintages
+        * building_types
+    """
+    __slots__ = ('_vintages', '_building_types')
+
+    def __init__(self, vintages, building_types):
+        self._vintages = tuple(vintages)
+        self._building_types = building_types
+
+    @classmethod
+    def from_registries(cls, registries):
+        """Create the registry from the registries of each vintage.
+
+        Args:
+            registries: A dictionary with vintages as keys and the registry
+                dictionary of each vintage as values. Each registry dictionary has
+                building types as keys and lists of space types as values.
+        """
+        vintages = sorted(registries, key=_vintage_order)
+        building_types = {}
+        for i, vintage in enumerate(vintages):
+            for bldg, space_types in registries[vintage].items():
+                bldg_spaces = building_types.setdefault(bldg, {})
+                for space_type in space_types:
+                    bldg_spaces[space_type] = bldg_spaces.get(space_type, 0) | (1 << i)
+        return cls(vintages, building_types)
+
+    @classmethod
+    def from_data_folder(cls, data_dir):
+        """Create the registry from the programtypes_registry JSONs of a data folder.
+
+        Args:
+            data_dir: Path to a folder of Honeybee JSONs with the same structure
+                as honeybee_energy_standards.
+        """
+        registries = {}
+        reg_dir = os.path.join(data_dir, 'programtypes_registry')
+        for f_name, registry in load_folder(reg_dir).items():
+            registries[f_name.replace('_registry.json', '')] = registry
+        return cls.from_registries(registries)
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load the registry from a JSON file written with the to_file method.
+
+        Args:
+            file_path: Path to a programtypes_registry.json file.
+        """
+        data = load_json(file_path)
+        return cls(data['vintages'], data['building_types'])
+
+    @property
+    def vintages(self):
+        """Get a tuple of the vintages in the registry in chronological order."""
+        return self._vintages
+
+    @property
+    def building_types(self):
+        """Get a tuple of all building types in the registry."""
+        return tuple(self._building_types.keys())
+
+    def space_types(self, building_type, vintage=None):
+        """Get a list of the space types of a building type.
+
+        Args:
+            building_type: Text for a building type (eg. 'LargeOffice').
+            vintage: Optional text for a vintage (eg. '2019'). If None, the
+                space types of the building type in any vintage are returned.
+        """
+        bldg_spaces = self._spaces(building_type)
+        if vintage is None:
+            return list(bldg_spaces.keys())
+        bit = self._bit(vintage)
+        return [space for space, mask in bldg_spaces.items() if mask & bit]
+
+    def vintages_of(self, building_type, space_type):
+        """Get a tuple of the vintages in which a space type is available.
+
+        Args:
+            building_type: Text for a building type (eg. 'LargeOffice').
+            space_type: Text for a space type of the building type (eg. 'OpenOffice').
+        """
+        try:
+            mask = self._spaces(building_type)[space_type]
+        except KeyError:
+            raise ValueError('"{}" is not a space type of "{}".'.format(
+                space_type, building_type))
+        return tuple(v for i, v in enumerate(self._vintages) if mask & (1 << i))
+
+    def is_available(self, building_type, space_type, vintage=None):
+        """Check whether a space type of a building type is in the registry.
+
+        Args:
+            building_type: Text for a building type (eg. 'LargeOffice').
+            space_type: Text for a space type of the building type (eg. 'OpenOffice').
+            vintage: Optional text for a vintage (eg. '2019'). If None, this
+                checks whether the space type is available in any vintage.
+        """
+        try:
+            mask = self._building_types[building_type][space_type]
+        except KeyError:
+            return False
+        if vintage is None:
+            return True
+        try:
+            return bool(mask & self._bit(vintage))
+        except ValueError:
+            return False
+
+    def to_dict(self):
+        """Get the registry as a dictionary that can be written to JSON."""
+        return {
+            'vintages': list(self._vintages),
+            'building_types': self._building_types
+        }
+
+    def to_file(self, file_path):
+        """Write the registry to a JSON file.
+
+        Args:
+            file_path: Path to the JSON file to be written.
+        """
+        with open(file_path, 'w') as fp:
+            json.dump(self.to_dict(), fp, separators=(',', ':'))
+        return file_path
+
+    def _spaces(self, building_type):
+        """Get the dictionary of space types of a building type."""
+        try:
+            return self._building_types[building_type]
+        except KeyError:
+            raise ValueError('"{}" is not a building type of the registry. Choose '
+                             'from:\n{}'.format(building_type, self.building_types))
+
+    def _bit(self, vintage):
+        """Get the bit of a vintage in the integers of the registry."""
+        try:
+            return 1 << self._vintages.index(vintage)
+        except ValueError:
+            raise ValueError('"{}" is not a vintage of the registry. Choose '
+                             'from:\n{}'.format(vintage, self._vintages))
+
+    def __len__(self):
+        return sum(len(spaces) for spaces in self._building_types.values())
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'ProgramTypeRegistry: [{} building types] [{} space types]'.format(
+            len(self._building_types), len(self))
+
+
+_registry = []  # list to hold the registry once it has been loaded
+
+
+def program_type_registry():
+    """Get the ProgramTypeRegistry of the honeybee_energy_standards data.
+
+    The registry is loaded from the programtypes_registry.json of the data when
+    it exists and otherwise it is built from the registry JSONs of each vintage.
+    In both cases, it is only loaded once and is re-used on subsequent calls.
+    """
+    if len(_registry) == 0:
+        data_dir = os.path.dirname(honeybee_energy_standards.__file__)
+        try:
+            _registry.append(
+                ProgramTypeRegistry.from_file(os.path.join(data_dir, REGISTRY_FILE)))
+        except FileNotFoundError:
+            _registry.append(ProgramTypeRegistry.from_data_folder(data_dir))
+    return _registry[0]
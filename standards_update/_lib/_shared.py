@@ -0,0 +1,205 @@
+# coding=utf-8
+"""Standards library stored in shared memory such that many processes can read it.
+
+The abridged dictionaries of all objects are encoded to JSON once and packed into
+a single block of shared memory along with a table of the location of each
+record within the block. Worker processes attach to the block by name and only
+decode the records that they use, meaning that the memory of the encoded library
+is shared across all processes instead of each one holding its own copy.
+
+The shared memory block has the following layout:
+
+    * 8 bytes -- The length of the table as an unsigned little-endian integer.
+    * table -- A JSON object with the object types as keys and objects of
+        [offset, length] for each record identifier as values.
+    * records -- The JSON of each record, with offsets starting from the end
+        of the table.
+"""
+import json
+import struct
+from multiprocessing import shared_memory, resource_tracker
+
+from standards_update._lib._catalog import load_catalog, closure
+
+_HEADER = struct.Struct('<Q')
+
+
+def _attach_shared_memory(name):
+    """Attach to an existing block of shared memory without tracking it.
+
+    Processes that only attach to a block should not unlink it when they exit,
+    which is what happens when the block is registered with the resource tracker.
+    The block is unregistered after it is attached instead of patching the
+    resource tracker, which would not be safe when other threads create blocks.
+    """
+    try:  # Python 3.13 and above
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # older Python registers the block when it is attached
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class _SharedRecords(object):
+    """Read-only mapping of the records of one object type in a SharedCatalog."""
+    __slots__ = ('_buffer', '_start', '_table')
+
+    def __init__(self, buffer, start, table):
+        self._buffer = buffer
+        self._start = start
+        self._table = table
+
+    def __getitem__(self, identifier):
+        offset, length = self._table[identifier]
+        start = self._start + offset
+        return json.loads(bytes(self._buffer[start:start + length]).decode('utf-8'))
+
+    def __contains__(self, identifier):
+        return identifier in self._table
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __len__(self):
+        return len(self._table)
+
+
+class SharedCatalog(object):
+    """Standards library stored in shared memory.
+
+    Use the create classmethod to put a library into shared memory and the attach
+    classmethod to read it from another process. SharedCatalog objects can also
+    be passed directly to processes that are started with either the 'fork' or
+    'spawn' method, in which case they are attached in the new process by name.
+
+    Args:
+        shm: A multiprocessing.shared_memory.SharedMemory object containing
+            the packed library.
+        owner: Boolean to note whether this object created the shared memory
+            and is responsible for unlinking it. (Default: False).
+
+    Properties:
+        * name
+        * size
+        * object_types
+    """
+    __slots__ = ('_shm', '_owner', '_records')
+
+    def __init__(self, shm, owner=False):
+        self._shm = shm
+        self._owner = owner
+        buffer = shm.buf
+        table_len = _HEADER.unpack_from(buffer, 0)[0]
+        table_end = _HEADER.size + table_len
+        table = json.loads(bytes(buffer[_HEADER.size:table_end]).decode('utf-8'))
+        self._records = {obj_type: _SharedRecords(buffer, table_end, obj_table)
+                         for obj_type, obj_table in table.items()}
+
+    @classmethod
+    def create(cls, data_dir=None, name=None):
+        """Load a standards library and pack it into a new block of shared memory.
+
+        Args:
+            data_dir: Path to a folder of Honeybee JSONs with the same structure as
+                honeybee_energy_standards. If None, the installed
+                honeybee_energy_standards data will be used.
+            name: Optional text for the name of the shared memory block. If None,
+                a unique name will be generated.
+        """
+        table, records, offset = {}, [], 0
+        for obj_type, obj_dicts in load_catalog(data_dir).items():
+            obj_table = table[obj_type] = {}
+            for obj_id, obj_dict in obj_dicts.items():
+                record = json.dumps(obj_dict, separators=(',', ':')).encode('utf-8')
+                obj_table[obj_id] = [offset, len(record)]
+                records.append(record)
+                offset += len(record)
+        table_bytes = json.dumps(table, separators=(',', ':')).encode('utf-8')
+
+        size = _HEADER.size + len(table_bytes) + offset
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(shm.buf, 0, len(table_bytes))
+        start = _HEADER.size
+        shm.buf[start:start + len(table_bytes)] = table_bytes
+        start += len(table_bytes)
+        shm.buf[start:start + offset] = b''.join(records)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a SharedCatalog that was created by another process.
+
+        Args:
+            name: Text for the name of the shared memory block of the catalog.
+        """
+        return cls(_attach_shared_memory(name))
+
+    @property
+    def name(self):
+        """Get text for the name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def size(self):
+        """Get an integer for the number of bytes in the shared memory block."""
+        return self._shm.size
+
+    @property
+    def object_types(self):
+        """Get a tuple of the object types in the catalog."""
+        return tuple(self._records.keys())
+
+    def record(self, obj_type, identifier):
+        """Get the abridged dictionary of an object in the catalog.
+
+        Args:
+            obj_type: Text for the type of object (eg. 'program_type').
+            identifier: Text for the identifier of the object.
+        """
+        try:
+            return self._records[obj_type][identifier]
+        except KeyError:
+            raise ValueError('"{}" was not found in the {} library.'.format(
+                identifier, obj_type.replace('_', ' ')))
+
+    def closure(self, obj_type, identifiers):
+        """Get a group of objects along with all of the objects that they reference.
+
+        Args:
+            obj_type: Text for the type of objects requested (eg. 'program_type').
+            identifiers: A list of identifiers for the objects requested.
+
+        Returns:
+            A tuple with a dictionary of the objects organized by type and a list
+            of the requested identifiers that were not found. See the closure
+            function of standards_update._lib._catalog for more information.
+        """
+        return closure(self._records, obj_type, identifiers)
+
+    def close(self):
+        """Close this process's access to the shared memory.
+
+        If this object created the shared memory, it will also be unlinked such
+        that it is freed once all other processes have closed it.
+        """
+        self._records = {}
+        self._shm.close()
+        if self._owner:
+            # processes that attached may have unregistered the block from a
+            # resource tracker shared with this one, which unlink unregisters
+            resource_tracker.register(self._shm._name, 'shared_memory')
+            self._shm.unlink()
+            self._owner = False
+
+    def __getitem__(self, obj_type):
+        return self._records[obj_type]
+
+    def __reduce__(self):
+        return (SharedCatalog.attach, (self.name,))
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'SharedCatalog: {} [{} bytes]'.format(self.name, self.size)
@@ -0,0 +1,25 @@
+# coding=utf-8
+"""Get the versions of the packages that determine the content of cached objects."""
+
+
+def _package_version(package_name):
+    """Get the version of an installed package or 'unknown' if it is not installed."""
+    try:
+        from importlib import metadata
+        return metadata.version(package_name)
+    except Exception:  # importlib.metadata is not available or package not found
+        return 'unknown'
+
+
+def honeybee_energy_version():
+    """Get the version of honeybee-energy, which affects all translated records."""
+    return _package_version('honeybee-energy')
+
+
+def standards_version():
+    """Get the version of honeybee-energy-standards, which affects all standards data.
+
+    This is 'unknown' when the data is used from a clone of the repository
+    instead of an installed package.
+    """
+    return _package_version('honeybee-energy-standards')
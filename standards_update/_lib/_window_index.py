@@ -0,0 +1,228 @@
+# coding=utf-8
+"""Sorted index of the performance of window constructions for fast range queries."""
+import os
+import json
+from bisect import bisect_left, bisect_right
+
+import honeybee_energy_standards
+from honeybee_energy.material.dictutil import dict_to_material
+from honeybee_energy.construction.window import WindowConstruction
+
+from standards_update._lib._loadjson import load_json
+
+# name of the index file in the data folder
+INDEX_FILE = 'window_construction_index.json'
+
+# the fields of the index, which are the WindowConstruction properties they come from
+INDEX_FIELDS = ('u_factor', 'shgc', 'visible_transmittance')
+
+
+class WindowConstructionIndex(object):
+    """Sorted index of the U-factor, SHGC and visible transmittance of window constructions.
+
+    Each field of the index is stored as a list of values that is aligned with
+    the list of window construction identifiers. The U-factor includes the
+    standard NFRC air films and is in W/m2-K. The first time that a field is
+    queried, its values are sorted such that ranges of it can be found with a
+    binary search.
+
+    Args:
+        identifiers: A list of window construction identifiers.
+        columns: A dictionary with the INDEX_FIELDS as keys and lists of values
+            aligned with the identifiers as values.
+
+    Properties:
+        * identifiers
+        * fields
+        * columns
+    """
+    __slots__ = ('_identifiers', '_columns', '_sorted')
+
+    def __init__(self, identifiers, columns):
+        self._identifiers = tuple(identifiers)
+        for field in INDEX_FIELDS:
+            assert len(columns[field]) == len(self._identifiers), 'Column "{}" ' \
+                'does not have one value for each identifier.'.format(field)
+        self._columns = {field: tuple(columns[field]) for field in INDEX_FIELDS}
+        self._sorted = {}
+
+    @classmethod
+    def from_window_constructions(cls, constructions):
+        """Create the index from a list of honeybee WindowConstruction objects.
+
+        Args:
+            constructions: A list of WindowConstruction objects, which can have
+                any combination of simple glazing, glazing and gas layers.
+        """
+        columns = {field: [getattr(constr, field) for constr in constructions]
+                   for field in INDEX_FIELDS}
+        return cls([constr.identifier for constr in constructions], columns)
+
+    @classmethod
+    def from_construction_dicts(cls, construction_dicts, material_dicts):
+        """Create the index from dictionaries of window constructions and materials.
+
+        Args:
+            construction_dicts: A dictionary with window construction identifiers
+                as keys and WindowConstructionAbridged dictionaries as values.
+            material_dicts: A dictionary with material identifiers as keys and
+                honeybee window material dictionaries as values.
+        """
+        materials = {mat_id: dict_to_material(m_dict)
+                     for mat_id, m_dict in material_dicts.items()}
+        constrs = []
+        for c_dict in construction_dicts.values():
+            try:
+                constrs.append(WindowConstruction.from_dict_abridged(c_dict, materials))
+            except KeyError as e:
+                raise ValueError('Material {} of window construction "{}" was not '
+                                 'found.'.format(e, c_dict['identifier']))
+        return cls.from_window_constructions(constrs)
+
+    @classmethod
+    def from_data_folder(cls, data_dir):
+        """Create the index from the window constructions of a standards data folder.
+
+        Args:
+            data_dir: Path to a folder of Honeybee JSONs with the same structure
+                as honeybee_energy_standards.
+        """
+        constr_dir = os.path.join(data_dir, 'constructions')
+        return cls.from_construction_dicts(
+            load_json(os.path.join(constr_dir, 'window_construction.json')),
+            load_json(os.path.join(constr_dir, 'window_material.json')))
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load the index from a JSON file written with the to_file method.
+
+        Args:
+            file_path: Path to a window_construction_index.json file.
+        """
+        data = load_json(file_path)
+        return cls(data['identifiers'], data['columns'])
+
+    @property
+    def identifiers(self):
+        """Get a tuple of the window construction identifiers in the index."""
+        return self._identifiers
+
+    @property
+    def fields(self):
+        """Get a tuple of the names of the fields in the index."""
+        return INDEX_FIELDS
+
+    @property
+    def columns(self):
+        """Get a dictionary with field names as keys and tuples of values as values."""
+        return self._columns
+
+    def values(self, identifier):
+        """Get a dictionary of the indexed values for a given window construction.
+
+        Args:
+            identifier: Text for the identifier of a window construction in the index.
+        """
+        try:
+            i = self._identifiers.index(identifier)
+        except ValueError:
+            raise ValueError('"{}" was not found in the window construction '
+                             'index.'.format(identifier))
+        return {field: col[i] for field, col in self._columns.items()}
+
+    def query(self, sort_by=None, reverse=False, **ranges):
+        """Get the identifiers of all window constructions with values in given ranges.
+
+        Args:
+            sort_by: Optional text for the name of an index field by which the
+                results will be sorted (eg. 'u_factor'). If None, the results
+                will be in the order of the index.
+            reverse: Boolean to note whether the results should be sorted from
+                the largest value to the smallest one. (Default: False).
+            ranges: Keyword arguments with the names of index fields as keys and
+                (minimum, maximum) tuples of values as values. Both bounds are
+                inclusive and either can be None to leave it unbounded. For
+                example, u_factor=(None, 1.8), shgc=(0.25, 0.35),
+                visible_transmittance=(0.5, None).
+
+        Returns:
+            A list of the identifiers of the window constructions that meet all
+            criteria.
+        """
+        rows = None
+        for field, (minimum, maximum) in ranges.items():
+            values, order = self._sorted_column(field)
+            start = 0 if minimum is None else bisect_left(values, minimum)
+            end = len(values) if maximum is None else bisect_right(values, maximum)
+            in_range = order[start:end]
+            rows = set(in_range) if rows is None else rows.intersection(in_range)
+        rows = range(len(self._identifiers)) if rows is None else sorted(rows)
+
+        if sort_by is not None:
+            col = self._columns[self._check_field(sort_by)]
+            rows = sorted(rows, key=lambda i: col[i], reverse=reverse)
+        return [self._identifiers[i] for i in rows]
+
+    def to_dict(self):
+        """Get the index as a dictionary that can be written to JSON."""
+        return {
+            'identifiers': list(self._identifiers),
+            'columns': {field: list(col) for field, col in self._columns.items()}
+        }
+
+    def to_file(self, file_path):
+        """Write the index to a JSON file.
+
+        Args:
+            file_path: Path to the JSON file to be written.
+        """
+        with open(file_path, 'w') as fp:
+            json.dump(self.to_dict(), fp)
+        return file_path
+
+    def _sorted_column(self, field):
+        """Get a tuple of the sorted values of a field and a tuple of their rows."""
+        try:
+            return self._sorted[field]
+        except KeyError:
+            col = self._columns[self._check_field(field)]
+            order = tuple(sorted(range(len(col)), key=col.__getitem__))
+            self._sorted[field] = (tuple(col[i] for i in order), order)
+            return self._sorted[field]
+
+    def _check_field(self, field):
+        """Check that a field is in the index and raise a ValueError if not."""
+        if field not in self._columns:
+            raise ValueError('"{}" is not a field of the window construction index. '
+                             'Choose from:\n{}'.format(field, INDEX_FIELDS))
+        return field
+
+    def __len__(self):
+        return len(self._identifiers)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'WindowConstructionIndex: [{} window constructions]'.format(len(self))
+
+
+_index = []  # list to hold the index once it has been loaded
+
+
+def window_construction_index():
+    """Get the WindowConstructionIndex of the honeybee_energy_standards data.
+
+    The index is loaded from the window_construction_index.json of the data when
+    it exists and otherwise it is built from the window construction JSONs. In
+    both cases, it is only loaded once and is re-used on subsequent calls.
+    """
+    if len(_index) == 0:
+        data_dir = os.path.dirname(honeybee_energy_standards.__file__)
+        try:
+            _index.append(
+                WindowConstructionIndex.from_file(os.path.join(data_dir, INDEX_FILE)))
+        except FileNotFoundError:
+            _index.append(WindowConstructionIndex.from_data_folder(data_dir))
+    return _index[0]
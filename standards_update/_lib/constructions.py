@@ -3,8 +3,16 @@ from honeybee_energy.construction.opaque import OpaqueConstruction
 from honeybee_energy.construction.window import WindowConstruction
 from honeybee_energy.lib.constructions import _opaque_constructions, _window_constructions
 
+# add the from_standards_dict classmethods to the honeybee-energy objects
+import standards_update._extend_honeybee_energy
+
 import os
-import json
+
+from standards_update._lib._loadjson import load_json
+from standards_update._lib._envelope import INSULATION_ID, insulation_variant, \
+    insulation_r_value
+from standards_update._lib.materials import opaque_material_by_identifier
+from standards_update.extension._units import to_ip
 
 
 # load the standards gem data of construction to Python dictionaries.
@@ -12,15 +20,13 @@ _data_dir = os.path.join(os.path.dirname(__file__), '../_standards_data')
 
 try:
     _opaque_dir = os.path.join(_data_dir, 'opaque_construction.json')
-    with open(_opaque_dir, 'r') as f:
-        _opaque_constr_standards_dict = json.load(f)
+    _opaque_constr_standards_dict = load_json(_opaque_dir)
 except FileNotFoundError:
     _opaque_constr_standards_dict = {}
 
 try:
     _window_dir = os.path.join(_data_dir, 'window_construction.json')
-    with open(_window_dir, 'r') as f:
-        _window_constr_standards_dict = json.load(f)
+    _window_constr_standards_dict = load_json(_window_dir)
 except FileNotFoundError:
     _window_constr_standards_dict = {}
 
@@ -36,10 +42,10 @@ def opaque_construction_by_identifier(construction_identifier):
     except KeyError:  # construction likely needs to be loaded from standards data
         try:
             _constr_dict = _opaque_constr_standards_dict[construction_identifier]
-        except KeyError:  # construction is nowhere to be found; raise an error
-            raise ValueError(
-                '"{}" was not found in the opaque energy construction library.'.format(
-                    construction_identifier))
+        except KeyError:  # see if it is an insulation variant that can be synthesized
+            _constr_obj = _insulated_construction(construction_identifier)
+            _opaque_constructions[construction_identifier] = _constr_obj
+            return _constr_obj
 
     # create the Python object from the standards gem dictionary
     _constr_obj = OpaqueConstruction.from_standards_dict(_constr_dict)
@@ -48,6 +54,45 @@ def opaque_construction_by_identifier(construction_identifier):
     return _constr_obj
 
 
+def _insulated_construction(construction_identifier):
+    """Synthesize a '{construction}-R{n}' construction from its base construction.
+
+    The Typical Insulation of the base construction is replaced with the
+    'Typical Insulation-R{m}' material that has the smallest whole-number R-value
+    for which the construction meets R-n. This uses the same insulation_r_value
+    function as the adjust_typical_insulation function of the _util package such
+    that the result is identical to the constructions that it stores.
+
+    Args:
+        construction_identifier: A text string for the identifier of the construction.
+    """
+    variant = insulation_variant(construction_identifier)
+    try:
+        base_constr = opaque_construction_by_identifier(variant[0])
+    except (TypeError, ValueError):  # construction is nowhere to be found
+        raise ValueError(
+            '"{}" was not found in the opaque energy construction library.'.format(
+                construction_identifier))
+    if INSULATION_ID not in base_constr.layers:
+        raise ValueError('"{}" cannot be synthesized because "{}" has no {} '
+                         'layer.'.format(construction_identifier, variant[0],
+                                         INSULATION_ID))
+
+    # replace the Typical Insulation with one that meets the R-value
+    base_r = to_ip(base_constr.r_value, 'h-ft2-F/Btu')
+    insul_r = insulation_r_value(variant[1], base_r)
+    if insul_r <= 0:
+        raise ValueError('"{}" cannot be synthesized because "{}" already has an '
+                         'R-value of {}.'.format(construction_identifier, variant[0],
+                                                 round(base_r, 2)))
+    insul_mat = opaque_material_by_identifier('{}-R{}'.format(INSULATION_ID, insul_r))
+    materials = [mat if mat.identifier != INSULATION_ID else insul_mat
+                 for mat in base_constr.materials]
+    _constr_obj = OpaqueConstruction(construction_identifier, materials)
+    _constr_obj.lock()
+    return _constr_obj
+
+
 def window_construction_by_identifier(construction_identifier):
     """Get an window construction from the library given the construction identifier.
 
@@ -1,25 +1,42 @@
 """Extend the honeybee_energy constructionsets library."""
 from honeybee_energy.constructionset import ConstructionSet
 from honeybee_energy.lib.constructionsets import _construction_sets
+import honeybee_energy.lib.constructionsets as constr_set_lib
+
+# add the from_standards_dict classmethods to the honeybee-energy objects
+import standards_update._extend_honeybee_energy
 
 import os
-import json
+
+from standards_update._lib._loadjson import load_json
+from standards_update._lib._registry import VINTAGES
 
 
 # load the standards gem data of construction sets to Python dictionaries.
 _data_dir = os.path.join(os.path.dirname(__file__), '../_standards_data')
 _c_set_dir = os.path.join(_data_dir, 'construction_set')
 
-_vintages = ('2019', '2016', '2013', '2010', '2007', '2004', '1980_2004', 'pre_1980')
+_vintages = tuple(reversed(VINTAGES))
 _construction_set_standards_dict = {}
 for vintage in _vintages:
     _c_set_vintage_dir = os.path.join(_c_set_dir, '{}_data.json'.format(vintage))
     try:
-        with open(_c_set_vintage_dir, 'r') as f:
-            _construction_set_standards_dict.update(json.load(f))
+        _construction_set_standards_dict.update(load_json(_c_set_vintage_dir, True))
     except FileNotFoundError:
         pass
 
+# lookup table from ASHRAE climate zones to the climate zones of the construction sets
+# zone 0 has no construction sets of its own and uses the requirements of zone 1
+_construction_types = ('SteelFramed', 'WoodFramed', 'Mass', 'Metal Building')
+_climate_zones = {}
+for _cz in range(9):
+    _cz_id = 'ClimateZone{}'.format(max(_cz, 1))
+    _climate_zones[str(_cz)] = _cz_id
+    _climate_zones['CLIMATEZONE{}'.format(_cz)] = _cz_id
+    for _sub_zone in ('A', 'B', 'C'):
+        _climate_zones['{}{}'.format(_cz, _sub_zone)] = _cz_id
+_resolved_sets = {}  # dictionary to hold construction sets that have been resolved
+
 
 def construction_set_by_identifier(construction_set_identifier):
     """Get a construction_set from the library given its identifier.
@@ -42,3 +59,55 @@ def construction_set_by_identifier(construction_set_identifier):
     _c_set_obj.lock()
     _construction_sets[construction_set_identifier] = _c_set_obj  # load faster next time
     return _c_set_obj
+
+
+def construction_set_by_climate_zone(vintage, climate_zone,
+                                     construction_type='SteelFramed'):
+    """Get a construction_set from the library given a vintage and ASHRAE climate zone.
+
+    All sub-zones of an ASHRAE climate zone (eg. 3A, 3B, 3C) use the construction
+    set of the climate zone number (eg. ClimateZone3) and climate zone 0 uses the
+    construction sets of climate zone 1. Results are stored such that subsequent
+    requests with the same inputs return the same locked ConstructionSet object
+    without any processing.
+
+    Args:
+        vintage: Text for the vintage of the construction set. Choose from:
+            ('2019', '2016', '2013', '2010', '2007', '2004', '1980_2004', 'pre_1980')
+        climate_zone: Text for the ASHRAE climate zone (eg. '4C', '0A', '7').
+            The climate zone number alone or an integer is also acceptable.
+        construction_type: Text for the construction type of the set. Choose from:
+            ('SteelFramed', 'WoodFramed', 'Mass', 'Metal Building').
+            (Default: 'SteelFramed').
+    """
+    key = (vintage, climate_zone, construction_type)
+    try:  # see if the construction set has already been resolved
+        return _resolved_sets[key]
+    except KeyError:
+        pass
+
+    # get the identifier of the construction set
+    vintage = str(vintage)
+    if vintage not in _vintages:
+        raise ValueError('Vintage "{}" is not recognized. Choose from:\n{}'.format(
+            vintage, _vintages))
+    try:
+        cz_id = _climate_zones[str(climate_zone).replace(' ', '').upper()]
+    except KeyError:
+        raise ValueError('Climate zone "{}" is not a recognized ASHRAE climate '
+                         'zone.'.format(climate_zone))
+    constr_type = 'Metal Building' if construction_type == 'MetalBuilding' \
+        else construction_type
+    if constr_type not in _construction_types:
+        raise ValueError('Construction type "{}" is not recognized. Choose from:'
+                         '\n{}'.format(construction_type, _construction_types))
+    set_id = '{}::{}::{}'.format(vintage, cz_id, constr_type)
+
+    try:  # see if the construction set was resolved from other inputs
+        _c_set_obj = _resolved_sets[set_id]
+    except KeyError:
+        _c_set_obj = constr_set_lib.construction_set_by_identifier(set_id)
+        _c_set_obj.lock()  # lock the object since it is shared across calls
+        _resolved_sets[set_id] = _c_set_obj
+    _resolved_sets[key] = _c_set_obj  # load faster next time
+    return _c_set_obj
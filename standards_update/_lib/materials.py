@@ -5,8 +5,14 @@ from honeybee_energy.material.glazing import EnergyWindowMaterialGlazing, \
 from honeybee_energy.material.gas import EnergyWindowMaterialGas
 from honeybee_energy.lib.materials import _opaque_materials, _window_materials
 
+# add the from_standards_dict classmethods to the honeybee-energy objects
+import standards_update._extend_honeybee_energy
+
 import os
-import json
+
+from standards_update._lib._loadjson import load_json
+from standards_update._lib._envelope import INSULATION_ID, insulation_variant
+from standards_update.extension._units import convert_records, to_si
 
 
 # load the standards gem data of materials to Python dictionaries.
@@ -14,15 +20,13 @@ _data_dir = os.path.join(os.path.dirname(__file__), '../_standards_data')
 
 try:
     _opaque_dir = os.path.join(_data_dir, 'opaque_material.json')
-    with open(_opaque_dir, 'r') as f:
-        _opaque_standards_dict = json.load(f)
+    _opaque_standards_dict = convert_records(load_json(_opaque_dir), 'opaque_material')
 except FileNotFoundError:
     _opaque_standards_dict = {}
 
 try:
     _window_dir = os.path.join(_data_dir, 'window_material.json')
-    with open(_window_dir, 'r') as f:
-        _window_standards_dict = json.load(f)
+    _window_standards_dict = convert_records(load_json(_window_dir), 'window_material')
 except FileNotFoundError:
     _window_standards_dict = {}
 
@@ -38,10 +42,10 @@ def opaque_material_by_identifier(material_identifier):
     except KeyError:  # material likely needs to be loaded from standards data
         try:
             _mat_dict = _opaque_standards_dict[material_identifier]
-        except KeyError:  # material is nowhere to be found; raise an error
-            raise ValueError(
-                '"{}" was not found in the opaque energy material library.'.format(
-                    material_identifier))
+        except KeyError:  # see if it is a Typical Insulation that can be synthesized
+            _mat_obj = _typical_insulation(material_identifier)
+            _opaque_materials[material_identifier] = _mat_obj
+            return _mat_obj
 
     # create the Python object from the standards gem dictionary
     if _mat_dict['material_type'] == 'StandardOpaqueMaterial':
@@ -56,6 +60,30 @@ def opaque_material_by_identifier(material_identifier):
     return _mat_obj
 
 
+def _typical_insulation(material_identifier):
+    """Synthesize a 'Typical Insulation-R{n}' material from the Typical Insulation.
+
+    The material is the same as those written by the add_typical_insulation
+    function of the _util package, which has a resistance of n h-ft2-F/Btu and
+    the roughness and absorptances of the Typical Insulation.
+
+    Args:
+        material_identifier: A text string for the identifier of the material.
+    """
+    variant = insulation_variant(material_identifier)
+    if variant is None or variant[0] != INSULATION_ID or variant[1] == 0:
+        raise ValueError(
+            '"{}" was not found in the opaque energy material library.'.format(
+                material_identifier))
+    base_mat = opaque_material_by_identifier(INSULATION_ID)
+    _mat_obj = EnergyMaterialNoMass(
+        material_identifier, to_si(variant[1], 'h-ft2-F/Btu'), base_mat.roughness,
+        base_mat.thermal_absorptance, base_mat.solar_absorptance,
+        base_mat.visible_absorptance)
+    _mat_obj.lock()
+    return _mat_obj
+
+
 def window_material_by_identifier(material_identifier):
     """Get an window material from the library given the material identifier.
 
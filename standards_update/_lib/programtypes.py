@@ -1,24 +1,36 @@
 """Extend the honeybee_energy programtypes library."""
 from honeybee_energy.programtype import ProgramType
 from honeybee_energy.lib.programtypes import _program_types
+import honeybee_energy.lib.programtypes as program_lib
+
+# add the from_standards_dict classmethods to the honeybee-energy objects
+import standards_update._extend_honeybee_energy
 
 import os
 import json
 
+from standards_update._lib._loadjson import load_json
+from standards_update._lib._registry import VINTAGES
+from standards_update.extension._units import convert_records
+
 
 # load the standards gem data of program types to Python dictionaries.
 _data_dir = os.path.join(os.path.dirname(__file__), '../_standards_data')
 _prog_dir = os.path.join(_data_dir, 'program_type')
 
-_vintages = ('2019', '2016', '2013', '2010', '2007', '2004', '1980_2004', 'pre_1980')
+_vintages = tuple(reversed(VINTAGES))
 _program_type_standards_dict = {}
 for vintage in _vintages:
     _prog_vintage_dir = os.path.join(_prog_dir, '{}_data.json'.format(vintage))
     try:
-        with open(_prog_vintage_dir, 'r') as f:
-            _program_type_standards_dict.update(json.load(f))
+        _program_type_standards_dict.update(load_json(_prog_vintage_dir, True))
     except FileNotFoundError:
         pass
+_program_type_standards_dict = \
+    convert_records(_program_type_standards_dict, 'program_type')
+
+# dictionary to hold the JSON text of full program type dictionaries once generated
+_program_type_full_dicts = {}
 
 
 def program_type_by_identifier(program_type_identifier):
@@ -41,3 +53,25 @@ def program_type_by_identifier(program_type_identifier):
     _prog_obj.lock()
     _program_types[program_type_identifier] = _prog_obj  # load faster next time
     return _prog_obj
+
+
+def program_type_full_dict(program_type_identifier):
+    """Get the full (non-abridged) dictionary of a program_type with schedules inlined.
+
+    The dictionary is generated once with ProgramType.to_dict(abridged=False) and
+    its JSON text is stored by identifier. Each request returns a new dictionary
+    parsed from this text, which is faster than calling to_dict again and means
+    that the returned dictionary can be edited without affecting other requests.
+    As with any dictionary loaded from JSON, the tuples of to_dict (eg. the values
+    of ScheduleDays) are lists in the returned dictionary.
+
+    Args:
+        program_type_identifier: A text string for the identifier of the ProgramType.
+    """
+    try:  # see if the dictionary has already been generated
+        _prog_text = _program_type_full_dicts[program_type_identifier]
+    except KeyError:
+        _prog_obj = program_lib.program_type_by_identifier(program_type_identifier)
+        _prog_text = json.dumps(_prog_obj.to_dict(abridged=False))
+        _program_type_full_dicts[program_type_identifier] = _prog_text  # faster next time
+    return json.loads(_prog_text)
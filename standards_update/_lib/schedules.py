@@ -4,8 +4,12 @@ from honeybee_energy.schedule.ruleset import ScheduleRuleset
 
 from honeybee_energy.lib.schedules import _schedules
 
+# add the from_standards_dict classmethods to the honeybee-energy objects
+import standards_update._extend_honeybee_energy
+
 import os
-import json
+
+from standards_update._lib._loadjson import load_json
 
 
 # load the standards gem data of schedules to Python dictionaries.
@@ -13,8 +17,7 @@ _data_dir = os.path.join(os.path.dirname(__file__), '../_standards_data')
 
 try:
     _schedule_dir = os.path.join(_data_dir, 'schedule.json')
-    with open(_schedule_dir, 'r') as f:
-        _schedule_standards_dict = json.load(f)
+    _schedule_standards_dict = load_json(_schedule_dir)
 except FileNotFoundError:
     _schedule_standards_dict = {}
 
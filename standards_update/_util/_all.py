@@ -7,11 +7,28 @@ from standards_update._util._schedule import clean_schedules
 from standards_update._util._construction_set import clean_construction_sets
 from standards_update._util._construction import clean_constructions
 from standards_update._util._material import clean_materials
+from standards_update._util._manifest import BuildManifest
+from standards_update._lib._registry import VINTAGES
 
 
-def clean_all(ashrae_directory, dest_dir=None):
+def _gem_folder(vintage):
+    """Get the name of the folder of the standards gem with the data of a vintage."""
+    if vintage.isdigit():
+        return 'ashrae_90_1_{}'.format(vintage)
+    return 'doe_ref_{}'.format(vintage)
+
+
+# the vintages of the standards gem along with the folder in which their data lives
+_VINTAGES = tuple((vintage, _gem_folder(vintage)) for vintage in reversed(VINTAGES))
+
+
+def clean_all(ashrae_directory, dest_dir=None, force=False):
     """Clean and re-export all ashrae 90.1 data from the standards gem.
 
+    A build_manifest.json is written into the dest_dir, which records the hashes
+    of all of the gem input files. On subsequent runs, any vintage whose inputs
+    have not changed since the last run is skipped.
+
     Args:
         ashrae_directory: Directory to the ashrae 90.1 data in the standards gem.
             Typically this is:
@@ -19,100 +36,92 @@ def clean_all(ashrae_directory, dest_dir=None):
                 openstudio-standards/standards/ashrae_90_1/
         dest_dir: Optional path to a destination directory. Default will be the
             _standards_data folder in this package.
+        force: Boolean to note whether all data should be re-cleaned regardless
+            of whether its inputs have changed since the last run. (Default: False).
+
+    Returns:
+        A dictionary reporting which outputs were rebuilt and which were skipped.
     """
     if dest_dir is None:
         current_dir = os.path.dirname(__file__)
         master_dir, util_mod = os.path.split(current_dir)
         dest_dir = os.path.join(master_dir, '_standards_data')
+    manifest = BuildManifest(os.path.join(dest_dir, 'build_manifest.json'), force)
 
     # clean the Schedules
     source_filename = os.path.join(ashrae_directory, 'data', 'ashrae_90_1.schedules.json')
-    clean_schedules(source_filename, dest_dir)
+    dest_file = os.path.join(dest_dir, 'schedule.json')
+    if manifest.is_current('schedule', [source_filename], [dest_file]):
+        manifest.skip('schedule')
+    else:
+        clean_schedules(source_filename, dest_dir)
+        manifest.update('schedule', [source_filename])
 
     # clean the ProgramTypes
-    source_filename_2019 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2019', 'data', 'ashrae_90_1_2019.spc_typ.json')
-    source_filename_2016 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2016', 'data', 'ashrae_90_1_2016.spc_typ.json')
-    source_filename_2013 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2013', 'data', 'ashrae_90_1_2013.spc_typ.json')
-    source_filename_2010 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2010', 'data', 'ashrae_90_1_2010.spc_typ.json')
-    source_filename_2007 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2007', 'data', 'ashrae_90_1_2007.spc_typ.json')
-    source_filename_2004 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2004', 'data', 'ashrae_90_1_2004.spc_typ.json')
-    source_filename_1980_2004 = os.path.join(
-        ashrae_directory, 'doe_ref_1980_2004', 'data', 'doe_ref_1980_2004.spc_typ.json')
-    source_filename_pre_1980 = os.path.join(
-        ashrae_directory, 'doe_ref_pre_1980', 'data', 'doe_ref_pre_1980.spc_typ.json')
-
     dest_dir_prog = os.path.join(dest_dir, 'program_type')
     if not os.path.isdir(dest_dir_prog):
         os.mkdir(dest_dir_prog)
-    clean_space_types(source_filename_2019, dest_dir_prog, vintage='2019')
-    clean_space_types(source_filename_2016, dest_dir_prog, vintage='2016')
-    clean_space_types(source_filename_2013, dest_dir_prog, vintage='2013')
-    clean_space_types(source_filename_2010, dest_dir_prog, vintage='2010')
-    clean_space_types(source_filename_2007, dest_dir_prog, vintage='2007')
-    clean_space_types(source_filename_2004, dest_dir_prog, vintage='2004')
-    clean_space_types(source_filename_1980_2004, dest_dir_prog, vintage='1980_2004')
-    clean_space_types(source_filename_pre_1980, dest_dir_prog, vintage='pre_1980')
+    for vintage, folder in _VINTAGES:
+        source_filename = os.path.join(
+            ashrae_directory, folder, 'data', '{}.spc_typ.json'.format(folder))
+        dest_files = [os.path.join(dest_dir_prog, '{}_{}.json'.format(vintage, f))
+                      for f in ('data', 'registry')]
+        key = 'program_type/{}'.format(vintage)
+        if manifest.is_current(key, [source_filename], dest_files):
+            manifest.skip(key)
+        else:
+            clean_space_types(source_filename, dest_dir_prog, vintage=vintage)
+            manifest.update(key, [source_filename])
 
     # clean the materials JSON
     source_filename = os.path.join(ashrae_directory, 'data', 'ashrae_90_1.materials.json')
-    global_mats = clean_materials(source_filename, dest_dir)
-
-    # clean the constructions JSON
+    global_mats = [os.path.join(dest_dir, '{}_material.json'.format(m))
+                   for m in ('opaque', 'window')]
+    if manifest.is_current('material', [source_filename], global_mats):
+        manifest.skip('material')
+    else:
+        global_mats = clean_materials(source_filename, dest_dir)
+        manifest.update('material', [source_filename])
+
+    # clean the constructions JSON and the ConstructionSets
+    # note that the construction sets add the -R{n} constructions that they need to
+    # the cleaned constructions and so the constructions are re-cleaned along with
+    # all construction sets whenever any of them are out of date, such that the
+    # constructions only hold the variants of the current construction sets
     source_filename = os.path.join(ashrae_directory, 'data', 'ashrae_90_1.constructions.json')
-    global_constrs = clean_constructions(source_filename, dest_dir)
-
-    # clean the ConstructionSets
-    source_filename_2019 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2019', 'data',
-        'ashrae_90_1_2019.construction_properties.json')
-    source_filename_2016 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2016', 'data',
-        'ashrae_90_1_2016.construction_properties.json')
-    source_filename_2013 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2013', 'data',
-        'ashrae_90_1_2013.construction_properties.json')
-    source_filename_2010 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2010', 'data',
-        'ashrae_90_1_2010.construction_properties.json')
-    source_filename_2007 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2007', 'data',
-        'ashrae_90_1_2007.construction_properties.json')
-    source_filename_2004 = os.path.join(
-        ashrae_directory, 'ashrae_90_1_2004', 'data',
-        'ashrae_90_1_2004.construction_properties.json')
-    source_filename_1980_2004 = os.path.join(
-        ashrae_directory, 'doe_ref_1980_2004', 'data',
-        'doe_ref_1980_2004.construction_properties.json')
-    source_filename_pre_1980 = os.path.join(
-        ashrae_directory, 'doe_ref_pre_1980', 'data',
-        'doe_ref_pre_1980.construction_properties.json')
-
+    global_constrs = [os.path.join(dest_dir, '{}_construction.json'.format(c))
+                      for c in ('opaque', 'window')]
+    constr_inputs = [source_filename] + list(global_mats)
     dest_dir_c_set = os.path.join(dest_dir, 'construction_set')
     if not os.path.isdir(dest_dir_c_set):
         os.mkdir(dest_dir_c_set)
-    clean_construction_sets(source_filename_2019, dest_dir_c_set, '2019',
-                            global_constrs[0], global_mats[0])
-    clean_construction_sets(source_filename_2016, dest_dir_c_set, '2016',
-                            global_constrs[0], global_mats[0])
-    clean_construction_sets(source_filename_2013, dest_dir_c_set, '2013',
-                            global_constrs[0], global_mats[0])
-    clean_construction_sets(source_filename_2010, dest_dir_c_set, '2010',
-                            global_constrs[0], global_mats[0])
-    clean_construction_sets(source_filename_2007, dest_dir_c_set, '2007',
-                            global_constrs[0], global_mats[0])
-
-    clean_construction_sets(source_filename_2004, dest_dir_c_set, '2004',
-                            global_constrs[0], global_mats[0])
-    clean_construction_sets(source_filename_1980_2004, dest_dir_c_set, '1980_2004',
-                            global_constrs[0], global_mats[0])
-    clean_construction_sets(source_filename_pre_1980, dest_dir_c_set, 'pre_1980',
-                            global_constrs[0], global_mats[0])
+    c_set_steps = []
+    for vintage, folder in _VINTAGES:
+        c_set_source = os.path.join(
+            ashrae_directory, folder, 'data',
+            '{}.construction_properties.json'.format(folder))
+        dest_file = os.path.join(dest_dir_c_set, '{}_data.json'.format(vintage))
+        c_set_steps.append(
+            ('construction_set/{}'.format(vintage), vintage, c_set_source, dest_file))
+    is_current = manifest.is_current('construction', constr_inputs, global_constrs) \
+        and all(manifest.is_current(key, [c_set_source], [dest_file])
+                for key, _, c_set_source, dest_file in c_set_steps)
+    if is_current:
+        manifest.skip('construction')
+        for key, _, _, _ in c_set_steps:
+            manifest.skip(key)
+    else:
+        global_constrs = clean_constructions(source_filename, dest_dir)
+        for key, vintage, c_set_source, _ in c_set_steps:
+            clean_construction_sets(c_set_source, dest_dir_c_set, vintage,
+                                    global_constrs[0], global_mats[0])
+            manifest.update(key, [c_set_source])
+        # record the constructions once the construction sets have added to them
+        manifest.update('construction', constr_inputs)
+
+    manifest.save()
+    manifest.print_report()
+    return manifest.report
 
 
 def remove_all(dest_dir=None):
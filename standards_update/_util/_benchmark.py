@@ -0,0 +1,303 @@
+# coding=utf-8
+"""Benchmarks for the utilities used to update and load the standards data.
+
+These functions are intended to be run by maintainers to check that the
+performance of the utilities does not regress. Each one prints a short summary
+and returns the measured values.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import tracemalloc
+import subprocess
+
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+
+# add the from_standards_dict classmethods to the honeybee-energy objects
+import standards_update._extend_honeybee_energy
+
+from standards_update._util._json_writer import compact_json_regex, write_compact_json
+from standards_update._lib._shared import SharedCatalog
+from standards_update._lib._loadjson import load_json
+from standards_update._util._paths import package_data_dir
+from standards_update.extension._units import FIELD_UNITS, si_value, \
+    convert_records, release_records
+
+
+def benchmark_json_writer(schedule_json=None, repeat=3):
+    """Compare the streaming JSON writer against the whole-document regex passes.
+
+    Args:
+        schedule_json: Path to a Honeybee schedule JSON to be re-written. If None,
+            the schedule.json in the honeybee_energy_standards folder will be used.
+        repeat: Integer for the number of times to repeat each measurement. The
+            fastest time will be reported. (Default: 3).
+
+    Returns:
+        A dictionary with the seconds taken by the 'regex' and 'streaming'
+        approaches and a boolean for whether the two outputs are 'identical'.
+    """
+    if schedule_json is None:
+        schedule_json = os.path.join(package_data_dir(), 'schedules', 'schedule.json')
+    with open(schedule_json, 'r') as f:
+        data = json.load(f)
+
+    temp_dir = tempfile.mkdtemp()
+    regex_file = os.path.join(temp_dir, 'regex.json')
+    stream_file = os.path.join(temp_dir, 'streaming.json')
+    regex_times, stream_times = [], []
+    for _ in range(repeat):
+        start = time.time()
+        with open(regex_file, 'w') as fp:
+            fp.write(compact_json_regex(data, compact_pairs=True))
+        regex_times.append(time.time() - start)
+        start = time.time()
+        write_compact_json(data, stream_file, compact_pairs=True)
+        stream_times.append(time.time() - start)
+
+    with open(regex_file, 'rb') as f1, open(stream_file, 'rb') as f2:
+        identical = f1.read() == f2.read()
+    os.remove(regex_file)
+    os.remove(stream_file)
+    os.rmdir(temp_dir)
+
+    result = {'regex': min(regex_times), 'streaming': min(stream_times),
+              'identical': identical}
+    print('regex: {:.3f}s  streaming: {:.3f}s  identical: {}'.format(
+        result['regex'], result['streaming'], identical))
+    return result
+
+
+def benchmark_shared_catalog(processes=32, data_dir=None, sample=200):
+    """Compare the memory of worker processes with private and shared catalogs.
+
+    Each worker is a new Python process that runs the _memory_worker module, which
+    does not import honeybee_energy. It either loads its own copy of the standards
+    library or attaches to a SharedCatalog and then reads a sample of program type
+    records. The resident memory of each worker is measured in total from the
+    start of the process, including the Python interpreter.
+
+    Args:
+        processes: Integer for the number of worker processes. (Default: 32).
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the installed
+            honeybee_energy_standards data will be used.
+        sample: Integer for the number of program type records read by
+            each worker. (Default: 200).
+
+    Returns:
+        A dictionary with the following keys.
+
+        -   private -- The total bytes of resident memory of all workers that
+            loaded their own catalog.
+
+        -   shared -- The total bytes of resident memory of all workers that
+            attached to the shared catalog. This counts the pages of the shared
+            block that each worker read, even though they are only in memory once.
+
+        -   shared_pages -- The bytes of the shared block that are included in
+            the shared total across all workers.
+
+        -   shared_size -- The bytes of the shared block, which is in memory
+            once across all workers.
+    """
+    def run_workers(mode, arg):
+        cmd = [sys.executable, '-m', 'standards_update._util._memory_worker',
+               mode, arg, str(sample)]
+        workers = [subprocess.Popen(cmd, stdout=subprocess.PIPE)
+                   for _ in range(processes)]
+        memory = []
+        for worker in workers:
+            out, _ = worker.communicate()
+            if worker.returncode != 0:
+                raise ValueError('Memory worker failed with exit code {}.'.format(
+                    worker.returncode))
+            memory.append(json.loads(out.decode('utf-8')))
+        return memory
+
+    private = run_workers('private', '-' if data_dir is None else data_dir)
+    catalog = SharedCatalog.create(data_dir)
+    try:
+        shared = run_workers('shared', catalog.name)
+        shared_size = catalog.size
+    finally:
+        catalog.close()
+
+    result = {
+        'private': sum(m['rss'] for m in private),
+        'shared': sum(m['rss'] for m in shared),
+        'shared_pages': sum(m['shmem'] for m in shared),
+        'shared_size': shared_size
+    }
+    print('{} workers -- private catalogs: {:.1f} MB  shared catalog: {:.1f} MB '
+          '(of which {:.1f} MB are pages of the {:.1f} MB shared block)'.format(
+              processes, result['private'] / 1e6, result['shared'] / 1e6,
+              result['shared_pages'] / 1e6, shared_size / 1e6))
+    return result
+
+
+def benchmark_schedule_interning(schedule_json):
+    """Measure the memory saved by sharing the values of identical ScheduleDays.
+
+    All schedules of a standards gem schedule JSON are loaded and the bytes of
+    the tuples of values and times of their ScheduleDays are counted once for
+    each unique tuple in memory and once for each ScheduleDay, which is what
+    they would use if each ScheduleDay held its own tuples.
+
+    Args:
+        schedule_json: Path to an OpenStudio standards gem schedule JSON (eg. the
+            OpenStudio_Standards_schedule.json of the standards gem data).
+
+    Returns:
+        A dictionary with the number of 'schedules' and 'day_schedules', the
+        number of 'unique_tuples' of values and times, the 'shared_bytes' and
+        'unshared_bytes' of those tuples, and the total bytes of 'memory'
+        allocated while loading the schedules.
+    """
+    sched_dicts = load_json(schedule_json)
+
+    tracemalloc.start()
+    schedules = [ScheduleRuleset.from_standards_dict(sched_dict)
+                 for sched_dict in sched_dicts.values()]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    day_count, unique, shared_bytes, unshared_bytes = 0, set(), 0, 0
+    for schedule in schedules:
+        for day in schedule.day_schedules:
+            day_count += 1
+            for day_tuple in (day.values, day.times):
+                tuple_bytes = sys.getsizeof(day_tuple)
+                unshared_bytes += tuple_bytes
+                if id(day_tuple) not in unique:
+                    unique.add(id(day_tuple))
+                    shared_bytes += tuple_bytes
+
+    result = {'schedules': len(schedules), 'day_schedules': day_count,
+              'unique_tuples': len(unique), 'shared_bytes': shared_bytes,
+              'unshared_bytes': unshared_bytes, 'memory': memory}
+    print('{} schedules with {} day schedules -- {} of {} value and time tuples are '
+          'unique: {:.1f} KB instead of {:.1f} KB ({:.1f} KB loaded in total)'.format(
+              len(schedules), day_count, len(unique), day_count * 2,
+              shared_bytes / 1e3, unshared_bytes / 1e3, memory / 1e3))
+    return result
+
+
+def _deep_size(obj, seen):
+    """Get the bytes of an object loaded from JSON and all objects it contains.
+
+    Objects that are referenced more than once are only counted once.
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_size(key, seen) + _deep_size(value, seen)
+    elif isinstance(obj, list):
+        for value in obj:
+            size += _deep_size(value, seen)
+    return size
+
+
+def benchmark_interned_json(json_files=None):
+    """Compare the memory of JSON data loaded with and without interned text.
+
+    The memory is the total size of all unique objects in the loaded data, which
+    excludes the table of interned text that is shared by the whole process.
+
+    Args:
+        json_files: A list of paths to JSON files that are loaded into a single
+            dictionary in the same way as the _lib loaders. If None, the data
+            files of the program types and construction sets in the
+            standards_update/_standards_data folder will be used.
+
+    Returns:
+        A dictionary with the bytes of the 'plain' and 'interned' data.
+    """
+    if json_files is None:
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                '_standards_data')
+        json_files = []
+        for sub_folder in ('program_type', 'construction_set'):
+            folder = os.path.join(data_dir, sub_folder)
+            json_files.extend(os.path.join(folder, f) for f in sorted(os.listdir(folder))
+                              if f.endswith('_data.json'))
+
+    result = {}
+    for key, intern_strings in (('plain', False), ('interned', True)):
+        data = {}
+        for json_file in json_files:
+            data.update(load_json(json_file, intern_strings))
+        result[key] = _deep_size(data, set())
+    print('{} files -- plain: {:.2f} MB  interned: {:.2f} MB ({:.0%} smaller)'.format(
+        len(json_files), result['plain'] / 1e6, result['interned'] / 1e6,
+        1 - result['interned'] / float(result['plain'])))
+    return result
+
+
+def benchmark_unit_conversion(data_dir=None, repeat=3):
+    """Compare the batch conversion of standards gem files to per-record conversion.
+
+    Every converted field of every record is checked to be identical between
+    the two approaches.
+
+    Args:
+        data_dir: Path to a folder of standards gem JSONs with the same structure
+            as the standards_update/_standards_data folder. If None, that
+            folder will be used.
+        repeat: Integer for the number of times to repeat each measurement. The
+            fastest time will be reported. (Default: 3).
+
+    Returns:
+        A dictionary with the seconds taken by the 'per_record' and 'batch'
+        approaches for all files, the number of 'values' converted and a list of
+        'mismatches' as tuples of the record type, identifier and field.
+    """
+    if data_dir is None:
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                '_standards_data')
+    files = [('opaque_material', os.path.join(data_dir, 'opaque_material.json')),
+             ('window_material', os.path.join(data_dir, 'window_material.json'))]
+    prog_dir = os.path.join(data_dir, 'program_type')
+    if os.path.isdir(prog_dir):
+        files.extend(('program_type', os.path.join(prog_dir, f))
+                     for f in sorted(os.listdir(prog_dir)) if f.endswith('_data.json'))
+
+    per_record_time, batch_time, value_count, mismatches = 0, 0, 0, []
+    for record_type, file_path in files:
+        try:
+            records = load_json(file_path)
+        except FileNotFoundError:
+            continue
+        field_units = FIELD_UNITS[record_type]
+        record_times, batch_times = [], []
+        for _ in range(repeat):
+            start = time.time()
+            per_record = {}
+            for rec_id, record in records.items():
+                per_record[rec_id] = {
+                    field: si_value(record, field, unit)
+                    for field, unit in field_units.items()
+                    if record.get(field) is not None}
+            record_times.append(time.time() - start)
+            start = time.time()
+            batch = convert_records(records, record_type)
+            batch_times.append(time.time() - start)
+            release_records(batch)
+        per_record_time += min(record_times)
+        batch_time += min(batch_times)
+        for rec_id, values in per_record.items():
+            for field, value in values.items():
+                value_count += 1
+                if batch[rec_id][field] != value:
+                    mismatches.append((record_type, rec_id, field))
+
+    result = {'per_record': per_record_time, 'batch': batch_time,
+              'values': value_count, 'mismatches': mismatches}
+    print('{} values -- per record: {:.4f}s  batch: {:.4f}s  mismatches: {}'.format(
+        value_count, per_record_time, batch_time, len(mismatches)))
+    return result
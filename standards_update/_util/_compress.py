@@ -0,0 +1,101 @@
+# coding=utf-8
+"""Compress the JSON data files and write checksum manifests for them."""
+import os
+import gzip
+import bz2
+import lzma
+import hashlib
+
+from standards_update._lib._loadjson import COMPRESSED_FORMATS, CHECKSUM_FILE
+
+# functions to compress the contents of a JSON using each of the supported formats
+_COMPRESSORS = {
+    '.gz': lambda content: gzip.compress(content, 9, mtime=0),
+    '.xz': lambda content: lzma.compress(content, preset=9),
+    '.bz2': lambda content: bz2.compress(content, 9)
+}
+
+
+def is_data_file(file_name):
+    """Check whether a file name is that of a JSON data file or its checksum manifest.
+
+    Args:
+        file_name: Text for the name of a file.
+    """
+    if file_name == CHECKSUM_FILE or file_name.endswith('.json'):
+        return True
+    base_name, ext = os.path.splitext(file_name)
+    return ext in COMPRESSED_FORMATS and base_name.endswith('.json')
+
+
+def write_checksums(folder):
+    """Write a checksums.sha256 manifest for all data files in a folder.
+
+    The manifest uses the same format as the sha256sum command line utility.
+
+    Args:
+        folder: Path to a folder containing JSON files (compressed or not).
+
+    Returns:
+        The path to the checksum manifest. Will be None if the folder contains
+        no data files, in which case no manifest is written.
+    """
+    lines = []
+    for file_name in sorted(os.listdir(folder)):
+        file_path = os.path.join(folder, file_name)
+        if file_name != CHECKSUM_FILE and is_data_file(file_name) and \
+                os.path.isfile(file_path):
+            with open(file_path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            lines.append('{}  {}\n'.format(digest, file_name))
+    if len(lines) == 0:
+        return None
+    manifest = os.path.join(folder, CHECKSUM_FILE)
+    with open(manifest, 'w') as fp:
+        fp.write(''.join(lines))
+    return manifest
+
+
+def compress_data(data_dir, compression='.gz', remove_json=True):
+    """Compress all JSON files in a data folder and write checksum manifests.
+
+    Files compressed in this way can be loaded with the load_json function
+    of standards_update._lib._loadjson, which decompresses them transparently.
+    Note that honeybee-energy itself only loads uncompressed JSON files from
+    standards folders and so remove_json should be False for any data that
+    honeybee-energy must load directly.
+
+    Args:
+        data_dir: Path to a folder of JSON data (eg. honeybee_energy_standards).
+            All JSON files in this folder and its sub-folders will be compressed.
+        compression: Text for the extension of the compression format to use.
+            Choose from '.gz', '.xz', '.bz2'. (Default: '.gz').
+        remove_json: Boolean to note whether the uncompressed JSON files should
+            be deleted after they are compressed. (Default: True).
+
+    Returns:
+        A list of the paths to the compressed files.
+    """
+    assert compression in _COMPRESSORS, 'Compression "{}" is not one of {}.'.format(
+        compression, tuple(_COMPRESSORS.keys()))
+    compressor = _COMPRESSORS[compression]
+    compressed_files = []
+    for folder, _, file_names in os.walk(data_dir):
+        for file_name in file_names:
+            if not file_name.endswith('.json'):
+                continue
+            json_path = os.path.join(folder, file_name)
+            with open(json_path, 'rb') as f:
+                content = f.read()
+            comp_path = json_path + compression
+            with open(comp_path, 'wb') as fp:
+                fp.write(compressor(content))
+            compressed_files.append(comp_path)
+            if remove_json:
+                os.remove(json_path)
+            for ext in COMPRESSED_FORMATS:  # remove other formats of the same file
+                other_path = json_path + ext
+                if ext != compression and os.path.isfile(other_path):
+                    os.remove(other_path)
+        write_checksums(folder)
+    return compressed_files
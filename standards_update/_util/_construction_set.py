@@ -6,6 +6,9 @@ import math
 import os
 import json
 
+from standards_update._lib._envelope import INSULATION_ID, material_resistance, \
+    insulation_r_value
+
 
 def clean_construction_sets(source_filename, dest_directory, vintage,
                             construction_filename, material_filename):
@@ -281,22 +284,25 @@ def adjust_typical_insulation(base_constr_dict, construction_dict, material_dict
     # get the starting construction to work from and calculate its R-value
     orig_constr_id = base_constr_dict['construction']
     start_constr = construction_dict[orig_constr_id]
-    base_r = sum(material_dict[mat]['resistance'] for mat in start_constr['materials'])
-
-    # calculate the R-value needed by the insulation
-    target_r = int(math.ceil(compliant_r_val - base_r))
-    if target_r == 0:
+    base_r = sum(material_resistance(material_dict[mat])
+                 for mat in start_constr['materials'])
+
+    # calculate the R-value needed by the insulation to meet the rounded target,
+    # which is all that the identifier records and so all that synthesis can use
+    compliant_r_val = int(math.ceil(compliant_r_val))
+    target_r = insulation_r_value(compliant_r_val, base_r)
+    if target_r <= 0:
         return base_constr_dict['construction']
-    new_constr_id = '{}-R{}'.format(orig_constr_id, math.ceil(compliant_r_val))
+    new_constr_id = '{}-R{}'.format(orig_constr_id, compliant_r_val)
 
     # add the new construction to the global construction_dict if necessary
     if new_constr_id not in construction_dict:
         new_constr = start_constr.copy()
         new_constr['name'] = new_constr_id
-        insul_id = 'Typical Insulation-R{}'.format(target_r)
-        assert 'Typical Insulation' in new_constr['materials'], \
+        insul_id = '{}-R{}'.format(INSULATION_ID, target_r)
+        assert INSULATION_ID in new_constr['materials'], \
             'Typical Insulation must be in a construction in order to adjust it.'
-        new_constr['materials'] = [mat if mat != 'Typical Insulation' else insul_id
+        new_constr['materials'] = [mat if mat != INSULATION_ID else insul_id
                                    for mat in new_constr['materials']]
         construction_dict[new_constr_id] = new_constr
 
@@ -0,0 +1,229 @@
+# coding=utf-8
+"""Compare the program types and construction sets of two vintages of standards data.
+
+Records are aligned across vintages by the part of their identifier after the
+vintage, which is the building type and space type for program types
+(eg. 'LargeOffice::OpenOffice') and the climate zone and construction type for
+construction sets (eg. 'ClimateZone4::SteelFramed').
+
+The deltas are computed over the flattened dictionaries in plain Python. The
+fields of each pair of records differ in their keys and mix numbers with text
+(eg. schedule and construction identifiers), so aligning them into arrays would
+cost about as much as comparing them. Comparing all eight vintages takes about
+0.03 s of the 0.17 s of the whole diff, where most of the time goes to loading
+the data. The envelope properties are computed once per data folder.
+"""
+import os
+import json
+
+from standards_update._lib._loadjson import load_json
+from standards_update._lib._envelope import OpaqueResistances
+from standards_update._lib._window_index import WindowConstructionIndex
+from standards_update._lib._registry import VINTAGES
+from standards_update._util._paths import package_data_dir
+
+# keys of Honeybee dictionaries that are never compared
+_SKIP_KEYS = ('type', 'identifier', 'display_name', 'user_data')
+
+
+def _flatten(obj_dict, prefix=''):
+    """Flatten a Honeybee dictionary into a dictionary of '.' separated fields."""
+    fields = {}
+    for key, val in obj_dict.items():
+        if key in _SKIP_KEYS:
+            continue
+        field = '{}{}'.format(prefix, key)
+        if isinstance(val, dict):
+            fields.update(_flatten(val, field + '.'))
+        elif isinstance(val, (int, float, str)) and not isinstance(val, bool):
+            fields[field] = val
+    return fields
+
+
+def envelope_properties(data_dir=None):
+    """Get the envelope performance of all constructions in a standards library.
+
+    Args:
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the honeybee_energy_standards
+            folder of this repo will be used.
+
+    Returns:
+        A dictionary with construction identifiers as keys and dictionaries of
+        envelope properties as values. Opaque constructions have an 'r_value'
+        and 'u_factor' while window constructions have a 'u_factor', 'shgc'
+        and 'vt'. All values are in SI units.
+    """
+    if data_dir is None:
+        data_dir = package_data_dir()
+    opaque = OpaqueResistances.from_data_folder(data_dir)
+    u_factors = opaque.u_factors()
+    props = {c_id: {'r_value': r_val, 'u_factor': u_factors[c_id]}
+             for c_id, r_val in opaque.r_values().items()}
+    window = WindowConstructionIndex.from_data_folder(data_dir)
+    cols = window.columns
+    for i, c_id in enumerate(window.identifiers):
+        props[c_id] = {'u_factor': cols['u_factor'][i], 'shgc': cols['shgc'][i],
+                       'vt': cols['visible_transmittance'][i]}
+    return props
+
+
+def _program_type_fields(data_dir, vintage):
+    """Get the comparable fields of all program types of a vintage."""
+    p_file = os.path.join(data_dir, 'programtypes', '{}_data.json'.format(vintage))
+    return {p_id.split('::', 1)[1]: _flatten(p_dict)
+            for p_id, p_dict in load_json(p_file).items()}
+
+
+def _construction_set_fields(data_dir, vintage, envelope):
+    """Get the comparable fields of all construction sets of a vintage."""
+    c_file = os.path.join(data_dir, 'constructionsets', '{}_data.json'.format(vintage))
+    c_sets = {}
+    for c_id, c_dict in load_json(c_file).items():
+        fields = {}
+        for field, constr_id in _flatten(c_dict).items():
+            fields[field] = constr_id
+            for prop, val in envelope.get(constr_id, {}).items():
+                fields['{}.{}'.format(field, prop)] = val
+        c_sets[c_id.split('::', 1)[1]] = fields
+    return c_sets
+
+
+def _compare(base_records, other_records):
+    """Compare two dictionaries of flattened records that are aligned by key."""
+    changed = {}
+    for key in base_records:
+        if key not in other_records:
+            continue
+        base, other = base_records[key], other_records[key]
+        deltas = {}
+        for field in sorted(set(base) | set(other)):
+            b_val, o_val = base.get(field), other.get(field)
+            if b_val == o_val:
+                continue
+            numeric = isinstance(b_val, (int, float)) and isinstance(o_val, (int, float))
+            deltas[field] = {
+                'base': b_val, 'other': o_val,
+                'delta': o_val - b_val if numeric else None
+            }
+        if deltas:
+            changed[key] = deltas
+    return {
+        'added': sorted(k for k in other_records if k not in base_records),
+        'removed': sorted(k for k in base_records if k not in other_records),
+        'changed': changed
+    }
+
+
+def diff_vintages(base_vintage, other_vintage, base_dir=None, other_dir=None):
+    """Compare the program types and construction sets of two vintages.
+
+    Args:
+        base_vintage: Text for the vintage to compare against (eg. '2016').
+        other_vintage: Text for the vintage to be compared (eg. '2019').
+        base_dir: Path to the folder of Honeybee JSONs containing the base_vintage.
+            If None, the honeybee_energy_standards folder of this repo will be used.
+        other_dir: Path to the folder of Honeybee JSONs containing the other_vintage,
+            which can be used to compare the same vintage across two releases of
+            the data. If None, it will be the same as the base_dir.
+
+    Returns:
+        A dictionary describing the differences with the following keys.
+
+        -   base -- The base_vintage.
+
+        -   other -- The other_vintage.
+
+        -   program_types -- A dictionary with 'added', 'removed' and 'changed'
+            keys. The 'added' and 'removed' are lists of aligned keys
+            (eg. 'LargeOffice::OpenOffice'). The 'changed' is a dictionary with
+            aligned keys and dictionaries of changed fields as values. Each
+            changed field (eg. 'lighting.watts_per_area') has a dictionary
+            with the 'base' and 'other' values along with the 'delta' between
+            them, which is None for non-numeric fields like schedules.
+
+        -   construction_sets -- A dictionary with the same structure as the
+            program_types, where the fields include the constructions of the
+            set along with their envelope properties
+            (eg. 'wall_set.exterior_construction.u_factor').
+    """
+    base_dir = package_data_dir() if base_dir is None else base_dir
+    other_dir = base_dir if other_dir is None else other_dir
+    base_env = envelope_properties(base_dir)
+    other_env = base_env if other_dir == base_dir else envelope_properties(other_dir)
+    return _diff_records(base_vintage, other_vintage, base_dir, other_dir,
+                         base_env, other_env)
+
+
+def _diff_records(base_vintage, other_vintage, base_dir, other_dir,
+                  base_env, other_env):
+    """Compare two vintages given the envelope properties of their data folders."""
+    return {
+        'base': base_vintage,
+        'other': other_vintage,
+        'program_types': _compare(
+            _program_type_fields(base_dir, base_vintage),
+            _program_type_fields(other_dir, other_vintage)),
+        'construction_sets': _compare(
+            _construction_set_fields(base_dir, base_vintage, base_env),
+            _construction_set_fields(other_dir, other_vintage, other_env))
+    }
+
+
+def diff_summary(diff):
+    """Get a text table summarizing the numeric changes in a diff.
+
+    Args:
+        diff: A dictionary of differences produced by the diff_vintages function.
+
+    Returns:
+        Text for a table with one row per changed numeric field, giving the
+        number of records in which it changed along with the smallest, mean
+        and largest delta.
+    """
+    lines = ['{} -> {}'.format(diff['base'], diff['other'])]
+    row = '  {:<58} {:>5} {:>12} {:>12} {:>12}'
+    for obj_type in ('program_types', 'construction_sets'):
+        obj_diff = diff[obj_type]
+        lines.append('{}: {} changed, {} added, {} removed'.format(
+            obj_type, len(obj_diff['changed']), len(obj_diff['added']),
+            len(obj_diff['removed'])))
+        deltas = {}
+        for fields in obj_diff['changed'].values():
+            for field, change in fields.items():
+                if change['delta'] is not None:
+                    deltas.setdefault(field, []).append(change['delta'])
+        if deltas:
+            lines.append(row.format('field', 'count', 'min', 'mean', 'max'))
+        for field in sorted(deltas):
+            vals = deltas[field]
+            lines.append(row.format(
+                field, len(vals), '{:.6g}'.format(min(vals)),
+                '{:.6g}'.format(sum(vals) / len(vals)), '{:.6g}'.format(max(vals))))
+    return '\n'.join(lines)
+
+
+def diff_all_vintages(data_dir=None, dest_file=None):
+    """Compare each vintage of a standards library to the vintage before it.
+
+    Args:
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the honeybee_energy_standards
+            folder of this repo will be used.
+        dest_file: Optional path to a JSON file into which the list of diffs
+            will be written.
+
+    Returns:
+        A list of the diff dictionaries produced by diff_vintages for each pair
+        of consecutive vintages.
+    """
+    data_dir = package_data_dir() if data_dir is None else data_dir
+    envelope = envelope_properties(data_dir)
+    diffs = [_diff_records(base, other, data_dir, data_dir, envelope, envelope)
+             for base, other in zip(VINTAGES[:-1], VINTAGES[1:])]
+    for diff in diffs:
+        print(diff_summary(diff))
+    if dest_file is not None:
+        with open(dest_file, 'w') as fp:
+            json.dump(diffs, fp, indent=2)
+    return diffs
@@ -0,0 +1,116 @@
+# coding=utf-8
+"""Find and remove the stored insulation variants that can be synthesized on demand.
+
+The clean_construction_sets function writes a '{construction}-R{n}' construction
+for every insulation criteria of the standards along with the 'Typical
+Insulation-R{n}' materials that they use. The opaque construction and material
+loaders of the _lib package can synthesize these from their base construction
+whenever they are requested. Both use the rounded R-value in the identifier of
+the variant to pick the insulation, so a stored variant is identical to the
+synthesized one as long as its base construction and materials are unchanged.
+This is checked for each variant before it is removed such that removing them
+never changes the construction sets.
+"""
+import os
+import json
+
+from standards_update._lib._envelope import INSULATION_ID, material_resistance, \
+    insulation_variant, insulation_r_value
+from standards_update.extension._units import to_ip
+
+
+def find_insulation_variants(construction_dict, material_dict):
+    """Find the insulation variants that are identical to synthesized constructions.
+
+    Args:
+        construction_dict: A dictionary of opaque constructions with identifiers
+            as keys. These can either be standards gem or Honeybee dictionaries.
+        material_dict: A dictionary of the opaque materials used by the
+            constructions in the same format and units as the constructions.
+            The R-values of the constructions are computed in IP units so Honeybee
+            dictionaries are converted from SI.
+
+    Returns:
+        A tuple with two elements.
+
+        -   constructions: A sorted list of the identifiers of the '-R{n}'
+            constructions that can be synthesized.
+
+        -   materials: A sorted list of the identifiers of the 'Typical
+            Insulation-R{n}' materials that are not used by any other construction.
+    """
+    is_si = _is_honeybee(material_dict)
+    variants = []
+    for constr_id, constr in construction_dict.items():
+        variant = insulation_variant(constr_id)
+        if variant is None or variant[0] not in construction_dict:
+            continue
+        base_mats = construction_dict[variant[0]]['materials']
+        if INSULATION_ID not in base_mats:
+            continue
+        base_r = sum(material_resistance(material_dict[mat]) for mat in base_mats)
+        if is_si:
+            base_r = to_ip(base_r, 'h-ft2-F/Btu')
+        insul_r = insulation_r_value(variant[1], base_r)
+        insul_id = '{}-R{}'.format(INSULATION_ID, insul_r)
+        if insul_r > 0 and constr['materials'] == \
+                [mat if mat != INSULATION_ID else insul_id for mat in base_mats]:
+            variants.append(constr_id)
+
+    # find the insulation materials that are only used by the removed constructions
+    removed = set(variants)
+    used = set()
+    for constr_id, constr in construction_dict.items():
+        if constr_id not in removed:
+            used.update(constr['materials'])
+    materials = []
+    for mat_id in material_dict:
+        variant = insulation_variant(mat_id)
+        if variant is not None and variant[0] == INSULATION_ID and mat_id not in used:
+            materials.append(mat_id)
+    return sorted(variants), sorted(materials)
+
+
+def _is_honeybee(material_dict):
+    """Check whether a material dictionary is in Honeybee format with SI units."""
+    for mat in material_dict.values():
+        return 'identifier' in mat
+    return False
+
+
+def remove_insulation_variants(construction_filename, material_filename, remove=False):
+    """Report and optionally remove the insulation variants that can be synthesized.
+
+    Note that the Honeybee JSONs of honeybee_energy_standards are loaded by the
+    honeybee-energy lib, which does not synthesize the insulation variants. So
+    these should only be removed from those files when the lib is extended with
+    the _lib loaders of this package.
+
+    Args:
+        construction_filename: File path to the clean opaque construction JSON.
+        material_filename: File path to the clean opaque material JSON.
+        remove: Boolean to note whether the variants should be removed from the
+            JSON files. If False, they will only be reported. (Default: False).
+
+    Returns:
+        A dictionary with the file paths as keys and a sorted list of the
+        identifiers of the variants that can be synthesized in each file as values.
+    """
+    with open(construction_filename, 'r') as f:
+        constr_dict = json.load(f)
+    with open(material_filename, 'r') as f:
+        mat_dict = json.load(f)
+    constr_ids, mat_ids = find_insulation_variants(constr_dict, mat_dict)
+
+    variants = {construction_filename: constr_ids, material_filename: mat_ids}
+    for f_path, obj_dict in ((construction_filename, constr_dict),
+                             (material_filename, mat_dict)):
+        print('{}: {} insulation variants can be synthesized'.format(
+            os.path.basename(f_path), len(variants[f_path])))
+        if not remove or len(variants[f_path]) == 0:
+            continue
+        for obj_id in variants[f_path]:
+            del obj_dict[obj_id]
+        with open(f_path, 'w') as fp:
+            json.dump(obj_dict, fp, indent=2)
+    return variants
@@ -0,0 +1,133 @@
+# coding=utf-8
+"""Write JSON files with lists of numbers un-indented for readability and file size.
+
+The layout written here matches what used to be produced by dumping the whole
+dictionary with json.dumps(indent=2) and then running several whole-document
+re.sub passes over the result. However, it is written record by record such that
+the full output string never has to exist in memory. The regex implementation is
+kept in compact_json_regex as a reference for the layout.
+"""
+import re
+import json
+
+_DOT_FLOAT = re.compile(r'-?\d*\.\d*$')
+
+
+def compact_json_regex(data, compact_pairs=False):
+    """Get a compact JSON string using the original whole-document regex passes.
+
+    Note that, unlike write_compact_json, these passes do not distinguish JSON
+    syntax from text inside of strings and so they can alter strings that contain
+    brackets or numbers followed by commas.
+
+    Args:
+        data: A JSON-serializable dictionary.
+        compact_pairs: Boolean to note whether lists of two integers (eg. the
+            times of a ScheduleDay) should also be written on a single line.
+    """
+    init_str = json.dumps(data, indent=2)
+    new_str = re.sub(r'\s*(\d*\.\d*),\s*', r'\1, ', init_str)
+    right_bracket_str = re.sub(r'\s*(])', r'\1', new_str)
+    left_bracket_str = re.sub(r'(\[)\s*', r'\1', right_bracket_str)
+    if not compact_pairs:
+        return left_bracket_str
+    newer_str = re.sub(r'\[(.\d*),\s*(.\d*)\],\s*', r'[\1, \2], ', left_bracket_str)
+    return re.sub(r'\[(.\d*),\s*(.\d*)\]', r'[\1, \2]', newer_str)
+
+
+def write_compact_json(data, dest_file, compact_pairs=False):
+    """Write a dictionary to a JSON file with all lists of numbers un-indented.
+
+    The dictionary is written one top-level record at a time.
+
+    Args:
+        data: A JSON-serializable dictionary.
+        dest_file: Path to the JSON file to be written.
+        compact_pairs: Boolean to note whether lists of two integers (eg. the
+            times of a ScheduleDay) should also be written on a single line.
+    """
+    with open(dest_file, 'w') as fp:
+        for chunk in iter_compact_json(data, compact_pairs):
+            fp.write(chunk)
+
+
+def iter_compact_json(data, compact_pairs=False):
+    """Yield the compact JSON string of a dictionary one top-level record at a time.
+
+    Args:
+        data: A JSON-serializable dictionary.
+        compact_pairs: Boolean to note whether lists of two integers (eg. the
+            times of a ScheduleDay) should also be written on a single line.
+    """
+    if not isinstance(data, dict) or len(data) == 0:
+        yield _encode(data, 0, compact_pairs)
+        return
+    yield '{'
+    items = list(data.items())
+    for i, (key, value) in enumerate(items):
+        yield _encode_member(items, i, key, value, 0, compact_pairs)
+    yield '\n}'
+
+
+def _is_dot_float(value):
+    """Check if a value is a float that is written with a decimal and no exponent."""
+    return isinstance(value, float) and _DOT_FLOAT.match(repr(value)) is not None
+
+
+def _is_int_pair(value):
+    """Check if a value is a list of two integers."""
+    return isinstance(value, (list, tuple)) and len(value) == 2 and \
+        all(isinstance(v, int) and not isinstance(v, bool) for v in value)
+
+
+def _joins_next(value, compact_pairs):
+    """Check if a value followed by a comma pulls the next value onto its line."""
+    return _is_dot_float(value) or (compact_pairs and _is_int_pair(value))
+
+
+def _pulls_back(value):
+    """Check if a value followed by a comma is pulled onto the previous line."""
+    return _is_dot_float(value) and not repr(value).startswith('-')
+
+
+def _encode_member(items, i, key, value, depth, compact_pairs):
+    """Encode a key: value member of a dictionary with its leading separator."""
+    has_next = i != len(items) - 1
+    if i != 0 and _joins_next(items[i - 1][1], compact_pairs):
+        lead = ', '
+    else:
+        lead = ',\n' if i != 0 else '\n'
+        lead += '  ' * (depth + 1)
+    colon = ':' if has_next and _pulls_back(value) else ': '
+    return '{}{}{}{}'.format(
+        lead, json.dumps(key), colon, _encode(value, depth + 1, compact_pairs))
+
+
+def _encode(value, depth, compact_pairs):
+    """Encode a value that sits at a given depth in the JSON."""
+    if isinstance(value, dict):
+        if len(value) == 0:
+            return '{}'
+        items = list(value.items())
+        members = [_encode_member(items, i, key, val, depth, compact_pairs)
+                   for i, (key, val) in enumerate(items)]
+        return '{{{}\n{}}}'.format(''.join(members), '  ' * depth)
+    elif isinstance(value, (list, tuple)):
+        if len(value) == 0:
+            return '[]'
+        if compact_pairs and _is_int_pair(value):
+            return '[{}, {}]'.format(value[0], value[1])
+        indent = '  ' * (depth + 1)
+        parts = []
+        last_i = len(value) - 1
+        for i, val in enumerate(value):
+            if i != 0:
+                if _joins_next(value[i - 1], compact_pairs):
+                    parts.append(', ')
+                elif i != last_i and _pulls_back(val):
+                    parts.append(',')
+                else:
+                    parts.append(',\n' + indent)
+            parts.append(_encode(val, depth + 1, compact_pairs))
+        return '[{}]'.format(''.join(parts))
+    return json.dumps(value)
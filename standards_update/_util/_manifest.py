@@ -0,0 +1,172 @@
+# coding=utf-8
+"""Build manifest used to incrementally rebuild the standards data."""
+import os
+import json
+import hashlib
+
+
+def file_hash(file_paths):
+    """Get a single SHA-256 hex digest for the contents of one or more files.
+
+    Args:
+        file_paths: A list of file paths to be hashed together. Files that do
+            not exist contribute their path to the hash such that a missing
+            file is distinguishable from an empty one.
+    """
+    hasher = hashlib.sha256()
+    for f_path in file_paths:
+        if os.path.isfile(f_path):
+            with open(f_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    hasher.update(chunk)
+        else:
+            hasher.update('missing:{}'.format(os.path.basename(f_path)).encode('utf-8'))
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+def source_hash(folder):
+    """Get a single SHA-256 hex digest for all of the Python sources in a folder.
+
+    This can be used in the environment of a BuildManifest such that all outputs
+    are rebuilt whenever the code that produces them changes.
+
+    Args:
+        folder: Path to a folder of Python modules. The .py files of all of its
+            sub-folders are hashed along with their paths relative to the folder.
+    """
+    sources = []
+    for root, _, files in os.walk(folder):
+        for f_name in files:
+            if f_name.endswith('.py'):
+                sources.append(os.path.relpath(os.path.join(root, f_name), folder))
+    hasher = hashlib.sha256()
+    for rel_path in sorted(sources):
+        hasher.update(rel_path.replace(os.sep, '/').encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(file_hash([os.path.join(folder, rel_path)]).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def record_hash(record):
+    """Get a SHA-256 hex digest for a JSON-serializable record."""
+    record_str = json.dumps(record, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(record_str.encode('utf-8')).hexdigest()
+
+
+class BuildManifest(object):
+    """A record of the input hashes that produced each output of the build.
+
+    Args:
+        manifest_path: Path to the manifest JSON. It does not have to exist yet.
+        force: Boolean to note whether every check against the manifest should
+            report the outputs as out of date. (Default: False).
+        environment: Optional dictionary of values that, if changed since the
+            last build, invalidate the whole manifest (eg. the honeybee-energy
+            version used to translate the records). (Default: None).
+
+    Properties:
+        * manifest_path
+        * force
+        * report
+    """
+
+    def __init__(self, manifest_path, force=False, environment=None):
+        self.manifest_path = manifest_path
+        self.force = force
+        self._env = environment or {}
+        self._files = {}
+        self._records = {}
+        if os.path.isfile(manifest_path):
+            with open(manifest_path, 'r') as f:
+                data = json.load(f)
+            if data.get('environment', {}) == self._env:
+                self._files = data.get('files', {})
+                self._records = data.get('records', {})
+        self.report = {'rebuilt': [], 'skipped': [], 'records_rebuilt': {}}
+
+    def is_current(self, key, input_paths, output_paths):
+        """Check whether the outputs of a build step are up to date.
+
+        Args:
+            key: Text for the unique name of the build step.
+            input_paths: A list of the files that the build step reads.
+            output_paths: A list of the files that the build step writes.
+
+        Returns:
+            True if the step can be skipped. False if it must be re-run.
+        """
+        if self.force:
+            return False
+        if not all(os.path.isfile(out_path) for out_path in output_paths):
+            return False
+        return self._files.get(key) == file_hash(input_paths)
+
+    def update(self, key, input_paths):
+        """Record the current hash of the inputs of a build step that was just re-run.
+
+        Args:
+            key: Text for the unique name of the build step.
+            input_paths: A list of the files that the build step read.
+        """
+        self._files[key] = file_hash(input_paths)
+        self.report['rebuilt'].append(key)
+
+    def skip(self, key):
+        """Note that a build step was skipped because its outputs were current."""
+        self.report['skipped'].append(key)
+
+    def record_is_current(self, key, identifier, record):
+        """Check whether a record is unchanged since it was last translated.
+
+        Args:
+            key: Text for the unique name of the file containing the record.
+            identifier: Text for the identifier of the record.
+            record: The JSON-serializable source record.
+        """
+        if self.force:
+            return False
+        try:
+            return self._records[key][identifier] == record_hash(record)
+        except KeyError:
+            return False
+
+    def update_records(self, key, records, rebuilt_ids):
+        """Replace the record hashes of a file with those of its current records.
+
+        Args:
+            key: Text for the unique name of the file containing the records.
+            records: A dictionary of all source records in the file.
+            rebuilt_ids: A list of identifiers for the records that were rebuilt.
+        """
+        self._records[key] = {r_id: record_hash(rec) for r_id, rec in records.items()}
+        if len(rebuilt_ids) != 0:
+            self.report['records_rebuilt'][key] = list(rebuilt_ids)
+
+    def save(self):
+        """Write the manifest to its manifest_path."""
+        data = {
+            'environment': self._env,
+            'files': self._files,
+            'records': self._records
+        }
+        with open(self.manifest_path, 'w') as fp:
+            json.dump(data, fp, indent=2, sort_keys=True)
+
+    def print_report(self):
+        """Print a summary of what was rebuilt and what was skipped."""
+        print('Rebuilt {} of {} outputs.'.format(
+            len(self.report['rebuilt']),
+            len(self.report['rebuilt']) + len(self.report['skipped'])))
+        for key in self.report['rebuilt']:
+            rec_count = len(self.report['records_rebuilt'].get(key, ()))
+            if rec_count != 0:
+                print('  rebuilt: {} ({} records)'.format(key, rec_count))
+            else:
+                print('  rebuilt: {}'.format(key))
+
+    def ToString(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'BuildManifest: {}'.format(self.manifest_path)
@@ -100,9 +100,6 @@ def add_typical_insulation(opaque_mat_dict):
     for r_val in range(1, 61):
         new_dict_name = '{}-R{}'.format(typical_insulation['name'], r_val)
         new_dict = typical_insulation.copy()
-        del new_dict['thermal_absorptance']
-        del new_dict['solar_absorptance']
-        del new_dict['visible_absorptance']
         new_dict['name'] = new_dict_name
         new_dict['resistance'] = r_val
         opaque_mat_dict[new_dict_name] = new_dict
@@ -0,0 +1,81 @@
+# coding=utf-8
+"""Worker process used to measure the memory of reading the standards data.
+
+Each worker is a new Python process that is started with:
+
+    python -m standards_update._util._memory_worker private|shared ARG SAMPLE
+
+For 'private', ARG is the path to the data folder (or '-' for the installed data)
+and the worker loads its own copy of the library. For 'shared', ARG is the name of
+the shared memory block of a SharedCatalog that the worker attaches to. In both
+cases, the worker reads SAMPLE program type records and prints a JSON object with
+the memory of the whole process. This module only imports the catalog modules of
+the _lib package such that the memory is not inflated by honeybee_energy.
+"""
+import sys
+import json
+
+from standards_update._lib._catalog import load_catalog
+from standards_update._lib._shared import SharedCatalog
+
+
+def process_memory():
+    """Get a dictionary of the resident memory of the current process in bytes.
+
+    On Linux, this includes the total resident memory ('rss'), the peak resident
+    memory ('peak') and the part of the resident memory that is in shared memory
+    blocks ('shmem'). On other platforms, only the peak resident memory is known
+    and it is used for both 'rss' and 'peak' while 'shmem' is zero.
+    """
+    fields = {'VmRSS:': 'rss', 'VmHWM:': 'peak', 'RssShmem:': 'shmem'}
+    memory = {}
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                key = line.split(None, 1)[0]
+                if key in fields:
+                    memory[fields[key]] = int(line.split()[1]) * 1024
+    except (IOError, OSError):
+        pass
+    if len(memory) != len(fields):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        memory = {'rss': peak, 'peak': peak, 'shmem': 0}
+    return memory
+
+
+def read_catalog(mode, arg, sample):
+    """Read a sample of program type records from a private or shared catalog.
+
+    Args:
+        mode: Text for the type of catalog. Either 'private' or 'shared'.
+        arg: Text for the data folder of a 'private' catalog ('-' for the
+            installed data) or the shared memory name of a 'shared' catalog.
+        sample: Integer for the number of program type records to read.
+
+    Returns:
+        A dictionary of the memory of the process after reading the records,
+        which is produced by the process_memory function, with an additional
+        'records' key for the number of records that were read.
+    """
+    if mode == 'private':
+        catalog = load_catalog(None if arg == '-' else arg)
+        p_types = [catalog['program_type'][p_id]
+                   for p_id in list(catalog['program_type'])[:sample]]
+    elif mode == 'shared':
+        catalog = SharedCatalog.attach(arg)
+        p_types = [catalog.record('program_type', p_id)
+                   for p_id in list(catalog['program_type'])[:sample]]
+    else:
+        raise ValueError('Catalog mode "{}" is not recognized. Choose from: '
+                         'private, shared.'.format(mode))
+    # the decoded records are kept alive until the memory is measured
+    memory = process_memory()
+    memory['records'] = len(p_types)
+    if mode == 'shared':
+        catalog.close()
+    return memory
+
+
+if __name__ == '__main__':
+    print(json.dumps(read_catalog(sys.argv[1], sys.argv[2], int(sys.argv[3]))))
@@ -0,0 +1,60 @@
+# coding=utf-8
+"""Paths and reference helpers shared by the utilities that check the standards data.
+
+This module does not import honeybee_energy or any of the other utilities such
+that the quick checks of the data (eg. the validator) can be imported cheaply.
+It is the single home of the data folder path and of the reference helpers that
+_validate, _unused, _benchmark and _diff share.
+"""
+import os
+
+
+def package_data_dir():
+    """Get the path to the honeybee_energy_standards data folder in this repo."""
+    current_dir = os.path.dirname(__file__)
+    master_dir = os.path.split(os.path.split(current_dir)[0])[0]
+    return os.path.join(master_dir, 'honeybee_energy_standards')
+
+
+def build_data_dir():
+    """Get the path to the standards_update/data folder written by convert_to_hb_json."""
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+
+def referenced(obj_dict, key_check):
+    """Get all identifiers referenced by a Honeybee dictionary under matching keys.
+
+    Args:
+        obj_dict: A Honeybee dictionary of an object (eg. a ProgramTypeAbridged).
+        key_check: A function that takes a key of the dictionary and returns
+            True if the values under the key are references to other objects.
+            Nested dictionaries are searched regardless of their key.
+
+    Returns:
+        A set of the referenced identifiers.
+    """
+    refs = set()
+    for key, val in obj_dict.items():
+        if isinstance(val, dict):
+            refs.update(referenced(val, key_check))
+        elif key_check(key):
+            if isinstance(val, str):
+                refs.add(val)
+            elif isinstance(val, list):
+                refs.update(v for v in val if isinstance(v, str))
+    return refs
+
+
+def schedule_key(key):
+    """Check whether a key of a Honeybee dictionary references schedules."""
+    return key == 'schedule' or key.endswith('_schedule')
+
+
+def construction_key(key):
+    """Check whether a key of a Honeybee dictionary references constructions."""
+    return key.endswith('_construction')
+
+
+def material_key(key):
+    """Check whether a key of a Honeybee dictionary references materials."""
+    return key == 'materials' or key.endswith('_material')
@@ -1,10 +1,11 @@
 # coding=utf-8
 """Clean the schedule data."""
-import re
 import os
 import json
 from datetime import datetime
 
+from standards_update._util._json_writer import write_compact_json
+
 
 def clean_schedules(source_filename, dest_directory):
     """Process the OpenStudio Standards Schedule dictionary and write out a clean version.
@@ -88,16 +89,9 @@ def clean_schedules(source_filename, dest_directory):
         for i in del_indices:
             del full_sched[i]
 
-    # get a string representation and clean it further
-    init_str = json.dumps(sch_dict, indent=2)
-    new_str = re.sub(r'\s*(\d*\.\d*),\s*', r'\1, ', init_str)
-    right_bracket_str = re.sub(r'\s*(])', r'\1', new_str)
-    clean_str = re.sub(r'(\[)\s*', r'\1', right_bracket_str)
-
-    # write the data into a file
+    # write the data into a file with un-indented lists of values
     dest_file_path = os.path.join(dest_directory, 'schedule.json')
-    with open(dest_file_path, 'w') as fp:
-        fp.write(clean_str)
+    write_compact_json(sch_dict, dest_file_path)
 
     return dest_file_path
 
@@ -145,15 +139,8 @@ def remove_unused_schedules(clean_schedule_json=None, clean_program_type_jsons=N
     for sch_id in all_schedules:
         new_sch_dict[sch_id] = sched_data_store[sch_id]
 
-    # get a string representation and clean it further
-    init_str = json.dumps(new_sch_dict, indent=2)
-    new_str = re.sub(r'\s*(\d*\.\d*),\s*', r'\1, ', init_str)
-    right_bracket_str = re.sub(r'\s*(])', r'\1', new_str)
-    left_bracket_str = re.sub(r'(\[)\s*', r'\1', right_bracket_str)
-
-    # write the data into a file
-    with open(clean_schedule_json, 'w') as fp:
-        fp.write(left_bracket_str)
+    # write the data into a file with un-indented lists of values
+    write_compact_json(new_sch_dict, clean_schedule_json)
 
 
 def clean_dt(os_dt):
@@ -7,9 +7,20 @@ import honeybee_energy.lib.schedules as sch_lib
 import honeybee_energy.lib.programtypes as program_lib
 
 import os
+import sys
 import shutil
 import json
-import re
+import multiprocessing
+from functools import partial
+
+from standards_update._util._manifest import BuildManifest, source_hash
+from standards_update._util._json_writer import write_compact_json
+from standards_update._util._compress import is_data_file
+from standards_update._lib._programtype_index import ProgramTypeIndex, INDEX_FILE
+from standards_update._lib._window_index import WindowConstructionIndex, \
+    INDEX_FILE as WINDOW_INDEX_FILE
+from standards_update._lib._registry import ProgramTypeRegistry, REGISTRY_FILE
+from standards_update._lib._version import honeybee_energy_version
 
 
 def local_data_dir():
@@ -17,34 +28,209 @@ def local_data_dir():
     return os.path.split(current_dir)[0]
 
 
+def _load_existing(dest_file):
+    """Load the dictionary of previously translated records in a destination file."""
+    try:
+        with open(dest_file, 'r') as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def abridged_dict(lib_function, obj_id):
+    """Get the abridged Honeybee dictionary of an object in the library."""
+    return lib_function(obj_id).to_dict(abridged=True)
+
+
+def full_dict(lib_function, obj_id):
+    """Get the Honeybee dictionary of an object that has no abridged form (eg. materials).
+    """
+    return lib_function(obj_id).to_dict()
+
+
+def _init_worker(use_standards_data):
+    """Set up a worker process to translate objects like its parent process."""
+    if use_standards_data:
+        import standards_update._change_to_standards_data  # noqa: F401
+
+
+def _translate_chunk(args):
+    """Translate a chunk of identifiers, capturing the error of any that fail."""
+    translate_func, obj_ids = args
+    results = []
+    for obj_id in obj_ids:
+        try:
+            results.append((obj_id, translate_func(obj_id), None))
+        except Exception as e:
+            results.append((obj_id, None, '{}: {}'.format(type(e).__name__, e)))
+    return results
+
+
+def translation_pool(processes=None):
+    """Get a process pool that can be used to translate objects in parallel.
+
+    Args:
+        processes: Integer for the number of worker processes. If None, the
+            number of CPUs on the machine will be used. (Default: None).
+
+    Returns:
+        A multiprocessing Pool or None if processes is 1 or less, in which case
+        objects should be translated in the current process.
+    """
+    processes = processes if processes is not None else os.cpu_count() or 1
+    if processes <= 1:
+        return None
+    use_std_data = 'standards_update._change_to_standards_data' in sys.modules
+    return multiprocessing.Pool(processes, _init_worker, (use_std_data,))
+
+
+def translate_objects(obj_ids, translate_func, pool=None, chunk_size=50):
+    """Translate a list of objects from the library to Honeybee dictionaries.
+
+    Args:
+        obj_ids: A list of identifiers of the objects to be translated.
+        translate_func: A function that takes an identifier and returns the
+            translated Honeybee dictionary. This must be picklable when a pool
+            is used (eg. a functools.partial of abridged_dict).
+        pool: An optional multiprocessing Pool from translation_pool. If None,
+            the objects will be translated in the current process.
+        chunk_size: Integer for the number of objects sent to a worker process
+            at a time. (Default: 50).
+
+    Returns:
+        A dictionary of the translated objects in the same order as obj_ids.
+    """
+    chunks = [(translate_func, obj_ids[i:i + chunk_size])
+              for i in range(0, len(obj_ids), chunk_size)]
+    if pool is None or len(chunks) <= 1:
+        results = [_translate_chunk(chunk) for chunk in chunks]
+    else:
+        results = pool.map(_translate_chunk, chunks)
+
+    hb_dict, errors = {}, []
+    for chunk_result in results:
+        for obj_id, obj_dict, error in chunk_result:
+            if error is None:
+                hb_dict[obj_id] = obj_dict
+            else:
+                errors.append('"{}" - {}'.format(obj_id, error))
+    if len(errors) != 0:
+        raise ValueError('{} objects failed to translate:\n{}'.format(
+            len(errors), '\n'.join(errors)))
+    return hb_dict
+
+
+def translate_records(src_dict, translate_func, dest_file, manifest=None, key=None,
+                      pool=None):
+    """Translate a dictionary of standards records, re-using any unchanged ones.
+
+    Args:
+        src_dict: A dictionary of the cleaned standards records to be translated
+            with the identifiers of the records as keys.
+        translate_func: A function that takes an identifier and returns the
+            translated Honeybee dictionary.
+        dest_file: Path to the destination JSON, which may contain the results
+            of a previous translation.
+        manifest: An optional BuildManifest. If None, all records will be
+            translated. (Default: None).
+        key: Text for the key of the dest_file in the manifest.
+        pool: An optional multiprocessing Pool from translation_pool. If None,
+            the records will be translated in the current process.
+
+    Returns:
+        A dictionary of the translated records.
+    """
+    existing = _load_existing(dest_file) if manifest is not None else {}
+    rebuilt_ids = [
+        obj_id for obj_id, record in src_dict.items()
+        if obj_id not in existing or not manifest.record_is_current(key, obj_id, record)
+    ]
+    translated = translate_objects(rebuilt_ids, translate_func, pool)
+    hb_dict = {}
+    for obj_id in src_dict:  # merge in the order of the source records
+        try:
+            hb_dict[obj_id] = translated[obj_id]
+        except KeyError:
+            hb_dict[obj_id] = existing[obj_id]
+    if manifest is not None:
+        manifest.update_records(key, src_dict, rebuilt_ids)
+    return hb_dict
+
+
 def honeybee_construction_json(
-        source_directory, constr_folder, lib_function, file_name, extra_objs=None):
+        source_directory, constr_folder, lib_function, file_name, extra_objs=None,
+        manifest=None, pool=None, abridged=True):
     opa_mat_json = os.path.join(source_directory, file_name)
-    hb_dict = {}
+    mat_path = os.path.join(constr_folder, file_name)
+    extra_objs = extra_objs if extra_objs is not None else []
+    key = 'constructions/{}'.format(file_name)
+    if manifest is not None:
+        inputs = [opa_mat_json] + extra_objs
+        if manifest.is_current(key, inputs, [mat_path]):
+            manifest.skip(key)
+            return
+
+    translate_func = partial(abridged_dict if abridged else full_dict, lib_function)
     with open(opa_mat_json, 'r') as json_file:
         mat_dict = json.load(json_file)
-    for mat_id in mat_dict:
-        try:
-            hb_dict[mat_id] = lib_function(mat_id).to_dict(abridged=True)
-        except Exception:
-            hb_dict[mat_id] = lib_function(mat_id).to_dict()
-    if extra_objs is not None:
-        for e_obj in extra_objs:
-            with open(e_obj, 'r') as f:
-                hb_dict.update(json.load(f))
-    mat_path = os.path.join(constr_folder, file_name)
+    hb_dict = translate_records(mat_dict, translate_func, mat_path, manifest, key, pool)
+    for e_obj in extra_objs:
+        with open(e_obj, 'r') as f:
+            hb_dict.update(json.load(f))
     with open(mat_path, 'w') as fp:
         json.dump(hb_dict, fp, indent=2)
+    if manifest is not None:
+        manifest.update(key, inputs)
+
+
+def _construction_set_dict(c_id):
+    """Get an abridged construction set dictionary without any None values."""
+    base_dict = constrset_lib.construction_set_by_identifier(c_id).to_dict(abridged=True)
+    del_keys = []
+    for key in base_dict:
+        if base_dict[key] is None:
+            del_keys.append(key)
+        elif isinstance(base_dict[key], dict):
+            sub_del_keys = []
+            for s_key in base_dict[key]:
+                if base_dict[key][s_key] is None:
+                    sub_del_keys.append(s_key)
+            for s_key in sub_del_keys:
+                del base_dict[key][s_key]
+    for key in del_keys:
+        del base_dict[key]
+    return base_dict
 
 
-def convert_to_hb_json(source_dir=None, dest_dir=None):
+def convert_to_hb_json(source_dir=None, dest_dir=None, force=False, processes=None):
     """Convert OpenStudio standards JSON files into Honeybee JSON files.
 
+    A build_manifest.json is written into the dest_dir, which records the hashes
+    of all source files and records. On subsequent runs, any file whose source
+    has not changed is skipped and, within changed files, only the records that
+    have changed are re-translated. Changing the version of honeybee-energy or
+    any source of the standards_update.extension package (including the unit
+    conversions of _units.py) causes everything to be re-translated.
+
+    The objects are translated in chunks across a pool of worker processes and
+    merged back in the order of the source records. Any objects that fail to
+    translate are reported together by identifier in a ValueError. Note that,
+    when worker processes are started with the 'spawn' method (eg. on Windows),
+    this function must be called from within an `if __name__ == '__main__':` block.
+
     Args:
         source_dir: Directory to the cleaned OpenStudio Standards JSONs.
             Default will be the data folder in this package.
         dest_dir: Optional path to a destination directory. Default will be the
             data folder in this package.
+        force: Boolean to note whether all data should be re-translated regardless
+            of whether its source has changed since the last run. (Default: False).
+        processes: Integer for the number of worker processes used to translate
+            the objects. If None, the number of CPUs on the machine will be used.
+            Set to 1 to translate everything in the current process. (Default: None).
+
+    Returns:
+        A dictionary reporting which outputs were rebuilt and which were skipped.
     """
     # set default directories
     if source_dir is None:
@@ -53,6 +239,11 @@ def convert_to_hb_json(source_dir=None, dest_dir=None):
     if dest_dir is None:
         master_dir = local_data_dir()
         dest_dir = os.path.join(master_dir, 'data')
+    extension_dir = os.path.join(local_data_dir(), 'extension')
+    manifest = BuildManifest(
+        os.path.join(dest_dir, 'build_manifest.json'), force,
+        {'honeybee-energy': honeybee_energy_version(),
+         'extension': source_hash(extension_dir)})
 
     # get all of the destination folders
     constr_dir = os.path.join(dest_dir, 'constructions')
@@ -61,20 +252,60 @@ def convert_to_hb_json(source_dir=None, dest_dir=None):
     ptype_dir = os.path.join(dest_dir, 'programtypes')
     ptype_reg_dir = os.path.join(dest_dir, 'programtypes_registry')
 
+    pool = translation_pool(processes)
+    try:
+        _convert_objects(source_dir, manifest, pool, constr_dir, constrset_dir,
+                         sched_dir, ptype_dir)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    # copy the program registry files over to the data folder
+    src_ptype_dir = os.path.join(source_dir, 'program_type')
+    for f in os.listdir(src_ptype_dir):
+        f_path = os.path.join(src_ptype_dir, f)
+        if os.path.isfile(f_path) and f_path.endswith('registry.json'):
+            dest_file = os.path.join(ptype_reg_dir, f)
+            shutil.copy(f_path, dest_file)
+
+    # merge the registries of all vintages into a single file
+    p_type_registry = ProgramTypeRegistry.from_data_folder(dest_dir)
+    p_type_registry.to_file(os.path.join(dest_dir, REGISTRY_FILE))
+
+    # write the columnar index of the program type loads
+    p_type_index = ProgramTypeIndex.from_data_folder(dest_dir)
+    p_type_index.to_file(os.path.join(dest_dir, INDEX_FILE))
+
+    # write the sorted index of the window construction performance
+    window_index = WindowConstructionIndex.from_data_folder(dest_dir)
+    window_index.to_file(os.path.join(dest_dir, WINDOW_INDEX_FILE))
+
+    manifest.save()
+    manifest.print_report()
+    print('Successfully translated OpenStudio JSONs to Honeybee.')
+    return manifest.report
+
+
+def _convert_objects(source_dir, manifest, pool, constr_dir, constrset_dir,
+                     sched_dir, ptype_dir):
+    """Translate all of the objects of convert_to_hb_json using a process pool."""
     # translate the materials and constructions to honeybee_json
     extra_folder = os.path.join(os.path.split(os.path.dirname(__file__))[0], '_extra')
     honeybee_construction_json(
         source_dir, constr_dir, mat_lib.opaque_material_by_identifier,
-        'opaque_material.json', [os.path.join(extra_folder, 'ground_materials.json')])
+        'opaque_material.json', [os.path.join(extra_folder, 'ground_materials.json')],
+        manifest, pool, abridged=False)
     honeybee_construction_json(
         source_dir, constr_dir, mat_lib.window_material_by_identifier,
-        'window_material.json')
+        'window_material.json', manifest=manifest, pool=pool, abridged=False)
     honeybee_construction_json(
         source_dir, constr_dir, constr_lib.opaque_construction_by_identifier,
-        'opaque_construction.json', [os.path.join(extra_folder, 'ground_constructions.json')])
+        'opaque_construction.json', [os.path.join(extra_folder, 'ground_constructions.json')],
+        manifest, pool)
     honeybee_construction_json(
         source_dir, constr_dir, constr_lib.window_construction_by_identifier,
-        'window_construction.json')
+        'window_construction.json', manifest=manifest, pool=pool)
 
     # translate the construction sets to honeybee_json
     src_constr_set_dir = os.path.join(source_dir, 'construction_set')
@@ -82,47 +313,32 @@ def convert_to_hb_json(source_dir=None, dest_dir=None):
         dest_file = os.path.join(constrset_dir, f)
         f_path = os.path.join(src_constr_set_dir, f)
         if os.path.isfile(f_path) and f_path.endswith('.json'):
+            key = 'constructionsets/{}'.format(f)
+            if manifest.is_current(key, [f_path], [dest_file]):
+                manifest.skip(key)
+                continue
             with open(f_path, 'r') as json_file:
                 c_dict = json.load(json_file)
-            hb_dict = {}
-            for c_id in c_dict:
-                base_dict = \
-                    constrset_lib.construction_set_by_identifier(c_id).to_dict(abridged=True)
-                del_keys = []
-                for key in base_dict:
-                    if base_dict[key] is None:
-                        del_keys.append(key)
-                    elif isinstance(base_dict[key], dict):
-                        sub_del_keys = []
-                        for s_key in base_dict[key]:
-                            if base_dict[key][s_key] is None:
-                                sub_del_keys.append(s_key)
-                        for s_key in sub_del_keys:
-                            del base_dict[key][s_key]
-                for key in del_keys:
-                    del base_dict[key]
-                hb_dict[c_id] = base_dict
+            hb_dict = translate_records(
+                c_dict, _construction_set_dict, dest_file, manifest, key, pool)
             with open(dest_file, 'w') as fp:
                 json.dump(hb_dict, fp, indent=2)
+            manifest.update(key, [f_path])
 
     # translate schedules to honeybee json
     sched_json = os.path.join(source_dir, 'schedule.json')
-    hb_sch_dict = {}
-    with open(sched_json, 'r') as json_file:
-        sch_dict = json.load(json_file)
-    for sch_id in sch_dict:
-        hb_sch_dict[sch_id] = sch_lib.schedule_by_identifier(sch_id).to_dict(abridged=True)
-    # get a string representation and clean it further
-    init_str = json.dumps(hb_sch_dict, indent=2)
-    new_str = re.sub(r'\s*(\d*\.\d*),\s*', r'\1, ', init_str)
-    right_bracket_str = re.sub(r'\s*(])', r'\1', new_str)
-    left_bracket_str = re.sub(r'(\[)\s*', r'\1', right_bracket_str)
-    newer_str = re.sub(r'\[(.\d*),\s*(.\d*)\],\s*', r'[\1, \2], ', left_bracket_str)
-    final_str = re.sub(r'\[(.\d*),\s*(.\d*)\]', r'[\1, \2]', newer_str)
-    # write the data into a file
     sch_path = os.path.join(sched_dir, 'schedule.json')
-    with open(sch_path, 'w') as fp:
-        fp.write(final_str)
+    if manifest.is_current('schedules/schedule.json', [sched_json], [sch_path]):
+        manifest.skip('schedules/schedule.json')
+    else:
+        with open(sched_json, 'r') as json_file:
+            sch_dict = json.load(json_file)
+        hb_sch_dict = translate_records(
+            sch_dict, partial(abridged_dict, sch_lib.schedule_by_identifier),
+            sch_path, manifest, 'schedules/schedule.json', pool)
+        # write the data into a file with un-indented lists of values and times
+        write_compact_json(hb_sch_dict, sch_path, compact_pairs=True)
+        manifest.update('schedules/schedule.json', [sched_json])
 
     # translate the program types to honeybee json
     src_ptype_dir = os.path.join(source_dir, 'program_type')
@@ -130,24 +346,19 @@ def convert_to_hb_json(source_dir=None, dest_dir=None):
         f_path = os.path.join(src_ptype_dir, f)
         if os.path.isfile(f_path) and f_path.endswith('.json') \
                 and not f_path.endswith('registry.json'):
+            dest_file = os.path.join(ptype_dir, f)
+            key = 'programtypes/{}'.format(f)
+            if manifest.is_current(key, [f_path], [dest_file]):
+                manifest.skip(key)
+                continue
             with open(f_path, 'r') as json_file:
                 p_dict = json.load(json_file)
-            hb_dict = {}
-            for p_id in p_dict:
-                hb_dict[p_id] = \
-                    program_lib.program_type_by_identifier(p_id).to_dict(abridged=True)
-            dest_file = os.path.join(ptype_dir, f)
+            hb_dict = translate_records(
+                p_dict, partial(abridged_dict, program_lib.program_type_by_identifier),
+                dest_file, manifest, key, pool)
             with open(dest_file, 'w') as fp:
                 json.dump(hb_dict, fp, indent=2)
-
-    # copy the program registry files over to the data folder
-    for f in os.listdir(src_ptype_dir):
-        f_path = os.path.join(src_ptype_dir, f)
-        if os.path.isfile(f_path) and f_path.endswith('registry.json'):
-            dest_file = os.path.join(ptype_reg_dir, f)
-            shutil.copy(f_path, dest_file)
-
-    print('Successfully translated OpenStudio JSONs to Honeybee.')
+            manifest.update(key, [f_path])
 
 
 def remove_hb_jsons(dest_dir=None):
@@ -164,29 +375,34 @@ def remove_hb_jsons(dest_dir=None):
     con_dir = os.path.join(dest_dir, 'constructions')
     for file_name in os.listdir(con_dir):
         json_file = os.path.join(con_dir, file_name)
-        if file_name.endswith('.json') and os.path.isfile(json_file):
+        if is_data_file(file_name) and os.path.isfile(json_file):
             os.remove(json_file)
 
     con_set_dir = os.path.join(dest_dir, 'constructionsets')
     for file_name in os.listdir(con_set_dir):
         json_file = os.path.join(con_set_dir, file_name)
-        if file_name.endswith('.json') and os.path.isfile(json_file):
+        if is_data_file(file_name) and os.path.isfile(json_file):
             os.remove(json_file)
 
     sch_dir = os.path.join(dest_dir, 'schedules')
     for file_name in os.listdir(sch_dir):
         json_file = os.path.join(sch_dir, file_name)
-        if file_name.endswith('.json') and os.path.isfile(json_file):
+        if is_data_file(file_name) and os.path.isfile(json_file):
             os.remove(json_file)
 
     ptype_dir = os.path.join(dest_dir, 'programtypes')
     for file_name in os.listdir(ptype_dir):
         json_file = os.path.join(ptype_dir, file_name)
-        if file_name.endswith('.json') and os.path.isfile(json_file):
+        if is_data_file(file_name) and os.path.isfile(json_file):
             os.remove(json_file)
 
     ptype_reg_dir = os.path.join(dest_dir, 'programtypes_registry')
     for file_name in os.listdir(ptype_reg_dir):
         json_file = os.path.join(ptype_reg_dir, file_name)
-        if file_name.endswith('.json') and os.path.isfile(json_file):
+        if is_data_file(file_name) and os.path.isfile(json_file):
+            os.remove(json_file)
+
+    for file_name in (INDEX_FILE, WINDOW_INDEX_FILE, REGISTRY_FILE):
+        json_file = os.path.join(dest_dir, file_name)
+        if os.path.isfile(json_file):
             os.remove(json_file)
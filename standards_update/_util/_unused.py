@@ -0,0 +1,150 @@
+# coding=utf-8
+"""Find and remove records in the Honeybee JSONs that are not used by anything."""
+import os
+import json
+
+from standards_update._lib._loadjson import load_json, load_folder, data_file_path
+from standards_update._lib._envelope import insulation_variant
+from standards_update._util._json_writer import write_compact_json
+from standards_update._util._paths import build_data_dir, referenced, schedule_key, \
+    construction_key, material_key
+
+# files of the objects that are referenced by other objects
+_SCHEDULE_FILE = os.path.join('schedules', 'schedule.json')
+_CONSTRUCTION_FILES = (
+    os.path.join('constructions', 'opaque_construction.json'),
+    os.path.join('constructions', 'window_construction.json')
+)
+_MATERIAL_FILES = (
+    os.path.join('constructions', 'opaque_material.json'),
+    os.path.join('constructions', 'window_material.json')
+)
+# objects that are used by honeybee-energy rather than by the standards data
+ADIABATIC_CONSTRUCTIONS = (
+    'Adiabatic ExteriorFloor', 'Adiabatic GroundContactFloor',
+    'Adiabatic Roof', 'Adiabatic Wall'
+)
+_EXTRA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), '_extra')
+
+
+def default_keep():
+    """Get a list of the identifiers of objects that are always treated as used.
+
+    These are the Always On and Always Off schedules, the Adiabatic constructions
+    and all of the ground materials and constructions of the _extra folder, which
+    are added to the data for honeybee-energy rather than by any standards object.
+    """
+    keep = ['Always Off', 'Always On']
+    keep.extend(ADIABATIC_CONSTRUCTIONS)
+    for obj_dict in load_folder(_EXTRA_FOLDER).values():
+        keep.extend(obj_dict.keys())
+    return keep
+
+
+def find_unused_objects(data_dir=None, keep=None):
+    """Find all schedules, constructions and materials that are not used by anything.
+
+    Program types and construction sets are treated as the roots of the library.
+    Schedules are used if they are referenced by a program type. Constructions
+    are used if they are referenced by a construction set, which includes the
+    '-R{n}' constructions that were synthesized to meet the insulation criteria
+    of each vintage. The base construction of each used '-R{n}' construction is
+    also used since the construction loader can synthesize the variant from it.
+    Materials are used if they are referenced by a used construction.
+
+    All files are read with load_json such that compressed data files are also
+    checked and an error is raised if any of the files are missing.
+
+    Args:
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the data folder of this package
+            will be used.
+        keep: A list of identifiers for objects that should be treated as used
+            even if nothing references them. If None, the objects of the
+            default_keep function will be used. (Default: None).
+
+    Returns:
+        A dictionary with the relative paths of the JSON files as keys and a
+        sorted list of the identifiers of the unused objects in each file as values.
+    """
+    if data_dir is None:
+        data_dir = build_data_dir()
+    keep = set(default_keep()) if keep is None else set(keep)
+
+    # gather everything that is referenced by the program types and construction sets
+    used_schedules, used_constrs = set(keep), set(keep)
+    for p_types in load_folder(os.path.join(data_dir, 'programtypes')).values():
+        for p_type in p_types.values():
+            used_schedules.update(referenced(p_type, schedule_key))
+    for c_sets in load_folder(os.path.join(data_dir, 'constructionsets')).values():
+        for c_set in c_sets.values():
+            used_constrs.update(referenced(c_set, construction_key))
+    variants = (insulation_variant(c_id) for c_id in list(used_constrs))
+    used_constrs.update(variant[0] for variant in variants if variant is not None)
+
+    # gather the materials of the used constructions
+    used_mats = set(keep)
+    constr_data = {}
+    for rel_path in _CONSTRUCTION_FILES:
+        constr_data[rel_path] = load_json(os.path.join(data_dir, rel_path))
+        for c_id, constr in constr_data[rel_path].items():
+            if c_id in used_constrs:
+                used_mats.update(referenced(constr, material_key))
+
+    # find everything that is not used
+    unused = {}
+    for rel_path, obj_dict in constr_data.items():
+        unused[rel_path] = sorted(c for c in obj_dict if c not in used_constrs)
+    for rel_path, used in ((_SCHEDULE_FILE, used_schedules),) + \
+            tuple((m_path, used_mats) for m_path in _MATERIAL_FILES):
+        obj_dict = load_json(os.path.join(data_dir, rel_path))
+        unused[rel_path] = sorted(o for o in obj_dict if o not in used)
+    return unused
+
+
+def remove_unused_objects(data_dir=None, keep=None, remove=False):
+    """Report and optionally remove all unused schedules, constructions and materials.
+
+    Note that this should be run on the uncompressed JSONs before they are
+    compressed with compress_data. An error is raised if the unused objects are
+    to be removed from a file that is compressed.
+
+    Args:
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the data folder of this package
+            will be used.
+        keep: A list of identifiers for objects that should be treated as used
+            even if nothing references them. If None, the objects of the
+            default_keep function will be used. (Default: None).
+        remove: Boolean to note whether the unused objects should be removed
+            from the JSON files. If False, they will only be reported. (Default: False).
+
+    Returns:
+        A dictionary with the relative paths of the JSON files as keys and a
+        sorted list of the identifiers of the unused objects in each file as values.
+    """
+    if data_dir is None:
+        data_dir = build_data_dir()
+    unused = find_unused_objects(data_dir, keep)
+    if remove:  # check that no file is compressed before any file is edited
+        for rel_path, obj_ids in unused.items():
+            f_path = os.path.join(data_dir, rel_path)
+            if len(obj_ids) != 0 and data_file_path(f_path) != f_path:
+                raise ValueError(
+                    '"{}" is compressed. Unused objects can only be removed from '
+                    'uncompressed JSONs.'.format(data_file_path(f_path)))
+
+    for rel_path, obj_ids in unused.items():
+        print('{}: {} unused objects'.format(rel_path, len(obj_ids)))
+        if not remove or len(obj_ids) == 0:
+            continue
+        f_path = os.path.join(data_dir, rel_path)
+        obj_dict = load_json(f_path)
+        for obj_id in obj_ids:
+            del obj_dict[obj_id]
+        if rel_path == _SCHEDULE_FILE:
+            write_compact_json(obj_dict, f_path, compact_pairs=True)
+        else:
+            with open(f_path, 'w') as fp:
+                json.dump(obj_dict, fp, indent=2)
+    return unused
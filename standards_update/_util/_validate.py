@@ -0,0 +1,127 @@
+# coding=utf-8
+"""Check that all references between the objects of a standards library resolve.
+
+This check only loads the abridged JSONs and compares identifiers, which makes it
+fast enough to be run on every commit that edits the data. For example:
+
+    python -m standards_update._util._validate ./honeybee_energy_standards
+"""
+import os
+import sys
+
+from standards_update._lib._loadjson import load_json, load_folder
+from standards_update._util._paths import package_data_dir, referenced, \
+    schedule_key, construction_key, material_key
+
+
+def _check_refs(objects, rel_path, key_check, available, obj_type, errors):
+    """Add an error message for every reference to an object that is not available."""
+    for obj_id, obj_dict in objects.items():
+        for ref in sorted(referenced(obj_dict, key_check)):
+            if ref not in available:
+                errors.append('{}: "{}" references missing {} "{}".'.format(
+                    rel_path, obj_id, obj_type, ref))
+
+
+def validate_data(data_dir=None):
+    """Check that all references between the objects of a standards library resolve.
+
+    This includes checking that every schedule referenced by a program type,
+    every construction referenced by a construction set, every material referenced
+    by a construction, every program type in the programtypes_registry and every
+    program type in the building_mix.json exists. The fractions of each building
+    in the building_mix.json are also checked to sum to 1.
+
+    Args:
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the honeybee_energy_standards
+            folder of this repo will be used.
+
+    Returns:
+        A list of text for all of the errors that were found. Will be empty if
+        everything resolves.
+    """
+    if data_dir is None:
+        data_dir = package_data_dir()
+    errors = []
+
+    # load all of the data
+    schedules = {}
+    for sch_dict in load_folder(os.path.join(data_dir, 'schedules')).values():
+        schedules.update(sch_dict)
+    constr_data = load_folder(os.path.join(data_dir, 'constructions'))
+    materials, constructions = set(), {}
+    for f_name, obj_dict in constr_data.items():
+        if f_name.endswith('material.json'):
+            materials.update(obj_dict)
+        else:
+            constructions[f_name] = obj_dict
+    all_constrs = set()
+    for obj_dict in constructions.values():
+        all_constrs.update(obj_dict)
+    p_type_data = load_folder(os.path.join(data_dir, 'programtypes'))
+    p_types = set()
+    for obj_dict in p_type_data.values():
+        p_types.update(obj_dict)
+
+    # check the references of each type of object
+    for f_name, obj_dict in p_type_data.items():
+        rel_path = '/'.join(('programtypes', f_name))
+        _check_refs(obj_dict, rel_path, schedule_key, schedules, 'schedule', errors)
+    c_set_data = load_folder(os.path.join(data_dir, 'constructionsets'))
+    for f_name, obj_dict in c_set_data.items():
+        rel_path = '/'.join(('constructionsets', f_name))
+        _check_refs(obj_dict, rel_path, construction_key, all_constrs,
+                    'construction', errors)
+    for f_name, obj_dict in constructions.items():
+        rel_path = '/'.join(('constructions', f_name))
+        _check_refs(obj_dict, rel_path, material_key, materials, 'material', errors)
+
+    # check the registry of program types
+    registries = load_folder(os.path.join(data_dir, 'programtypes_registry'))
+    for f_name, registry in registries.items():
+        vintage = f_name.replace('_registry.json', '')
+        for bldg, space_types in registry.items():
+            for space_type in space_types:
+                p_id = '{}::{}::{}'.format(vintage, bldg, space_type)
+                if p_id not in p_types:
+                    errors.append('programtypes_registry/{}: program type "{}" '
+                                  'does not exist.'.format(f_name, p_id))
+
+    # check the building mix
+    mix_file = os.path.join(data_dir, 'building_mix.json')
+    try:
+        building_mix = load_json(mix_file)
+    except FileNotFoundError:
+        building_mix = {}
+    for bldg, mix in building_mix.items():
+        for p_id in mix:
+            if p_id not in p_types:
+                errors.append('building_mix.json: "{}" references missing program '
+                              'type "{}".'.format(bldg, p_id))
+        total = sum(mix.values())
+        if abs(total - 1) > 1e-3:
+            errors.append('building_mix.json: fractions of "{}" sum to {} instead '
+                          'of 1.'.format(bldg, round(total, 6)))
+    return errors
+
+
+def check_data(data_dir=None):
+    """Raise a ValueError listing all references that do not resolve in a library.
+
+    Args:
+        data_dir: Path to a folder of Honeybee JSONs with the same structure as
+            honeybee_energy_standards. If None, the honeybee_energy_standards
+            folder of this repo will be used.
+    """
+    errors = validate_data(data_dir)
+    if len(errors) != 0:
+        raise ValueError('{} references failed to resolve:\n{}'.format(
+            len(errors), '\n'.join(errors)))
+
+
+if __name__ == '__main__':
+    found_errors = validate_data(sys.argv[1] if len(sys.argv) > 1 else None)
+    for error in found_errors:
+        print(error)
+    sys.exit(1 if found_errors else 0)
@@ -0,0 +1,165 @@
+# coding=utf-8
+"""Conversion of the IP units of the standards gem to the SI units of honeybee-energy.
+
+All conversion factors used to create honeybee-energy objects from standards gem
+dictionaries are in the UNITS table below. Each from_standards_dict classmethod
+converts the values of a single record with si_value while convert_records
+converts a whole standards gem file at once, one field at a time, before any
+objects are created. The records returned by convert_records are registered in
+a separate dictionary by their id() rather than being marked with an extra key,
+such that from_standards_dict uses their values without converting them again
+while the records keep exactly the keys of the standards gem.
+"""
+from __future__ import division
+
+# records that have been converted to SI units with the id() of each record as keys
+# the records themselves are the values, which keeps their id() from being re-used
+_si_records = {}
+
+# IP units with a tuple of the factor to convert them to SI and a boolean for
+# whether values are divided by the factor (True) or multiplied by it (False)
+UNITS = {
+    'in': (0.0254, False),  # inches to meters
+    'W/ft2': (10.7639, False),  # to W/m2
+    'people/1000ft2': (92.903, True),  # to people/m2
+    'Btu/h-ft2': (3.15459, False),  # to W/m2
+    'gal/h-ft2': (40.7458, False),  # to L/h-m2
+    'cfm/ft2': (0.00508, False),  # to m3/s-m2
+    'cfm/person': (0.000471947, False),  # to m3/s-person
+    'Btu-in/h-ft2-F': (6.9381117, True),  # to W/m-K
+    'lb/ft3': (16.0185, False),  # to kg/m3
+    'Btu/lb-F': (0.000239, True),  # to J/kg-K
+    'h-ft2-F/Btu': (5.678263337, True),  # to m2-K/W
+    'Btu/h-ft2-F': (5.678, False)  # to W/m2-K
+}
+
+# the units of each field of the standards gem records that is converted
+FIELD_UNITS = {
+    'program_type': {
+        'occupancy_per_area': 'people/1000ft2',
+        'lighting_per_area': 'W/ft2',
+        'additional_lighting_per_area': 'W/ft2',
+        'electric_equipment_per_area': 'W/ft2',
+        'gas_equipment_per_area': 'Btu/h-ft2',
+        'service_water_heating_peak_flow_per_area': 'gal/h-ft2',
+        'infiltration_per_exterior_area': 'cfm/ft2',
+        'infiltration_per_exterior_wall_area': 'cfm/ft2',
+        'ventilation_per_area': 'cfm/ft2',
+        'ventilation_per_person': 'cfm/person'
+    },
+    'opaque_material': {
+        'thickness': 'in',
+        'conductivity': 'Btu-in/h-ft2-F',
+        'density': 'lb/ft3',
+        'specific_heat': 'Btu/lb-F',
+        'resistance': 'h-ft2-F/Btu'
+    },
+    'window_material': {
+        'thickness': 'in',
+        'conductivity': 'Btu-in/h-ft2-F',
+        'u_factor': 'Btu/h-ft2-F'
+    }
+}
+
+
+def to_si(value, unit):
+    """Convert a value from an IP unit of the standards gem to SI.
+
+    Args:
+        value: A number in the IP unit.
+        unit: Text for the IP unit, which must be a key of the UNITS table.
+    """
+    factor, divide = UNITS[unit]
+    return value / factor if divide else value * factor
+
+
+def to_ip(value, unit):
+    """Convert a value from SI to an IP unit of the standards gem.
+
+    Args:
+        value: A number in the SI unit that corresponds to the IP unit.
+        unit: Text for the IP unit, which must be a key of the UNITS table.
+    """
+    factor, divide = UNITS[unit]
+    return value * factor if divide else value / factor
+
+
+def si_value(data, key, unit):
+    """Get the SI value of a field of a standards gem record.
+
+    This raises the same KeyError and TypeError for missing and None values
+    whether or not the record has already been converted with convert_records.
+
+    Args:
+        data: A standards gem dictionary.
+        key: Text for the key of the field in the dictionary.
+        unit: Text for the IP unit of the field, which must be a key of
+            the UNITS table.
+    """
+    value = data[key]
+    if value is None or not is_converted(data):
+        return to_si(value, unit)
+    return value
+
+
+def is_converted(data):
+    """Check whether a standards gem record was converted to SI with convert_records.
+
+    Args:
+        data: A standards gem dictionary.
+    """
+    return _si_records.get(id(data)) is data
+
+
+def convert_records(records, record_type):
+    """Convert all records of a standards gem file to SI units at once.
+
+    Each field is converted as a single column across all records with the same
+    factors as si_value, such that the resulting objects are identical to those
+    created from the unconverted records. Records that were already converted are
+    left as they are.
+
+    Args:
+        records: A dictionary of standards gem records with identifiers as keys.
+        record_type: Text for the type of records. Must be one of the keys of
+            FIELD_UNITS (eg. 'program_type', 'opaque_material', 'window_material').
+
+    Returns:
+        A new dictionary of the records with their values in SI units. The input
+        records are not changed. The converted records stay registered until
+        they are passed to the release_records function.
+    """
+    converted = {}
+    to_convert = []
+    for rec_id, record in records.items():
+        if is_converted(record):
+            converted[rec_id] = record
+        else:
+            record = converted[rec_id] = dict(record)
+            _si_records[id(record)] = record
+            to_convert.append(record)
+
+    for field, unit in FIELD_UNITS[record_type].items():
+        column = [rec for rec in to_convert if rec.get(field) is not None]
+        factor, divide = UNITS[unit]
+        if divide:
+            values = [rec[field] / factor for rec in column]
+        else:
+            values = [rec[field] * factor for rec in column]
+        for rec, value in zip(column, values):
+            rec[field] = value
+    return converted
+
+
+def release_records(records):
+    """Stop tracking records that were converted with convert_records.
+
+    This frees the memory of converted records that are no longer needed. Once
+    released, the values of the records are treated as IP values again.
+
+    Args:
+        records: A dictionary of records returned by convert_records.
+    """
+    for record in records.values():
+        if is_converted(record):
+            del _si_records[id(record)]
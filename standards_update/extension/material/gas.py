@@ -1,4 +1,5 @@
 """Classmethods for honeybee-energy gas materials."""
+from standards_update.extension._units import si_value
 
 
 def from_standards_dict(cls, data):
@@ -19,5 +20,5 @@ def from_standards_dict(cls, data):
     """
     assert data['material_type'] == 'Gas', \
         'Expected Gas. Got {}.'.format(data['material_type'])
-    thickness = 0.0254 * data['thickness']  # convert from inches
+    thickness = si_value(data, 'thickness', 'in')
     return cls(data['name'], thickness, data['gas_type'])
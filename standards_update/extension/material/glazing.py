@@ -1,4 +1,5 @@
 """Classmethods for honeybee-energy glazing materials."""
+from standards_update.extension._units import si_value
 
 
 def from_standards_dict(cls, data):
@@ -28,8 +29,8 @@ def from_standards_dict(cls, data):
         'Expected StandardGlazing. Got {}.'.format(data['material_type'])
     assert data['optical_data_type'] == 'SpectralAverage', \
         'Expected SpectralAverage. Got {}.'.format(data['optical_data_type'])
-    thickness = 0.0254 * data['thickness']  # convert from inches
-    conductivity = data['conductivity'] / 6.9381117  # convert from Btu*in/hr*ft2*F
+    thickness = si_value(data, 'thickness', 'in')
+    conductivity = si_value(data, 'conductivity', 'Btu-in/h-ft2-F')
     solar_diff = False if data['solar_diffusing'] == 0 else True
     new_mat = cls(data['name'], thickness,
                   data['solar_transmittance_at_normal_incidence'],
@@ -69,6 +70,6 @@ def simple_from_standards_dict(cls, data):
     """
     assert data['material_type'] == 'SimpleGlazing', \
         'Expected SimpleGlazing. Got {}.'.format(data['material_type'])
-    u_factor = data['u_factor'] * 5.678  # convert from Btu/hr*ft2*F
+    u_factor = si_value(data, 'u_factor', 'Btu/h-ft2-F')
     vt = data['visible_transmittance'] if 'visible_transmittance' in data else 0.6
     return cls(data['name'], u_factor, data['solar_heat_gain_coefficient'], vt)
@@ -1,4 +1,5 @@
 """Classmethods for honeybee-energy opaque materials."""
+from standards_update.extension._units import si_value
 
 
 def from_standards_dict(cls, data):
@@ -25,10 +26,10 @@ def from_standards_dict(cls, data):
     """
     assert data['material_type'] == 'StandardOpaqueMaterial', \
         'Expected StandardOpaqueMaterial. Got {}.'.format(data['material_type'])
-    thickness = 0.0254 * data['thickness']  # convert from inches
-    conductivity = data['conductivity'] / 6.9381117  # convert from Btu*in/hr*ft2*F
-    density = data['density'] * 16.0185  # convert from lb/ft3
-    specific_heat = data['specific_heat'] / 0.000239  # convert from Btu/lb*F
+    thickness = si_value(data, 'thickness', 'in')
+    conductivity = si_value(data, 'conductivity', 'Btu-in/h-ft2-F')
+    density = si_value(data, 'density', 'lb/ft3')
+    specific_heat = si_value(data, 'specific_heat', 'Btu/lb-F')
 
     optional_keys = ('roughness', 'thermal_absorptance', 'solar_absorptance',
                      'visible_absorptance')
@@ -70,7 +71,7 @@ def no_mass_from_standards_dict(cls, data):
     for key, val in zip(optional_keys, optional_vals):
         if key not in data or data[key] is None:
             data[key] = val
-    r_value = data['resistance'] / 5.678263337  # convert from hr*ft2*F/Btu
+    r_value = si_value(data, 'resistance', 'h-ft2-F/Btu')
     return cls(data['name'], r_value, data['roughness'],
                data['thermal_absorptance'], data['solar_absorptance'],
                data['visible_absorptance'])
@@ -11,6 +11,8 @@ from honeybee_energy.load.infiltration import Infiltration
 from honeybee_energy.load.ventilation import Ventilation
 from honeybee_energy.load.setpoint import Setpoint
 
+from standards_update.extension._units import si_value
+
 
 def from_standards_dict(cls, data):
     """Create a ProgramType from an OpenStudio standards gem dictionary.
@@ -73,19 +75,19 @@ def from_standards_dict(cls, data):
             'occupancy_per_area' in data and data['occupancy_per_area'] != 0:
         occ_sched = sch_lib.schedule_by_identifier(data['occupancy_schedule'])
         act_sched = sch_lib.schedule_by_identifier(data['occupancy_activity_schedule'])
-        occ_density = data['occupancy_per_area'] / 92.903
+        occ_density = si_value(data, 'occupancy_per_area', 'people/1000ft2')
         people = People('{}_People'.format(pr_type_identifier), occ_density,
                         occ_sched, act_sched)
 
     if 'lighting_schedule' in data and data['lighting_schedule'] is not None:
         light_sched = sch_lib.schedule_by_identifier(data['lighting_schedule'])
         try:
-            lpd = data['lighting_per_area'] * 10.7639
+            lpd = si_value(data, 'lighting_per_area', 'W/ft2')
         except (TypeError, KeyError):
             lpd = 0  # there's a schedule but no actual load object
         try:
             if data['additional_lighting_per_area'] is not None:
-                lpd += data['additional_lighting_per_area'] * 10.7639
+                lpd += si_value(data, 'additional_lighting_per_area', 'W/ft2')
         except (TypeError, KeyError):
             pass  # no additional lighting per area present
         try:
@@ -108,7 +110,7 @@ def from_standards_dict(cls, data):
             data['electric_equipment_schedule'] is not None:
         eequip_sched = sch_lib.schedule_by_identifier(data['electric_equipment_schedule'])
         try:
-            eepd = data['electric_equipment_per_area'] * 10.7639
+            eepd = si_value(data, 'electric_equipment_per_area', 'W/ft2')
         except KeyError:
             eepd = 0  # there's a schedule but no actual load object
         electric_equipment = ElectricEquipment(
@@ -121,7 +123,7 @@ def from_standards_dict(cls, data):
             data['gas_equipment_schedule'] is not None:
         gequip_sched = sch_lib.schedule_by_identifier(data['gas_equipment_schedule'])
         try:
-            gepd = data['gas_equipment_per_area'] * 3.15459
+            gepd = si_value(data, 'gas_equipment_per_area', 'Btu/h-ft2')
         except (TypeError, KeyError):
             gepd = 0  # there's a schedule but no actual load object
         gas_equipment = GasEquipment(
@@ -134,7 +136,8 @@ def from_standards_dict(cls, data):
             data['service_water_heating_schedule'] is not None:
         shw_sch = sch_lib.schedule_by_identifier(data['service_water_heating_schedule'])
         try:
-            shw_load = data['service_water_heating_peak_flow_per_area'] * 40.7458
+            shw_load = si_value(
+                data, 'service_water_heating_peak_flow_per_area', 'gal/h-ft2')
         except (TypeError, KeyError):
             shw_load = 0  # there's a schedule but no actual load object
         try:
@@ -157,10 +160,11 @@ def from_standards_dict(cls, data):
             data['infiltration_schedule'] is not None:
         inf_sched = sch_lib.schedule_by_identifier(data['infiltration_schedule'])
         try:
-            inf = data['infiltration_per_exterior_area'] * 0.00508
+            inf = si_value(data, 'infiltration_per_exterior_area', 'cfm/ft2')
         except KeyError:  # might be using infiltration_per_exterior_wall_area
             try:
-                inf = data['infiltration_per_exterior_wall_area'] * 0.00508
+                inf = si_value(
+                    data, 'infiltration_per_exterior_wall_area', 'cfm/ft2')
             except KeyError:
                 inf = 0  # there's a schedule but no actual load object
         infiltration = Infiltration(
@@ -168,10 +172,10 @@ def from_standards_dict(cls, data):
 
     if 'ventilation_standard' in data and \
             data['ventilation_standard'] is not None:
-        person = data['ventilation_per_person'] * 0.000471947 if \
+        person = si_value(data, 'ventilation_per_person', 'cfm/person') if \
             'ventilation_per_person' in data and \
             data['ventilation_per_person'] is not None else 0
-        area = data['ventilation_per_area'] * 0.00508 if \
+        area = si_value(data, 'ventilation_per_area', 'cfm/ft2') if \
             'ventilation_per_area' in data and \
             data['ventilation_per_area'] is not None else 0
         ach = data['ventilation_air_changes'] if \
@@ -6,6 +6,10 @@ import honeybee_energy.lib.scheduletypelimits as _type_lib
 
 from ladybug.dt import Date
 
+# shared tuples of the values and times of the ScheduleDays of all standards schedules
+_day_values = {}
+MAX_INTERNED = 100000  # maximum number of tuples held in the _day_values pool
+
 
 def from_standards_dict(cls, data):
     """Create a ScheduleRuleset from an OpenStudio standards gem dictionary.
@@ -29,22 +33,23 @@ def from_standards_dict(cls, data):
     # build the ScheduleDay objects and determine rules for when to apply them
     for day_sch_dict in data:
         schedule_day = ScheduleDay.from_standards_dict(day_sch_dict)
+        schedule_day = _shared_day(schedule_day.identifier, schedule_day)
         day_types = day_sch_dict['day_types'].split('|')
         if 'Default' in day_types:
-            default_day = schedule_day.duplicate()
-            default_day.identifier = '{}_Default'.format(schedule_day.identifier)
+            default_day = _shared_day(
+                '{}_Default'.format(schedule_day.identifier), schedule_day)
             day_types.remove('Default')
         if 'Hol' in day_sch_dict['day_types']:
-            holiday = schedule_day.duplicate()
-            holiday.identifier = '{}_Hol'.format(schedule_day.identifier)
+            holiday = _shared_day(
+                '{}_Hol'.format(schedule_day.identifier), schedule_day)
             day_types.remove('Hol')
         if 'SmrDsn' in day_sch_dict['day_types']:
-            summer_day = schedule_day.duplicate()
-            summer_day.identifier = '{}_SmrDsn'.format(schedule_day.identifier)
+            summer_day = _shared_day(
+                '{}_SmrDsn'.format(schedule_day.identifier), schedule_day)
             day_types.remove('SmrDsn')
         if 'WntrDsn' in day_sch_dict['day_types']:
-            winter_day = schedule_day.duplicate()
-            winter_day.identifier = '{}_WntrDsn'.format(schedule_day.identifier)
+            winter_day = _shared_day(
+                '{}_WntrDsn'.format(schedule_day.identifier), schedule_day)
             day_types.remove('WntrDsn')
         if len(day_types) != 0:  # there are rules for when to apply the schedule
             schedule_day.identifier = \
@@ -76,6 +81,49 @@ def from_standards_dict(cls, data):
                holiday, summer_day, winter_day)
 
 
+def _intern(values):
+    """Get a shared tuple that is equal to the input tuple of values or times.
+
+    Once the pool holds MAX_INTERNED tuples, new tuples are returned unshared
+    such that the pool cannot grow without bound.
+    """
+    try:
+        return _day_values[values]
+    except KeyError:
+        if len(_day_values) < MAX_INTERNED:
+            _day_values[values] = values
+        return values
+
+
+def clear_interned():
+    """Clear the pool of tuples shared by the ScheduleDays of standards schedules.
+
+    ScheduleDays that were already created keep their tuples, which are only
+    freed once no ScheduleDay uses them.
+    """
+    _day_values.clear()
+
+
+def _shared_day(identifier, schedule_day):
+    """Get a ScheduleDay with the profile of another one using shared tuples.
+
+    The times are interned and passed to the ScheduleDay constructor, which
+    keeps a tuple of times as it is. The constructor always builds a new tuple
+    of floats from the values and so the interned tuple of values, which is
+    equal to it, is assigned afterwards. The tuples are immutable and all
+    ScheduleDay setters assign new ones, meaning that days with the same
+    profile can safely share them while each ScheduleDay keeps its own identifier.
+
+    Args:
+        identifier: Text for the identifier of the new ScheduleDay.
+        schedule_day: A ScheduleDay with the values and times of the new one.
+    """
+    new_day = ScheduleDay(identifier, schedule_day.values,
+                          _intern(schedule_day.times), schedule_day.interpolate)
+    new_day._values = _intern(new_day.values)
+    return new_day
+
+
 def _process_date_string(date_string):
     """Process DateTime strings from the OpenStudio standards gem format.
 
@@ -0,0 +1,68 @@
+# coding=utf-8
+from honeybee.room import Room
+from honeybee.model import Model
+
+from standards_update._lib._assign import assign_standards, space_type_program
+
+import pytest
+
+
+def _office_model(room_count):
+    """Create a model of rooms with the space types of the reference large office."""
+    space_types = ('LargeOffice - OpenOffice', 'LargeOffice - ClosedOffice',
+                   'LargeOffice - Conference')
+    rooms = []
+    for i in range(room_count):
+        room = Room.from_box('Room_{}'.format(i), 5, 5, 3)
+        room.user_data = {'space_type': space_types[i % len(space_types)]}
+        rooms.append(room)
+    rooms.append(Room.from_box('Room_No_Space_Type', 5, 5, 3))
+    return Model('Office', rooms)
+
+
+def test_space_type_program():
+    """Test getting program types from the space types of the reference buildings."""
+    assert space_type_program('LargeOffice - OpenOffice', 'LargeOffice') == \
+        '2019::LargeOffice::OpenOffice'
+    assert space_type_program('SmallHotel - Corridor4', 'SmallHotel', '2013') == \
+        '2013::SmallHotel::Corridor'
+    assert space_type_program('LargeHotel Corridor2', 'LargeHotel') is None
+
+
+def test_assign_standards_from_space_type():
+    """Test assigning shared standards objects to all rooms of a model."""
+    model = _office_model(30)
+    stats = assign_standards(model, building_type='LargeOffice',
+                             construction_sets='2019::ClimateZone4::Mass')
+    assert stats['rooms'] == 31
+    assert stats['program_types'] == 3
+    assert stats['construction_sets'] == 1
+    assert stats['unassigned'] == ['Room_No_Space_Type']
+
+    rooms = model.rooms
+    assert rooms[0].properties.energy.program_type.identifier == \
+        '2019::LargeOffice::OpenOffice'
+    assert rooms[0].properties.energy.program_type is \
+        rooms[3].properties.energy.program_type
+    with pytest.raises(AttributeError):  # shared instances should be locked
+        rooms[0].properties.energy.program_type.identifier = 'Edited Program'
+    assert rooms[0].properties.energy.construction_set is \
+        rooms[-1].properties.energy.construction_set
+
+
+def test_assign_standards_explicit():
+    """Test assigning standards from an explicit mapping and reporting missing ones."""
+    model = _office_model(2)
+    mapping = {'Room_0': '2013::Hospital::ICU_PatRm'}
+    stats = assign_standards(model, mapping)
+    assert stats['program_types'] == 1
+    assert len(stats['unassigned']) == 2
+    assert model.rooms[0].properties.energy.program_type.identifier == \
+        '2013::Hospital::ICU_PatRm'
+
+    with pytest.raises(ValueError) as e:
+        assign_standards(model, {'Room_0': 'Not A Program', 'Room_1': 'Missing'},
+                         {'Room_0': 'Not A Set'})
+    assert '3 standards objects' in str(e.value)
+    assert model.rooms[0].properties.energy.program_type.identifier == \
+        '2013::Hospital::ICU_PatRm'
@@ -0,0 +1,45 @@
+# coding=utf-8
+from honeybee_energy.programtype import ProgramType
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+import honeybee_energy.lib.programtypes as prog_type_lib
+
+from standards_update._lib._async import aprogram_type_by_identifier, \
+    aschedule_by_identifier, agather
+
+import time
+import asyncio
+import pytest
+
+
+def test_aprogram_type_by_identifier():
+    """Test getting program types and schedules asynchronously."""
+    p_type_id = prog_type_lib.PROGRAM_TYPES[-1]
+    p_type = asyncio.run(aprogram_type_by_identifier(p_type_id))
+    assert isinstance(p_type, ProgramType)
+    assert p_type.identifier == p_type_id
+
+    sch_id = p_type.people.occupancy_schedule.identifier
+    sch = asyncio.run(aschedule_by_identifier(sch_id))
+    assert isinstance(sch, ScheduleRuleset)
+
+    with pytest.raises(ValueError):
+        asyncio.run(aprogram_type_by_identifier('Not A Program'))
+
+
+def test_agather_coalesce(monkeypatch):
+    """Test that concurrent requests for the same object only load it once."""
+    p_type_ids = list(prog_type_lib.PROGRAM_TYPES[-3:])
+    calls = []
+    lib_function = prog_type_lib.program_type_by_identifier
+
+    def slow_lookup(identifier):
+        calls.append(identifier)
+        time.sleep(0.05)
+        return lib_function(identifier)
+
+    monkeypatch.setattr(prog_type_lib, 'program_type_by_identifier', slow_lookup)
+    identifiers = p_type_ids * 4
+    p_types = asyncio.run(agather(aprogram_type_by_identifier, identifiers))
+    assert [p.identifier for p in p_types] == identifiers
+    assert sorted(calls) == sorted(p_type_ids)
+    assert p_types[0] is p_types[len(p_type_ids)]
@@ -0,0 +1,48 @@
+# coding=utf-8
+from standards_update._lib._catalog import load_catalog
+from standards_update._lib._binary import write_binary_catalog, BinaryCatalog
+
+import os
+import sys
+import subprocess
+import pytest
+
+
+def test_binary_catalog_round_trip(tmpdir):
+    """Test that all records of the binary catalog match the abridged dictionaries."""
+    catalog_file = write_binary_catalog(str(tmpdir.join('catalog.bin')))
+    data = load_catalog()
+    with BinaryCatalog(catalog_file) as catalog:
+        assert catalog.record_count == sum(len(objs) for objs in data.values())
+        for obj_type, obj_dicts in data.items():
+            records = catalog[obj_type]
+            for obj_id, obj_dict in obj_dicts.items():
+                assert records[obj_id] == obj_dict
+        assert catalog.identifiers('construction_set') == list(data['construction_set'])
+
+        p_type_id = '2019::LargeOffice::OpenOffice'
+        assert p_type_id in catalog['program_type']
+        assert p_type_id not in catalog['schedule']
+        with pytest.raises(ValueError):
+            catalog.record('program_type', 'Not A Program')
+        objects, missing = catalog.closure('program_type', [p_type_id, 'Missing'])
+        assert missing == ['Missing']
+        occ_sch = data['program_type'][p_type_id]['people']['occupancy_schedule']
+        assert objects['schedule'][occ_sch] == data['schedule'][occ_sch]
+
+
+def test_binary_catalog_invalid(tmpdir):
+    """Test that files that are not binary catalogs raise an error."""
+    bad_file = str(tmpdir.join('bad.bin'))
+    with open(bad_file, 'wb') as fp:
+        fp.write(b'{"not": "a catalog"}')
+    with pytest.raises(ValueError):
+        BinaryCatalog(bad_file)
+
+
+def test_binary_catalog_import():
+    """Test that the binary catalog can be imported without honeybee_energy."""
+    code = 'import sys; import standards_update._lib._binary; ' \
+        'print("honeybee_energy" in sys.modules)'
+    result = subprocess.check_output([sys.executable, '-c', code], cwd=os.getcwd())
+    assert result.decode('utf-8').strip() == 'False'
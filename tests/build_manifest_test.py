@@ -0,0 +1,155 @@
+# coding=utf-8
+from standards_update._util._manifest import BuildManifest, source_hash
+from standards_update._util._to_honeybee import translate_records
+import standards_update._util._all as all_util
+
+import os
+import json
+
+
+def test_build_manifest_is_current(tmpdir):
+    """Test that the manifest only reports outputs as current when inputs are unchanged."""
+    in_file = str(tmpdir.join('input.json'))
+    out_file = str(tmpdir.join('output.json'))
+    man_file = str(tmpdir.join('build_manifest.json'))
+    with open(in_file, 'w') as f:
+        json.dump({'a': 1}, f)
+    with open(out_file, 'w') as f:
+        json.dump({'a': 1}, f)
+
+    manifest = BuildManifest(man_file)
+    assert not manifest.is_current('step', [in_file], [out_file])
+    manifest.update('step', [in_file])
+    manifest.save()
+
+    manifest = BuildManifest(man_file)
+    assert manifest.is_current('step', [in_file], [out_file])
+    assert not BuildManifest(man_file, force=True).is_current(
+        'step', [in_file], [out_file])
+    assert not BuildManifest(man_file, environment={'honeybee-energy': 'x'}).is_current(
+        'step', [in_file], [out_file])
+
+    with open(in_file, 'w') as f:
+        json.dump({'a': 2}, f)
+    assert not manifest.is_current('step', [in_file], [out_file])
+    os.remove(out_file)
+    assert not manifest.is_current('step', [in_file], [out_file])
+
+
+def test_translate_records_reuses_unchanged(tmpdir):
+    """Test that only changed records are re-translated."""
+    dest_file = str(tmpdir.join('output.json'))
+    manifest = BuildManifest(str(tmpdir.join('build_manifest.json')))
+    translated = []
+
+    def _translate(obj_id):
+        translated.append(obj_id)
+        return {'identifier': obj_id}
+
+    src_dict = {'a': {'value': 1}, 'b': {'value': 2}}
+    hb_dict = translate_records(src_dict, _translate, dest_file, manifest, 'file')
+    assert sorted(translated) == ['a', 'b']
+    with open(dest_file, 'w') as fp:
+        json.dump(hb_dict, fp)
+
+    translated[:] = []
+    src_dict['b']['value'] = 3
+    src_dict['c'] = {'value': 4}
+    hb_dict = translate_records(src_dict, _translate, dest_file, manifest, 'file')
+    assert sorted(translated) == ['b', 'c']
+    assert sorted(hb_dict.keys()) == ['a', 'b', 'c']
+    assert manifest.report['records_rebuilt']['file'] == ['b', 'c']
+
+
+def test_build_manifest_source_hash(tmpdir):
+    """Test that the source hash changes with any Python source of a folder."""
+    src_dir = tmpdir.mkdir('extension')
+    src_dir.join('__init__.py').write('')
+    sub_dir = src_dir.mkdir('material')
+    sub_dir.join('opaque.py').write('x = 1\n')
+    sub_dir.join('notes.txt').write('not a source')
+    src_hash = source_hash(str(src_dir))
+    assert source_hash(str(src_dir)) == src_hash
+
+    sub_dir.join('notes.txt').write('still not a source')
+    assert source_hash(str(src_dir)) == src_hash
+    sub_dir.join('opaque.py').write('x = 2\n')
+    assert source_hash(str(src_dir)) != src_hash
+    sub_dir.join('opaque.py').write('x = 1\n')
+    src_dir.join('_units.py').write('')
+    assert source_hash(str(src_dir)) != src_hash
+
+
+def _fake_cleaners(monkeypatch):
+    """Replace the gem cleaning functions of clean_all with small JSON writers."""
+    def write(file_path, data):
+        with open(file_path, 'w') as fp:
+            json.dump(data, fp)
+        return file_path
+
+    def clean_schedules(source, dest_dir):
+        return write(os.path.join(dest_dir, 'schedule.json'), {})
+
+    def clean_space_types(source, dest_dir, vintage):
+        for f in ('data', 'registry'):
+            write(os.path.join(dest_dir, '{}_{}.json'.format(vintage, f)), {})
+
+    def clean_materials(source, dest_dir):
+        return [write(os.path.join(dest_dir, '{}_material.json'.format(m)), {})
+                for m in ('opaque', 'window')]
+
+    def clean_constructions(source, dest_dir):
+        return [write(os.path.join(dest_dir, '{}_construction.json'.format(c)),
+                      {'Wall': {}}) for c in ('opaque', 'window')]
+
+    def clean_construction_sets(source, dest_dir, vintage, constr_file, mat_file):
+        with open(source) as f:
+            r_value = json.load(f)
+        with open(constr_file) as f:
+            constrs = json.load(f)
+        constrs['Wall-R{}'.format(r_value)] = {}
+        write(constr_file, constrs)
+        return write(os.path.join(dest_dir, '{}_data.json'.format(vintage)), {})
+
+    for func in (clean_schedules, clean_space_types, clean_materials,
+                 clean_constructions, clean_construction_sets):
+        monkeypatch.setattr(all_util, func.__name__, func)
+
+
+def test_clean_all_prunes_insulation_variants(tmpdir, monkeypatch):
+    """Test that an incremental clean_all writes the same constructions as a forced one."""
+    _fake_cleaners(monkeypatch)
+    gem_dir = str(tmpdir.mkdir('gem'))
+    os.mkdir(os.path.join(gem_dir, 'data'))
+    for f_name in ('schedules', 'materials', 'constructions'):
+        with open(os.path.join(gem_dir, 'data', 'ashrae_90_1.{}.json'.format(f_name)),
+                  'w') as fp:
+            json.dump({}, fp)
+    c_set_sources = {}
+    for vintage, folder in all_util._VINTAGES:
+        os.makedirs(os.path.join(gem_dir, folder, 'data'))
+        for f_name in ('spc_typ', 'construction_properties'):
+            f_path = os.path.join(
+                gem_dir, folder, 'data', '{}.{}.json'.format(folder, f_name))
+            with open(f_path, 'w') as fp:
+                json.dump(10, fp)
+            c_set_sources[vintage] = f_path
+    dest_dir = str(tmpdir.mkdir('dest'))
+    constr_file = os.path.join(dest_dir, 'opaque_construction.json')
+
+    all_util.clean_all(gem_dir, dest_dir)
+    report = all_util.clean_all(gem_dir, dest_dir)
+    assert 'construction' in report['skipped']
+
+    # change the insulation of every vintage such that the old variant is not needed
+    for vintage in c_set_sources:
+        with open(c_set_sources[vintage], 'w') as fp:
+            json.dump(20, fp)
+    report = all_util.clean_all(gem_dir, dest_dir)
+    assert 'construction' in report['rebuilt']
+    with open(constr_file) as f:
+        incremental = json.load(f)
+    all_util.clean_all(gem_dir, dest_dir, force=True)
+    with open(constr_file) as f:
+        assert json.load(f) == incremental == {'Wall': {}, 'Wall-R20': {}}
+
@@ -0,0 +1,45 @@
+# coding=utf-8
+from standards_update._lib._loadjson import load_json, data_file_path
+from standards_update._util._compress import compress_data
+
+import os
+import json
+import shutil
+import pytest
+
+
+@pytest.mark.parametrize('compression', ['.gz', '.xz', '.bz2'])
+def test_compress_data_round_trip(tmpdir, compression):
+    """Test that compressed data files load to the same data as the original."""
+    data_dir = str(tmpdir.join('data'))
+    os.mkdir(data_dir)
+    src_file = './honeybee_energy_standards/constructionsets/2019_data.json'
+    json_file = os.path.join(data_dir, '2019_data.json')
+    shutil.copy(src_file, json_file)
+    original = load_json(json_file)
+
+    compressed = compress_data(data_dir, compression)
+    assert compressed == [json_file + compression]
+    assert not os.path.isfile(json_file)
+    assert os.path.getsize(compressed[0]) < os.path.getsize(src_file)
+    assert os.path.isfile(os.path.join(data_dir, 'checksums.sha256'))
+
+    assert data_file_path(json_file) == compressed[0]
+    assert load_json(json_file) == original
+
+
+def test_load_json_bad_checksum(tmpdir):
+    """Test that a data file that does not match its checksum raises an error."""
+    data_dir = str(tmpdir.join('data'))
+    os.mkdir(data_dir)
+    json_file = os.path.join(data_dir, 'data.json')
+    with open(json_file, 'w') as fp:
+        json.dump({'a': 1}, fp)
+    compress_data(data_dir, '.gz', remove_json=False)
+    with open(json_file, 'w') as fp:
+        json.dump({'a': 2}, fp)
+
+    with pytest.raises(ValueError):
+        load_json(json_file)
+    with pytest.raises(FileNotFoundError):
+        load_json(os.path.join(data_dir, 'missing.json'))
@@ -2,6 +2,10 @@
 from honeybee_energy.constructionset import ConstructionSet
 import honeybee_energy.lib.constructionsets as constr_set_lib
 
+from standards_update._lib.constructionsets import construction_set_by_climate_zone
+
+import pytest
+
 
 def test_construction_set_lib():
     """Test that the honeybee-energy lib has been extended with new counstruction set data."""
@@ -19,3 +23,23 @@ def test_construction_set_by_identifier():
     for c_set in constr_set_lib.CONSTRUCTION_SETS:
         cset_from_lib = constr_set_lib.construction_set_by_identifier(c_set)
         assert isinstance(cset_from_lib, ConstructionSet)
+
+
+def test_construction_set_by_climate_zone():
+    """Test getting construction sets from ASHRAE climate zones."""
+    c_set = construction_set_by_climate_zone('2019', '4C', 'Mass')
+    assert c_set.identifier == '2019::ClimateZone4::Mass'
+    assert construction_set_by_climate_zone('2019', '4C', 'Mass') is c_set
+    assert construction_set_by_climate_zone('2019', '4A', 'Mass') is c_set
+
+    assert construction_set_by_climate_zone('2013', '0A').identifier == \
+        '2013::ClimateZone1::SteelFramed'
+    assert construction_set_by_climate_zone('pre_1980', 7, 'MetalBuilding').identifier \
+        == 'pre_1980::ClimateZone7::Metal Building'
+
+    with pytest.raises(ValueError):
+        construction_set_by_climate_zone('2019', '9A')
+    with pytest.raises(ValueError):
+        construction_set_by_climate_zone('2020', '4A')
+    with pytest.raises(ValueError):
+        construction_set_by_climate_zone('2019', '4A', 'Adobe')
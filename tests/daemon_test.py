@@ -0,0 +1,119 @@
+# coding=utf-8
+from honeybee_energy.programtype import ProgramType
+from honeybee_energy.constructionset import ConstructionSet
+import honeybee_energy.lib.materials as mat_lib
+import honeybee_energy.lib.constructions as constr_lib
+import honeybee_energy.lib.schedules as sch_lib
+import honeybee_energy.lib.programtypes as prog_type_lib
+import honeybee_energy.lib.constructionsets as constr_set_lib
+
+from standards_update._lib._daemon import StandardsServer, StandardsClient
+
+import os
+import sys
+import subprocess
+import pytest
+
+# the dictionaries of the honeybee_energy.lib in which the client stores objects
+LIB_CACHES = (
+    mat_lib._opaque_materials, mat_lib._window_materials,
+    constr_lib._opaque_constructions, constr_lib._window_constructions,
+    constr_set_lib._construction_sets, sch_lib._schedules,
+    prog_type_lib._program_types
+)
+
+
+@pytest.fixture
+def server(tmpdir):
+    """Start a StandardsServer on a socket in a temporary folder."""
+    standards_server = StandardsServer(str(tmpdir.join('standards.sock')))
+    standards_server.start()
+    yield standards_server
+    standards_server.stop()
+
+
+@pytest.fixture
+def lib_caches():
+    """Remove the objects that the client adds to the honeybee_energy.lib after a test."""
+    existing = [set(cache) for cache in LIB_CACHES]
+    yield
+    for cache, keys in zip(LIB_CACHES, existing):
+        for obj_id in [o_id for o_id in cache if o_id not in keys]:
+            del cache[obj_id]
+
+
+def test_daemon_import():
+    """Test that the server and client can be imported without honeybee_energy."""
+    code = 'import sys; import standards_update._lib._daemon; ' \
+        'print("honeybee_energy" in sys.modules)'
+    result = subprocess.check_output([sys.executable, '-c', code], cwd=os.getcwd())
+    assert result.decode('utf-8').strip() == 'False'
+
+
+def test_daemon_records(server):
+    """Test getting abridged records and closures from the server."""
+    client = StandardsClient(server.socket_path)
+    assert client.request('ping') == {'status': 'ok'}
+
+    c_set_id = '2019::ClimateZone4::Mass'
+    response = client.request('records', 'construction_set', [c_set_id, 'Missing'])
+    assert list(response['objects']['construction_set']) == [c_set_id]
+    assert response['missing'] == ['Missing']
+
+    response = client.request('closure', 'construction_set', [c_set_id])
+    objects = response['objects']
+    wall_id = objects['construction_set'][c_set_id]['wall_set']['exterior_construction']
+    assert wall_id in objects['opaque_construction']
+    for mat in objects['opaque_construction'][wall_id]['materials']:
+        assert mat in objects['opaque_material']
+
+    with pytest.raises(ValueError):
+        client.request('closure', 'not_a_type', [c_set_id])
+    client.close()
+    assert os.path.exists(server.socket_path)
+
+
+def test_daemon_client_objects(server, lib_caches, monkeypatch):
+    """Test that the client can replace the functions of the honeybee_energy.lib."""
+    client = StandardsClient(server.socket_path)
+    lib_functions = (
+        (mat_lib, 'opaque_material_by_identifier'),
+        (mat_lib, 'window_material_by_identifier'),
+        (constr_lib, 'opaque_construction_by_identifier'),
+        (constr_lib, 'window_construction_by_identifier'),
+        (constr_set_lib, 'construction_set_by_identifier'),
+        (sch_lib, 'schedule_by_identifier'),
+        (prog_type_lib, 'program_type_by_identifier')
+    )
+    for lib_module, func_name in lib_functions:  # restore the functions after the test
+        monkeypatch.setattr(lib_module, func_name, getattr(lib_module, func_name))
+    client.install()
+
+    p_type_id = '2019::LargeOffice::OpenOffice'
+    p_type = prog_type_lib.program_type_by_identifier(p_type_id)
+    assert isinstance(p_type, ProgramType)
+    assert p_type.to_dict(abridged=True) == server.catalog['program_type'][p_type_id]
+    assert prog_type_lib.program_type_by_identifier(p_type_id) is p_type
+
+    c_set = constr_set_lib.construction_set_by_identifier('2019::ClimateZone4::Mass')
+    assert isinstance(c_set, ConstructionSet)
+    with pytest.raises(ValueError):
+        prog_type_lib.program_type_by_identifier('Not A Program')
+    client.close()
+
+
+def test_daemon_client_skips_standards_parse(server):
+    """Test that a client process does not make honeybee_energy parse the JSON catalog."""
+    code = 'import sys; from standards_update._lib._daemon import StandardsClient; ' \
+        'StandardsClient(sys.argv[1]).install(); ' \
+        'import honeybee_energy.lib._loadprogramtypes as load_lib; ' \
+        'import honeybee_energy.lib._loadmaterials as load_mat_lib; ' \
+        'import honeybee_energy.lib.programtypes as prog_type_lib; ' \
+        'p_type = prog_type_lib.program_type_by_identifier(sys.argv[2]); ' \
+        'print(len(load_lib._program_types_standards_dict), ' \
+        'len(load_mat_lib._opaque_mat_standards_dict), p_type.identifier)'
+    p_type_id = '2019::LargeOffice::OpenOffice'
+    result = subprocess.check_output(
+        [sys.executable, '-c', code, server.socket_path, p_type_id], cwd=os.getcwd())
+    assert result.decode('utf-8').strip() == '0 0 {}'.format(p_type_id)
+
@@ -0,0 +1,40 @@
+# coding=utf-8
+from standards_update._util._diff import diff_vintages, diff_summary, \
+    diff_all_vintages, VINTAGES
+
+import os
+import json
+import pytest
+
+
+def test_diff_vintages():
+    """Test the diff of two vintages of the packaged data."""
+    diff = diff_vintages('2016', '2019')
+    assert diff['base'] == '2016' and diff['other'] == '2019'
+    office = diff['program_types']['changed']['LargeOffice::OpenOffice']
+    lpd = office['lighting.watts_per_area']
+    assert lpd['delta'] == pytest.approx(lpd['other'] - lpd['base'])
+    assert 'people.people_per_area' not in office
+
+    c_set = diff['construction_sets']['changed']['ClimateZone1::SteelFramed']
+    window = c_set['aperture_set.window_construction']
+    assert window['delta'] is None
+    assert 'aperture_set.window_construction.u_factor' in c_set
+    assert 'lighting.watts_per_area' in diff_summary(diff)
+
+
+def test_diff_same_vintage():
+    """Test that a vintage has no differences from itself."""
+    diff = diff_vintages('2019', '2019')
+    for obj_type in ('program_types', 'construction_sets'):
+        assert diff[obj_type] == {'added': [], 'removed': [], 'changed': {}}
+
+
+def test_diff_all_vintages(tmpdir):
+    """Test the diff of all vintages written to a file."""
+    dest_file = str(tmpdir.join('diff.json'))
+    diffs = diff_all_vintages(dest_file=dest_file)
+    assert len(diffs) == len(VINTAGES) - 1
+    assert os.path.isfile(dest_file)
+    with open(dest_file) as f:
+        assert json.load(f) == diffs
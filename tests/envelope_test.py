@@ -0,0 +1,94 @@
+# coding=utf-8
+import honeybee_energy.lib.constructions as constr_lib
+
+import standards_update._lib._envelope as envelope
+
+from standards_update._lib._envelope import material_resistance, OpaqueResistances
+from standards_update._util._construction_set import adjust_typical_insulation
+
+import pytest
+
+
+def test_material_resistance():
+    """Test the resistance of honeybee and standards gem material dictionaries."""
+    assert material_resistance({'type': 'EnergyMaterialNoMass', 'r_value': 2.5}) == 2.5
+    assert material_resistance(
+        {'type': 'EnergyMaterial', 'thickness': 0.2, 'conductivity': 0.5}) == 0.4
+    assert material_resistance(
+        {'name': 'CP02 CARPET PAD', 'material_type': 'MasslessOpaqueMaterial',
+         'resistance': 0.160253201}) == 0.160253201
+    assert material_resistance(
+        {'name': 'G01 13mm gypsum board', 'material_type': 'StandardOpaqueMaterial',
+         'thickness': 0.5, 'conductivity': 1.10957}) == 0.5 / 1.10957
+    with pytest.raises(ValueError):
+        material_resistance({'identifier': 'Bad Material', 'thickness': 0.2})
+
+
+def test_opaque_resistances_match_honeybee():
+    """Test that the R-values of all constructions match those of honeybee objects."""
+    store = OpaqueResistances.from_data_folder()
+    r_values = store.r_values()
+    u_values = store.u_values()
+    u_factors = store.u_factors()
+    assert len(r_values) == len(store.construction_identifiers) > 200
+    for constr_id, r_val in r_values.items():
+        constr = constr_lib.opaque_construction_by_identifier(constr_id)
+        assert r_val == pytest.approx(constr.r_value, rel=1e-9)
+        assert u_values[constr_id] == pytest.approx(constr.u_value, rel=1e-9)
+        assert u_factors[constr_id] == pytest.approx(constr.u_factor, rel=1e-9)
+    with pytest.raises(ValueError):
+        store.r_value('Not A Construction')
+
+
+def test_opaque_resistances_missing_material():
+    """Test that constructions referencing missing materials raise an error."""
+    materials = {'Insulation': {'type': 'EnergyMaterialNoMass', 'r_value': 2}}
+    constructions = {'Wall': {'materials': ['Insulation', 'Missing Material']}}
+    with pytest.raises(ValueError):
+        OpaqueResistances(materials, constructions)
+
+
+def test_opaque_resistances_without_numpy(monkeypatch):
+    """Test that the NumPy and pure Python sums of the layers give the same results."""
+    pytest.importorskip('numpy')
+    store = OpaqueResistances.from_data_folder()
+    r_values, u_factors = store.r_values(), store.u_factors()
+    monkeypatch.setattr(envelope, 'numpy', None)
+    py_store = OpaqueResistances.from_data_folder()
+    py_r_values, py_u_factors = py_store.r_values(), py_store.u_factors()
+    assert list(py_r_values) == list(r_values)
+    for constr_id, r_val in r_values.items():
+        assert py_r_values[constr_id] == pytest.approx(r_val, rel=1e-12)
+        assert py_u_factors[constr_id] == pytest.approx(u_factors[constr_id], rel=1e-12)
+
+
+def test_opaque_resistances_empty_construction():
+    """Test that constructions without any materials raise an error."""
+    materials = {'Insulation': {'type': 'EnergyMaterialNoMass', 'r_value': 2}}
+    constructions = {'Wall': {'materials': ['Insulation']}, 'Empty': {'materials': []}}
+    with pytest.raises(ValueError):
+        OpaqueResistances(materials, constructions)
+
+
+def test_adjust_typical_insulation_standard_materials():
+    """Test adjusting the insulation of a construction with standard gem materials."""
+    material_dict = {
+        'G01 13mm gypsum board': {
+            'name': 'G01 13mm gypsum board', 'material_type': 'StandardOpaqueMaterial',
+            'thickness': 0.5, 'conductivity': 1.10957},
+        'Typical Insulation': {
+            'name': 'Typical Insulation', 'material_type': 'MasslessOpaqueMaterial',
+            'resistance': 0.16}
+    }
+    construction_dict = {
+        'Typical Wall': {
+            'name': 'Typical Wall',
+            'materials': ['G01 13mm gypsum board', 'Typical Insulation']}
+    }
+    base_constr = {'construction': 'Typical Wall', 'assembly_maximum_u_value': 0.1,
+                   'assembly_maximum_f_factor': None,
+                   'assembly_maximum_c_factor': None}
+    new_id = adjust_typical_insulation(base_constr, construction_dict, material_dict)
+    assert new_id == 'Typical Wall-R10'
+    assert construction_dict[new_id]['materials'] == \
+        ['G01 13mm gypsum board', 'Typical Insulation-R10']
@@ -0,0 +1,86 @@
+# coding=utf-8
+import honeybee_energy.lib.constructions as constr_lib
+import honeybee_energy.lib.schedules as sched_lib
+import honeybee_energy.lib.materials as mat_lib
+import honeybee_energy.lib.programtypes as program_lib
+
+from standards_update._lib._idfcache import IDFCache
+
+import os
+import threading
+
+
+def test_idf_cache_matches_to_idf(tmpdir):
+    """Test that the cached IDF strings are the same as those of honeybee-energy."""
+    cache = IDFCache(str(tmpdir))
+    constr_id = 'Typical Insulated Steel Framed Exterior Wall-R9'
+    assert cache.construction_idf(constr_id) == \
+        constr_lib.opaque_construction_by_identifier(constr_id).to_idf()
+
+    schedule = sched_lib.schedule_by_identifier('OfficeLarge BLDG_OCC_SCH')
+    year_sch, week_schs, day_schs = cache.schedule_idf(schedule.identifier)
+    assert (year_sch, week_schs) == schedule.to_idf()
+    assert len(day_schs) == len(schedule.day_schedules)
+    assert cache.schedule_idf('Always On')[1:] == ([], [])
+
+    program = program_lib.program_type_by_identifier('2019::LargeOffice::OpenOffice')
+    for zone_id in ('Z', 'A_Much_Longer_Zone_Identifier_Than_The_Padding'):
+        loads = cache.program_type_idf(program.identifier, zone_id)
+        assert loads['people'] == program.people.to_idf(zone_id)
+        assert loads['setpoint'] == program.setpoint.to_idf(zone_id)
+        assert 'service_hot_water' not in loads
+
+
+def test_idf_cache_persists(tmpdir):
+    """Test that the IDF strings are saved to disk and shared across caches."""
+    cache = IDFCache(str(tmpdir))
+    constr_id = 'Typical Insulated Steel Framed Exterior Wall-R9'
+    constr_idf = cache.construction_idf(constr_id)
+    cache.program_type_idf('2019::LargeOffice::OpenOffice', 'Z')
+    assert cache.save() == 2
+    assert cache.save() == 0
+    assert os.path.isfile(os.path.join(cache.version_dir, 'construction.json'))
+
+    other_cache = IDFCache(str(tmpdir))
+    other_cache.material_idf('25mm Stucco')
+    assert other_cache.construction_idf(constr_id) == constr_idf
+    assert other_cache.save() == 1  # only the material was new
+
+    cache.clear()
+    assert not os.path.isfile(os.path.join(cache.version_dir, 'construction.json'))
+
+
+def test_idf_cache_humidistat(tmpdir, monkeypatch):
+    """Test that the humidistat of a setpoint is cached next to its thermostat."""
+    program = program_lib.program_type_by_identifier(
+        '2019::LargeOffice::OpenOffice').duplicate()
+    program.setpoint.humidifying_setpoint = 30
+    program.setpoint.dehumidifying_setpoint = 60
+    monkeypatch.setattr(program_lib, 'program_type_by_identifier',
+                        lambda identifier: program)
+
+    cache = IDFCache(str(tmpdir))
+    cache.program_type_idf(program.identifier, 'Z')
+    cache.save()
+    loads = IDFCache(str(tmpdir)).program_type_idf(program.identifier, 'Zone 2')
+    assert loads['setpoint'] == program.setpoint.to_idf('Zone 2')
+    assert loads['humidistat'] == program.setpoint.to_idf_humidistat('Zone 2')
+
+
+def test_idf_cache_concurrent_saves(tmpdir):
+    """Test that caches saving at the same time keep each other's objects."""
+    caches = []
+    for mat_id in mat_lib.OPAQUE_MATERIALS[:8]:
+        cache = IDFCache(str(tmpdir))
+        cache.material_idf(mat_id)
+        caches.append(cache)
+    threads = [threading.Thread(target=cache.save) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    other_cache = IDFCache(str(tmpdir))
+    for mat_id in mat_lib.OPAQUE_MATERIALS[:8]:
+        other_cache.material_idf(mat_id)
+    assert other_cache.save() == 0  # every material was on disk
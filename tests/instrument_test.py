@@ -0,0 +1,102 @@
+# coding=utf-8
+import honeybee_energy.lib.schedules as hb_sched_lib
+import honeybee_energy.lib.programtypes as hb_program_lib
+
+import standards_update._lib.schedules as sched_lib
+import standards_update._lib.programtypes as program_lib
+from standards_update._lib import _instrument
+
+import os
+import json
+import threading
+import pytest
+
+
+@pytest.fixture
+def gem_program(monkeypatch):
+    """Add a standards gem program type and schedule to the _lib loaders."""
+    with open('./tests/standards/OpenStudio_Standards_schedule.json', 'r') as f:
+        sched_dict = json.load(f)['Large Office Bldg Occ']
+    prog_dict = {
+        'space_type': 'Instrument Test Office',
+        'occupancy_per_area': 5.25,
+        'occupancy_schedule': 'Large Office Bldg Occ',
+        'occupancy_activity_schedule': 'Seated Adult Activity'
+    }
+    monkeypatch.setitem(sched_lib._schedule_standards_dict,
+                        'Large Office Bldg Occ', sched_dict)
+    monkeypatch.setitem(program_lib._program_type_standards_dict,
+                        'Instrument Test Office', prog_dict)
+    # route the schedules of the program type through the _lib loader
+    monkeypatch.setattr(hb_sched_lib, 'schedule_by_identifier',
+                        sched_lib.schedule_by_identifier)
+    yield
+    _instrument.disable()
+    _instrument.reset()
+    hb_sched_lib._schedules.pop('Large Office Bldg Occ', None)
+    hb_program_lib._program_types.pop('Instrument Test Office', None)
+
+
+def test_instrument_counts(gem_program):
+    """Test the hits, misses, errors and build times recorded by instrumentation."""
+    original = program_lib.program_type_by_identifier
+    _instrument.enable()
+    assert _instrument.is_enabled()
+    assert program_lib.program_type_by_identifier is not original
+    assert hb_sched_lib.schedule_by_identifier is sched_lib.schedule_by_identifier
+
+    program_lib.program_type_by_identifier('Instrument Test Office')
+    program_lib.program_type_by_identifier('Instrument Test Office')
+    with pytest.raises(ValueError):
+        program_lib.program_type_by_identifier('Not A Program Type')
+
+    summary = _instrument.report(top=2)
+    prog_report = summary['objects']['program_type']
+    assert (prog_report['hits'], prog_report['misses'], prog_report['errors']) == \
+        (1, 1, 1)
+    sched_report = summary['objects']['schedule']
+    assert (sched_report['hits'], sched_report['misses']) == (1, 1)
+    # the time to build the schedule is excluded from the program type's own time
+    assert prog_report['own_time'] < prog_report['build_time']
+    assert abs(prog_report['build_time'] - prog_report['own_time'] -
+               sched_report['build_time']) < 1e-9
+    assert summary['slowest'][0][:2] == ('program_type', 'Instrument Test Office')
+    assert len(summary['slowest']) == 2
+
+    _instrument.disable()
+    assert not _instrument.is_enabled()
+    assert program_lib.program_type_by_identifier is original
+    _instrument.reset()
+    assert _instrument.report()['objects']['program_type']['misses'] == 0
+
+
+def test_instrument_trace(gem_program, tmpdir):
+    """Test writing the recorded builds to a Chrome trace event JSON."""
+    _instrument.enable(trace=True)
+    program_lib.program_type_by_identifier('Instrument Test Office')
+    trace_file = _instrument.write_trace(str(tmpdir.join('trace.json')))
+
+    assert os.path.isfile(trace_file)
+    with open(trace_file, 'r') as f:
+        events = json.load(f)['traceEvents']
+    build_events = [e for e in events if e['cat'] != 'parse']
+    assert [e['cat'] for e in build_events] == ['schedule', 'program_type']
+    assert all(e['ph'] == 'X' and e['dur'] >= 0 for e in events)
+
+
+def test_instrument_threads(gem_program):
+    """Test that the calls made from several threads are all recorded."""
+    _instrument.enable()
+    program_lib.program_type_by_identifier('Instrument Test Office')
+
+    def get_program():
+        for _ in range(500):
+            program_lib.program_type_by_identifier('Instrument Test Office')
+
+    threads = [threading.Thread(target=get_program) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    prog_report = _instrument.report()['objects']['program_type']
+    assert (prog_report['hits'], prog_report['misses']) == (4000, 1)
@@ -0,0 +1,177 @@
+# coding=utf-8
+import honeybee_energy.lib.materials as hb_mat_lib
+from honeybee_energy.lib.materials import _opaque_materials
+from honeybee_energy.lib.constructions import _opaque_constructions
+from honeybee_energy.material.dictutil import dict_to_material
+from honeybee_energy.construction.opaque import OpaqueConstruction
+
+import standards_update._lib.materials as mat_lib
+import standards_update._lib.constructions as constr_lib
+from standards_update._lib._loadjson import load_json
+from standards_update._lib._envelope import insulation_variant
+from standards_update._util._insulation import find_insulation_variants, \
+    remove_insulation_variants
+
+import os
+import json
+import shutil
+import pytest
+
+MATERIALS = {
+    'G01 13mm gypsum board': {
+        'name': 'G01 13mm gypsum board', 'material_type': 'StandardOpaqueMaterial',
+        'roughness': 'Smooth', 'thickness': 0.5, 'conductivity': 1.10957,
+        'density': 49.9424, 'specific_heat': 0.260516252, 'thermal_absorptance': 0.9,
+        'solar_absorptance': 0.7, 'visible_absorptance': 0.5},
+    'Typical Insulation': {
+        'name': 'Typical Insulation', 'material_type': 'MasslessOpaqueMaterial',
+        'roughness': 'MediumSmooth', 'resistance': 0.16}
+}
+CONSTRUCTIONS = {
+    'Insulation Test Wall': {
+        'name': 'Insulation Test Wall',
+        'materials': ['G01 13mm gypsum board', 'Typical Insulation',
+                      'G01 13mm gypsum board']},
+    'Insulation Test Partition': {
+        'name': 'Insulation Test Partition',
+        'materials': ['G01 13mm gypsum board']}
+}
+
+
+@pytest.fixture
+def gem_constructions(monkeypatch):
+    """Add standards gem constructions and materials to the _lib loaders."""
+    for mat_id, mat_dict in MATERIALS.items():
+        monkeypatch.setitem(mat_lib._opaque_standards_dict, mat_id, mat_dict)
+    for constr_id, constr_dict in CONSTRUCTIONS.items():
+        monkeypatch.setitem(constr_lib._opaque_constr_standards_dict,
+                            constr_id, constr_dict)
+    # route the materials of the constructions through the _lib loader
+    monkeypatch.setattr(hb_mat_lib, 'opaque_material_by_identifier',
+                        mat_lib.opaque_material_by_identifier)
+    yield
+    for obj_dict in (_opaque_materials, _opaque_constructions):
+        for obj_id in list(obj_dict.keys()):
+            if obj_id.startswith(('Insulation Test', 'Typical Insulation')) or \
+                    obj_id in MATERIALS:
+                del obj_dict[obj_id]
+
+
+def test_insulation_variant():
+    """Test splitting the identifiers of insulation variants."""
+    assert insulation_variant('Typical IEAD Roof-R32') == ('Typical IEAD Roof', 32)
+    assert insulation_variant('Typical Insulation-R7') == ('Typical Insulation', 7)
+    assert insulation_variant('Typical IEAD Roof') is None
+    assert insulation_variant('Typical Roof-R') is None
+
+
+def test_synthesize_typical_insulation(gem_constructions):
+    """Test the synthesis of Typical Insulation materials of any R-value."""
+    mat = mat_lib.opaque_material_by_identifier('Typical Insulation-R75')
+    assert mat.r_value == pytest.approx(75 / 5.678263337, rel=1e-9)
+    assert mat.roughness == 'MediumSmooth'
+    assert mat._locked
+    assert mat_lib.opaque_material_by_identifier('Typical Insulation-R75') is mat
+
+    for bad_id in ('Typical Insulation-R0', 'G01 13mm gypsum board-R5',
+                   'Not A Material'):
+        with pytest.raises(ValueError):
+            mat_lib.opaque_material_by_identifier(bad_id)
+
+
+def test_synthesize_insulated_construction(gem_constructions):
+    """Test the synthesis of insulation-adjusted constructions of any R-value."""
+    base = constr_lib.opaque_construction_by_identifier('Insulation Test Wall')
+    base_r = base.r_value * 5.678263337  # about 1.06 h-ft2-F/Btu
+
+    constr = constr_lib.opaque_construction_by_identifier('Insulation Test Wall-R43')
+    assert constr.layers == ['G01 13mm gypsum board', 'Typical Insulation-R42',
+                             'G01 13mm gypsum board']
+    # the original Typical Insulation is counted in the base R-value like it is
+    # by adjust_typical_insulation and then replaced
+    assert constr.r_value * 5.678263337 - base_r == pytest.approx(42 - 0.16)
+    assert constr._locked
+    assert constr_lib.opaque_construction_by_identifier(
+        'Insulation Test Wall-R43') is constr
+
+    for bad_id in ('Insulation Test Wall-R1', 'Insulation Test Partition-R20',
+                   'Not A Construction-R20', 'Not A Construction'):
+        with pytest.raises(ValueError):
+            constr_lib.opaque_construction_by_identifier(bad_id)
+
+
+def test_stored_variants_match_synthesis(monkeypatch):
+    """Test that every stored insulation variant is identical to a synthesized one."""
+    constr_dir = './honeybee_energy_standards/constructions'
+    mat_dicts = load_json(os.path.join(constr_dir, 'opaque_material.json'))
+    materials = {m_id: dict_to_material(m_dict) for m_id, m_dict in mat_dicts.items()}
+    constr_dicts = load_json(os.path.join(constr_dir, 'opaque_construction.json'))
+    mat_ids = [m_id for m_id in mat_dicts if insulation_variant(m_id)]
+    constr_ids = [c_id for c_id in constr_dicts if insulation_variant(c_id)]
+    assert len(mat_ids) == 60 and len(constr_ids) == 133
+
+    # synthesize everything from the base objects of the shipped data
+    monkeypatch.setattr(mat_lib, '_opaque_materials', {})
+    monkeypatch.setattr(constr_lib, '_opaque_constructions', {})
+    for mat_id, mat in materials.items():
+        if not insulation_variant(mat_id):
+            mat_lib._opaque_materials[mat_id] = mat
+    for constr_id, c_dict in constr_dicts.items():
+        if not insulation_variant(constr_id):
+            constr_lib._opaque_constructions[constr_id] = \
+                OpaqueConstruction.from_dict_abridged(c_dict, materials)
+
+    for mat_id in mat_ids:
+        assert mat_lib.opaque_material_by_identifier(mat_id).to_dict() == \
+            materials[mat_id].to_dict()
+    for constr_id in constr_ids:
+        stored = OpaqueConstruction.from_dict_abridged(
+            constr_dicts[constr_id], materials)
+        assert constr_lib.opaque_construction_by_identifier(constr_id).to_dict() == \
+            stored.to_dict()
+
+
+def test_find_insulation_variants():
+    """Test finding the stored insulation variants that can be synthesized."""
+    constr_dict = dict(CONSTRUCTIONS)
+    constr_dict['Insulation Test Wall-R5'] = {
+        'name': 'Insulation Test Wall-R5',
+        'materials': ['G01 13mm gypsum board', 'Typical Insulation-R4',
+                      'G01 13mm gypsum board']}
+    # made from an unrounded R-value with less insulation than a synthesized one
+    constr_dict['Insulation Test Wall-R6'] = {
+        'name': 'Insulation Test Wall-R6',
+        'materials': ['G01 13mm gypsum board', 'Typical Insulation-R4',
+                      'G01 13mm gypsum board']}
+    mat_dict = dict(MATERIALS)
+    for r_val in (4, 5):
+        mat_dict['Typical Insulation-R{}'.format(r_val)] = {
+            'name': 'Typical Insulation-R{}'.format(r_val),
+            'material_type': 'MasslessOpaqueMaterial', 'resistance': r_val}
+    constrs, mats = find_insulation_variants(constr_dict, mat_dict)
+    assert constrs == ['Insulation Test Wall-R5']
+    assert mats == ['Typical Insulation-R5']
+
+
+def test_remove_insulation_variants(tmpdir):
+    """Test removing the reproducible insulation variants from the Honeybee JSONs."""
+    constr_file = str(tmpdir.join('opaque_construction.json'))
+    mat_file = str(tmpdir.join('opaque_material.json'))
+    src_dir = './honeybee_energy_standards/constructions'
+    shutil.copy(os.path.join(src_dir, 'opaque_construction.json'), constr_file)
+    shutil.copy(os.path.join(src_dir, 'opaque_material.json'), mat_file)
+
+    variants = remove_insulation_variants(constr_file, mat_file)
+    assert len(variants[constr_file]) == \
+        len([c for c in json.load(open(constr_file)) if insulation_variant(c)])
+    variants = remove_insulation_variants(constr_file, mat_file, remove=True)
+    with open(constr_file, 'r') as f:
+        constr_dict = json.load(f)
+    with open(mat_file, 'r') as f:
+        mat_dict = json.load(f)
+    assert not any(c_id in constr_dict for c_id in variants[constr_file])
+    assert not any(m_id in mat_dict for m_id in variants[mat_file])
+    # all remaining constructions still have their materials
+    for constr in constr_dict.values():
+        assert all(mat in mat_dict for mat in constr['materials'])
+    assert find_insulation_variants(constr_dict, mat_dict) == ([], [])
@@ -0,0 +1,23 @@
+# coding=utf-8
+from standards_update._lib._loadjson import load_json
+from standards_update._util._benchmark import benchmark_interned_json
+
+import os
+
+
+def test_load_json_interned():
+    """Test that interned JSON data is equal to plain data but uses less memory."""
+    prog_file = './honeybee_energy_standards/programtypes/2019_data.json'
+    plain = load_json(prog_file)
+    interned = load_json(prog_file, intern_strings=True)
+    assert interned == plain
+    prog_ids = list(interned)
+    assert interned[prog_ids[0]]['type'] is interned[prog_ids[1]]['type']
+
+    # report the memory saved across all vintages of the _lib loaders
+    for folder in ('programtypes', 'constructionsets'):
+        folder = os.path.join('./honeybee_energy_standards', folder)
+        json_files = [os.path.join(folder, f) for f in sorted(os.listdir(folder))
+                      if f.endswith('_data.json')]
+        result = benchmark_interned_json(json_files)
+        assert result['interned'] < result['plain'] * 0.8
@@ -0,0 +1,53 @@
+# coding=utf-8
+from honeybee_energy.schedule.ruleset import ScheduleRuleset
+
+from standards_update._util._json_writer import compact_json_regex, \
+    iter_compact_json, write_compact_json
+from standards_update._util._benchmark import benchmark_json_writer
+
+import json
+
+
+def test_compact_json_standards_schedule(tmpdir):
+    """Test that the streaming writer matches the regex passes for gem schedules."""
+    with open('./tests/standards/OpenStudio_Standards_schedule.json', 'r') as f:
+        sch_dict = json.load(f)
+
+    dest_file = str(tmpdir.join('schedule.json'))
+    write_compact_json(sch_dict, dest_file)
+    with open(dest_file, 'r') as f:
+        assert f.read() == compact_json_regex(sch_dict)
+
+
+def test_compact_json_honeybee_schedule():
+    """Test that the streaming writer matches the regex passes for honeybee schedules."""
+    with open('./tests/standards/OpenStudio_Standards_schedule.json', 'r') as f:
+        sch_dict = json.load(f)
+    schedule = ScheduleRuleset.from_standards_dict(sch_dict['Large Office Bldg Occ'])
+    hb_dict = {schedule.identifier: schedule.to_dict(abridged=True)}
+
+    assert ''.join(iter_compact_json(hb_dict, True)) == \
+        compact_json_regex(hb_dict, True)
+    assert '"times": [[0, 0], [6, 0],' in compact_json_regex(hb_dict, True)
+
+
+def test_compact_json_mixed_values():
+    """Test that the streaming writer matches the regex passes for mixed values."""
+    data = {
+        'a': {'values': [0.5, 1, -0.25, 2.0, 1e-07, 3, 0.1], 'interpolate': False},
+        'b': {'start_date': [1, 1], 'end_date': [12, 31], 'ratio': 0.5, 'on': True},
+        'c': [[0, 0], [-1, 30], [1, 2, 3], {'x': -1.5, 'y': [], 'z': {}}],
+        'd': ['Theoretical Glass [207]', None, 100.0],
+        'e': {}
+    }
+    for compact_pairs in (False, True):
+        assert ''.join(iter_compact_json(data, compact_pairs)) == \
+            compact_json_regex(data, compact_pairs)
+        assert json.loads(''.join(iter_compact_json(data, compact_pairs))) == data
+
+
+def test_benchmark_json_writer():
+    """Test the benchmark of the streaming writer against the regex passes."""
+    result = benchmark_json_writer(
+        './tests/standards/OpenStudio_Standards_schedule.json', repeat=1)
+    assert result['identical']
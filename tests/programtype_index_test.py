@@ -0,0 +1,95 @@
+# coding=utf-8
+from standards_update._lib import _programtype_index
+from standards_update._lib._programtype_index import ProgramTypeIndex, \
+    program_type_index
+
+import json
+import pytest
+
+
+def test_program_type_index():
+    """Test that the index matches the program type data."""
+    index = program_type_index()
+    assert program_type_index() is index
+    p_file = './honeybee_energy_standards/programtypes/2019_data.json'
+    with open(p_file) as f:
+        p_types = json.load(f)
+    office = p_types['2019::LargeOffice::OpenOffice']
+    vals = index.values('2019::LargeOffice::OpenOffice')
+    assert vals['people_per_area'] == office['people']['people_per_area']
+    assert vals['lighting_per_area'] == office['lighting']['watts_per_area']
+    assert vals['gas_equipment_per_area'] == 0
+    with pytest.raises(ValueError):
+        index.values('Not A Program')
+
+
+def test_program_type_index_query():
+    """Test querying the index against a filter of the program type data."""
+    index = program_type_index()
+    result = index.query(vintage='2019', lighting_per_area=(5, 8),
+                         people_per_area=(0.1, None))
+    p_file = './honeybee_energy_standards/programtypes/2019_data.json'
+    with open(p_file) as f:
+        p_types = json.load(f)
+    expected = [p_id for p_id, p in p_types.items()
+                if 'lighting' in p and 5 <= p['lighting']['watts_per_area'] <= 8
+                and 'people' in p and p['people']['people_per_area'] >= 0.1]
+    assert len(result) > 0
+    assert result == expected
+    assert all(p_id.startswith('2019::LargeOffice')
+               for p_id in index.query(vintage='2019', building_type='LargeOffice'))
+    with pytest.raises(ValueError):
+        index.query(not_a_field=(0, 1))
+
+
+def test_program_type_index_file(tmpdir):
+    """Test that the index file written with the package data is up to date."""
+    index = ProgramTypeIndex.from_data_folder('./honeybee_energy_standards')
+    assert ProgramTypeIndex.from_file(
+        './honeybee_energy_standards/programtypes_index.json').to_dict() == \
+        index.to_dict()
+    index_file = index.to_file(str(tmpdir.join('index.json')))
+    assert ProgramTypeIndex.from_file(index_file).to_dict() == index.to_dict()
+
+
+def test_program_type_index_nearest():
+    """Test finding the program types with loads closest to a target."""
+    index = program_type_index()
+    office = index.values('2019::LargeOffice::OpenOffice')
+    target = {field: office[field] for field in
+              ('people_per_area', 'lighting_per_area', 'electric_equipment_per_area',
+               'ventilation_per_area', 'service_hot_water_per_area')}
+    result = index.nearest(3, vintage='2019', **target)
+    assert len(result) == 3
+    assert result[0] == '2019::LargeOffice::OpenOffice'
+    assert all(p_id.startswith('2019::') for p_id in result)
+
+    result = index.nearest(2, building_type='MediumOffice', lighting_per_area=8.0)
+    assert len(result) == 2
+    assert all('::MediumOffice::' in p_id for p_id in result)
+    with pytest.raises(ValueError):
+        index.nearest(not_a_field=1)
+
+
+def test_program_type_index_without_numpy(monkeypatch):
+    """Test that the NumPy and pure Python queries of the index give the same results."""
+    pytest.importorskip('numpy')
+    queries = (
+        {'vintage': '2019', 'lighting_per_area': (5, 8), 'people_per_area': (0.1, None)},
+        {'building_type': 'LargeOffice', 'ventilation_per_area': (None, 0.0005)},
+        {'electric_equipment_per_area': (10, 20)}
+    )
+    targets = (
+        {'count': 5, 'people_per_area': 0.05, 'lighting_per_area': 8},
+        {'count': 3, 'vintage': '2013', 'building_type': 'MediumOffice',
+         'electric_equipment_per_area': 10}
+    )
+    index = ProgramTypeIndex.from_data_folder('./honeybee_energy_standards')
+    results = [index.query(**q) for q in queries] + \
+        [index.nearest(**t) for t in targets]
+    assert all(len(result) > 0 for result in results)
+
+    monkeypatch.setattr(_programtype_index, 'numpy', None)
+    index = ProgramTypeIndex.from_data_folder('./honeybee_energy_standards')
+    assert [index.query(**q) for q in queries] + \
+        [index.nearest(**t) for t in targets] == results
@@ -9,6 +9,8 @@ from honeybee_energy.load.setpoint import Setpoint
 
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 
+from standards_update._lib.programtypes import program_type_full_dict
+
 import pytest
 import json
 
@@ -89,3 +91,21 @@ def test_building_mix():
             assert isinstance(prog_from_lib, ProgramType)
         total_fracts = sum(f for f in building.values())
         assert total_fracts == pytest.approx(1, rel=1e-3)
+
+
+def test_program_type_full_dict():
+    """Test that full program type dictionaries are generated once and re-used."""
+    p_type_id = '2019::LargeOffice::OpenOffice'
+    p_dict = program_type_full_dict(p_type_id)
+    p_type = prog_type_lib.program_type_by_identifier(p_type_id)
+    full_dict = json.loads(json.dumps(p_type.to_dict(abridged=False)))
+    assert p_dict == full_dict
+    assert p_dict['lighting']['schedule']['type'] == 'ScheduleRuleset'
+    # each request gets its own copy that can be edited
+    p_dict['lighting']['watts_per_area'] = 0
+    other_dict = program_type_full_dict(p_type_id)
+    assert other_dict is not p_dict
+    assert other_dict == full_dict
+    assert ProgramType.from_dict(p_dict).identifier == p_type_id
+    with pytest.raises(ValueError):
+        program_type_full_dict('Not A Program')
@@ -0,0 +1,61 @@
+# coding=utf-8
+from standards_update._lib._registry import ProgramTypeRegistry, \
+    program_type_registry
+
+import os
+import json
+import pytest
+
+
+def _vintage_registries():
+    """Load the registry JSON of each vintage in the package data."""
+    reg_dir = './honeybee_energy_standards/programtypes_registry'
+    registries = {}
+    for f_name in os.listdir(reg_dir):
+        with open(os.path.join(reg_dir, f_name)) as f:
+            registries[f_name.replace('_registry.json', '')] = json.load(f)
+    return registries
+
+
+def test_program_type_registry():
+    """Test that the merged registry matches the registry of each vintage."""
+    registry = program_type_registry()
+    assert program_type_registry() is registry
+    assert registry.vintages == ('pre_1980', '1980_2004', '2004', '2007', '2010',
+                                 '2013', '2016', '2019')
+    registries = _vintage_registries()
+    for vintage, vintage_reg in registries.items():
+        for bldg, space_types in vintage_reg.items():
+            assert sorted(registry.space_types(bldg, vintage)) == sorted(space_types)
+    for bldg in registry.building_types:
+        for space_type in registry.space_types(bldg):
+            assert registry.vintages_of(bldg, space_type) == tuple(
+                v for v in registry.vintages
+                if space_type in registries[v].get(bldg, []))
+
+
+def test_program_type_registry_availability():
+    """Test checking the availability of space types."""
+    registry = program_type_registry()
+    assert registry.is_available('LargeOffice', 'OpenOffice')
+    assert registry.is_available('LargeOffice', 'OpenOffice', '2019')
+    assert 'OpenOffice' in registry.space_types('LargeOffice')
+    assert not registry.is_available('LargeOffice', 'Not A Space')
+    assert not registry.is_available('Not A Building', 'OpenOffice')
+    assert not registry.is_available('LargeOffice', 'OpenOffice', '1850')
+    with pytest.raises(ValueError):
+        registry.space_types('Not A Building')
+    with pytest.raises(ValueError):
+        registry.space_types('LargeOffice', '1850')
+    with pytest.raises(ValueError):
+        registry.vintages_of('LargeOffice', 'Not A Space')
+
+
+def test_program_type_registry_file(tmpdir):
+    """Test that the registry file written with the package data is up to date."""
+    registry = ProgramTypeRegistry.from_data_folder('./honeybee_energy_standards')
+    assert ProgramTypeRegistry.from_file(
+        './honeybee_energy_standards/programtypes_registry.json').to_dict() == \
+        registry.to_dict()
+    reg_file = registry.to_file(str(tmpdir.join('registry.json')))
+    assert ProgramTypeRegistry.from_file(reg_file).to_dict() == registry.to_dict()
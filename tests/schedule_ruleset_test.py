@@ -3,6 +3,9 @@ from honeybee_energy.schedule.ruleset import ScheduleRuleset
 import honeybee_energy.lib.scheduletypelimits as schedule_types
 import honeybee_energy.lib.schedules as sched_lib
 
+import standards_update.extension.schedule.ruleset as ruleset_ext
+from standards_update._util._benchmark import benchmark_schedule_interning
+
 import json
 
 
@@ -22,3 +25,59 @@ def test_schedule_by_identifier():
     for sched in sched_lib.SCHEDULES:
         sched_from_lib = sched_lib.schedule_by_identifier(sched)
         assert isinstance(sched_from_lib, ScheduleRuleset)
+
+
+def test_from_standards_dict_shares_day_values():
+    """Test that identical ScheduleDays share their values while keeping identifiers."""
+    with open('./tests/standards/OpenStudio_Standards_schedule.json', 'r') as f:
+        sched_dict = json.load(f)['Large Office Bldg Occ']
+    schedule = ScheduleRuleset.from_standards_dict(sched_dict)
+    other_schedule = ScheduleRuleset.from_standards_dict(sched_dict)
+
+    assert schedule.default_day_schedule is not other_schedule.default_day_schedule
+    assert schedule.default_day_schedule.identifier == 'Large Office Bldg Occ_Default'
+    assert schedule.default_day_schedule.values is \
+        other_schedule.default_day_schedule.values
+    assert schedule.default_day_schedule.times is \
+        other_schedule.default_day_schedule.times
+    assert schedule.default_day_schedule.values == \
+        (0.0, 0.1, 0.2, 0.95, 0.5, 0.95, 0.7, 0.4, 0.1, 0.05)
+    for day in (schedule.holiday_schedule, schedule.summer_designday_schedule,
+                schedule.winter_designday_schedule):
+        if day is not None and day.values == schedule.default_day_schedule.values:
+            assert day.values is schedule.default_day_schedule.values
+            assert day.times is schedule.default_day_schedule.times
+
+    # editing the values of one day must not change the other
+    new_day = schedule.default_day_schedule.duplicate()
+    new_day.values = [1] * len(new_day.values)
+    assert other_schedule.default_day_schedule.values[0] == 0.0
+
+
+def test_interned_pool_bound(monkeypatch):
+    """Test that the pool of shared ScheduleDay tuples is bounded and can be cleared."""
+    with open('./tests/standards/OpenStudio_Standards_schedule.json', 'r') as f:
+        sched_dict = json.load(f)['Large Office Bldg Occ']
+    monkeypatch.setattr(ruleset_ext, '_day_values', {})
+    monkeypatch.setattr(ruleset_ext, 'MAX_INTERNED', 0)
+    schedule = ScheduleRuleset.from_standards_dict(sched_dict)
+    other_schedule = ScheduleRuleset.from_standards_dict(sched_dict)
+    assert len(ruleset_ext._day_values) == 0
+    assert schedule.default_day_schedule.values is not \
+        other_schedule.default_day_schedule.values
+    assert schedule.default_day_schedule == other_schedule.default_day_schedule
+
+    monkeypatch.setattr(ruleset_ext, 'MAX_INTERNED', 100000)
+    ScheduleRuleset.from_standards_dict(sched_dict)
+    assert len(ruleset_ext._day_values) > 0
+    ruleset_ext.clear_interned()
+    assert len(ruleset_ext._day_values) == 0
+
+
+def test_benchmark_schedule_interning():
+    """Test the benchmark of the memory saved by sharing ScheduleDay values."""
+    result = benchmark_schedule_interning(
+        './tests/standards/OpenStudio_Standards_schedule.json')
+    assert result['schedules'] == 1
+    assert result['unique_tuples'] < result['day_schedules'] * 2
+    assert result['shared_bytes'] < result['unshared_bytes']
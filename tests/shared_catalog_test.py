@@ -0,0 +1,71 @@
+# coding=utf-8
+from standards_update._lib._catalog import load_catalog
+from standards_update._lib._shared import SharedCatalog
+
+import sys
+import json
+import pickle
+import subprocess
+import multiprocessing
+import pytest
+
+
+def test_shared_catalog():
+    """Test that the records of the shared catalog match the standards data."""
+    catalog = SharedCatalog.create()
+    try:
+        data = load_catalog()
+        assert set(catalog.object_types) == set(data.keys())
+        for obj_type, obj_dicts in data.items():
+            assert len(catalog[obj_type]) == len(obj_dicts)
+        p_type_id = '2019::LargeOffice::OpenOffice'
+        assert catalog.record('program_type', p_type_id) == \
+            data['program_type'][p_type_id]
+        with pytest.raises(ValueError):
+            catalog.record('program_type', 'Not A Program')
+
+        objects, missing = catalog.closure('program_type', [p_type_id, 'Missing'])
+        assert missing == ['Missing']
+        occ_sch = data['program_type'][p_type_id]['people']['occupancy_schedule']
+        assert objects['schedule'][occ_sch] == data['schedule'][occ_sch]
+
+        attached = pickle.loads(pickle.dumps(catalog))
+        assert attached.name == catalog.name
+        assert attached.record('program_type', p_type_id) == \
+            data['program_type'][p_type_id]
+        attached.close()
+    finally:
+        catalog.close()
+
+
+def test_shared_catalog_spawn():
+    """Test that the shared catalog can be read by spawned processes."""
+    catalog = SharedCatalog.create()
+    p_type_ids = list(catalog['program_type'])[:4]
+    expected = [catalog.record('program_type', p_id) for p_id in p_type_ids]
+    try:
+        pool = multiprocessing.get_context('spawn').Pool(2)
+        try:
+            results = [pool.apply_async(catalog.record, ('program_type', p_id))
+                       for p_id in p_type_ids]
+            assert [r.get(timeout=60) for r in results] == expected
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        catalog.close()
+
+
+def test_shared_catalog_worker():
+    """Test that a process that attaches to the catalog does not unlink it on exit."""
+    catalog = SharedCatalog.create()
+    try:
+        cmd = [sys.executable, '-m', 'standards_update._util._memory_worker',
+               'shared', catalog.name, '10']
+        memory = json.loads(subprocess.check_output(cmd).decode('utf-8'))
+        assert memory['rss'] > 0 and memory['records'] == 10
+        attached = SharedCatalog.attach(catalog.name)
+        assert len(attached['program_type']) == len(catalog['program_type'])
+        attached.close()
+    finally:
+        catalog.close()
@@ -0,0 +1,35 @@
+# coding=utf-8
+import honeybee_energy.lib.constructions as constr_lib
+
+from standards_update._util._to_honeybee import translate_objects, translation_pool, \
+    abridged_dict
+
+from functools import partial
+import pytest
+
+
+def test_translate_objects_parallel():
+    """Test that translating in parallel gives the same result as in series."""
+    obj_ids = list(constr_lib.OPAQUE_CONSTRUCTIONS)
+    translate_func = partial(abridged_dict, constr_lib.opaque_construction_by_identifier)
+    serial_dict = translate_objects(obj_ids, translate_func)
+
+    pool = translation_pool(2)
+    try:
+        parallel_dict = translate_objects(obj_ids, translate_func, pool, chunk_size=20)
+    finally:
+        pool.close()
+        pool.join()
+    assert list(parallel_dict.keys()) == obj_ids
+    assert parallel_dict == serial_dict
+
+
+def test_translate_objects_errors():
+    """Test that all objects that fail to translate are reported by identifier."""
+    obj_ids = [constr_lib.OPAQUE_CONSTRUCTIONS[0], 'Not A Construction', 'Not Either']
+    translate_func = partial(abridged_dict, constr_lib.opaque_construction_by_identifier)
+    with pytest.raises(ValueError) as e:
+        translate_objects(obj_ids, translate_func, chunk_size=2)
+    assert '2 objects failed' in str(e.value)
+    assert '"Not A Construction"' in str(e.value)
+    assert '"Not Either"' in str(e.value)
@@ -0,0 +1,135 @@
+# coding=utf-8
+from honeybee_energy.material.opaque import EnergyMaterial, EnergyMaterialNoMass
+from honeybee_energy.material.glazing import EnergyWindowMaterialGlazing, \
+    EnergyWindowMaterialSimpleGlazSys
+from honeybee_energy.material.gas import EnergyWindowMaterialGas
+from honeybee_energy.programtype import ProgramType
+
+from standards_update.extension._units import to_si, si_value, is_converted, \
+    convert_records, release_records
+from standards_update._util._benchmark import benchmark_unit_conversion
+
+import os
+import json
+import pytest
+
+OPAQUE_MATERIALS = {
+    'G01 13mm gypsum board': {
+        'name': 'G01 13mm gypsum board', 'material_type': 'StandardOpaqueMaterial',
+        'roughness': 'Smooth', 'thickness': 0.5, 'conductivity': 1.10957,
+        'density': 49.9424, 'specific_heat': 0.260516252, 'thermal_absorptance': 0.9,
+        'solar_absorptance': 0.7, 'visible_absorptance': 0.5},
+    'CP02 CARPET PAD': {
+        'name': 'CP02 CARPET PAD', 'material_type': 'MasslessOpaqueMaterial',
+        'roughness': 'Smooth', 'resistance': 0.160253201, 'thermal_absorptance': 0.9,
+        'solar_absorptance': 0.8, 'visible_absorptance': 0.8}
+}
+WINDOW_MATERIALS = {
+    'Blue 6mm': {
+        'name': 'Blue 6mm', 'material_type': 'StandardGlazing',
+        'optical_data_type': 'SpectralAverage', 'thickness': 0.2362204,
+        'solar_transmittance_at_normal_incidence': 0.45,
+        'front_side_solar_reflectance_at_normal_incidence': 0.36,
+        'back_side_solar_reflectance_at_normal_incidence': 0.36,
+        'visible_transmittance_at_normal_incidence': 0.714,
+        'front_side_visible_reflectance_at_normal_incidence': 0.207,
+        'back_side_visible_reflectance_at_normal_incidence': 0.207,
+        'infrared_transmittance_at_normal_incidence': 0,
+        'front_side_infrared_hemispherical_emissivity': 0.84,
+        'back_side_infrared_hemispherical_emissivity': 0.0466,
+        'conductivity': 6.24012,
+        'dirt_correction_factor_for_solar_and_visible_transmittance': 1,
+        'solar_diffusing': 0},
+    'Fixed Window': {
+        'name': 'Fixed Window', 'material_type': 'SimpleGlazing', 'u_factor': 0.45,
+        'solar_heat_gain_coefficient': 0.45, 'visible_transmittance': 0.35},
+    'Gap_1_W_0_0018': {
+        'name': 'Gap_1_W_0_0018', 'material_type': 'Gas', 'thickness': 0.070866,
+        'gas_type': 'Air'}
+}
+PROGRAM_TYPES = {
+    '2019::MediumOffice::OpenOffice': {
+        'space_type': '2019::MediumOffice::OpenOffice',
+        'lighting_per_area': 0.98, 'additional_lighting_per_area': None,
+        'lighting_fraction_to_return_air': 0.0, 'lighting_fraction_radiant': 0.7,
+        'lighting_fraction_visible': 0.2, 'lighting_schedule': 'Generic Office Lighting',
+        'ventilation_standard': 'ASHRAE 62.1-2007', 'ventilation_per_area': 0.06,
+        'ventilation_per_person': 5.0, 'ventilation_air_changes': None,
+        'occupancy_per_area': 5.25, 'occupancy_schedule': 'Generic Office Occupancy',
+        'occupancy_activity_schedule': 'Seated Adult Activity',
+        'infiltration_per_exterior_area': 0.0446,
+        'infiltration_schedule': 'Generic Office Infiltration',
+        'gas_equipment_per_area': None, 'gas_equipment_schedule': None,
+        'electric_equipment_per_area': 0.96, 'electric_equipment_fraction_latent': 0.0,
+        'electric_equipment_fraction_radiant': 0.5,
+        'electric_equipment_fraction_lost': 0.0,
+        'electric_equipment_schedule': 'Generic Office Equipment',
+        'heating_setpoint_schedule': 'Generic Office Heating',
+        'cooling_setpoint_schedule': 'Generic Office Cooling'}
+}
+
+
+def _material_class(data):
+    """Get the honeybee class of a standards gem material record."""
+    return {
+        'StandardOpaqueMaterial': EnergyMaterial,
+        'MasslessOpaqueMaterial': EnergyMaterialNoMass,
+        'StandardGlazing': EnergyWindowMaterialGlazing,
+        'SimpleGlazing': EnergyWindowMaterialSimpleGlazSys,
+        'Gas': EnergyWindowMaterialGas
+    }[data['material_type']]
+
+
+def test_si_value():
+    """Test the conversion of individual values from the standards gem."""
+    assert to_si(0.5, 'in') == 0.0254 * 0.5
+    assert to_si(1.10957, 'Btu-in/h-ft2-F') == 1.10957 / 6.9381117
+    record = {'lighting_per_area': 0.98, 'gas_equipment_per_area': None}
+    assert si_value(record, 'lighting_per_area', 'W/ft2') == 0.98 * 10.7639
+    with pytest.raises(TypeError):
+        si_value(record, 'gas_equipment_per_area', 'Btu/h-ft2')
+    with pytest.raises(KeyError):
+        si_value(record, 'electric_equipment_per_area', 'W/ft2')
+
+    records = convert_records({'a': record}, 'program_type')
+    converted = records['a']
+    assert is_converted(converted) and not is_converted(record)
+    assert set(converted) == set(record)  # no marker is added to the record
+    assert si_value(converted, 'lighting_per_area', 'W/ft2') == 0.98 * 10.7639
+    with pytest.raises(TypeError):
+        si_value(converted, 'gas_equipment_per_area', 'Btu/h-ft2')
+    release_records(records)
+    assert not is_converted(converted)
+
+
+def test_convert_records_matches_per_record():
+    """Test that objects from converted records match those from the original ones."""
+    for records, record_type in ((OPAQUE_MATERIALS, 'opaque_material'),
+                                 (WINDOW_MATERIALS, 'window_material')):
+        converted = convert_records(records, record_type)
+        assert not any(is_converted(rec) for rec in records.values())
+        assert convert_records(converted, record_type) == converted
+        assert all(set(converted[r_id]) == set(rec) for r_id, rec in records.items())
+        for mat_id, record in records.items():
+            mat_class = _material_class(record)
+            assert mat_class.from_standards_dict(converted[mat_id]).to_dict() == \
+                mat_class.from_standards_dict(dict(record)).to_dict()
+
+    converted = convert_records(PROGRAM_TYPES, 'program_type')
+    for prog_id, record in PROGRAM_TYPES.items():
+        assert ProgramType.from_standards_dict(converted[prog_id]).to_dict() == \
+            ProgramType.from_standards_dict(record).to_dict()
+
+
+def test_benchmark_unit_conversion(tmpdir):
+    """Test the benchmark of the batch unit conversion of standards gem files."""
+    data_dir = str(tmpdir)
+    os.mkdir(os.path.join(data_dir, 'program_type'))
+    for file_name, records in (('opaque_material.json', OPAQUE_MATERIALS),
+                               ('window_material.json', WINDOW_MATERIALS),
+                               ('program_type/2019_data.json', PROGRAM_TYPES)):
+        with open(os.path.join(data_dir, file_name), 'w') as fp:
+            json.dump(records, fp)
+    result = benchmark_unit_conversion(data_dir, repeat=1)
+    assert result['values'] == 15
+    assert result['mismatches'] == []
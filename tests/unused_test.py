@@ -0,0 +1,117 @@
+# coding=utf-8
+from standards_update._util._unused import find_unused_objects, remove_unused_objects, \
+    default_keep, ADIABATIC_CONSTRUCTIONS
+from standards_update._util._compress import compress_data
+
+import os
+import json
+import shutil
+import pytest
+
+
+def _make_data_dir(tmpdir):
+    """Make a data folder with the shipped constructions and a small program type."""
+    data_dir = str(tmpdir.join('data'))
+    for folder in ('constructions', 'constructionsets'):
+        shutil.copytree(os.path.join('./honeybee_energy_standards', folder),
+                        os.path.join(data_dir, folder))
+    os.mkdir(os.path.join(data_dir, 'programtypes'))
+    os.mkdir(os.path.join(data_dir, 'schedules'))
+    p_types = {
+        'Office': {
+            'type': 'ProgramTypeAbridged', 'identifier': 'Office',
+            'people': {'type': 'PeopleAbridged', 'people_per_area': 0.05,
+                       'occupancy_schedule': 'Office Occ',
+                       'activity_schedule': 'Office Activity'},
+            'setpoint': {'type': 'SetpointAbridged',
+                         'heating_schedule': 'Office Heat',
+                         'cooling_schedule': 'Office Cool'}
+        }
+    }
+    with open(os.path.join(data_dir, 'programtypes', '2019_data.json'), 'w') as fp:
+        json.dump(p_types, fp)
+    sch_ids = ('Office Occ', 'Office Activity', 'Office Heat', 'Office Cool',
+               'Always On', 'Orphan Schedule')
+    schedules = {s_id: {'type': 'ScheduleRulesetAbridged', 'identifier': s_id}
+                 for s_id in sch_ids}
+    with open(os.path.join(data_dir, 'schedules', 'schedule.json'), 'w') as fp:
+        json.dump(schedules, fp)
+    return data_dir
+
+
+def test_find_unused_objects(tmpdir):
+    """Test that unused schedules, constructions and materials are found."""
+    data_dir = _make_data_dir(tmpdir)
+    unused = find_unused_objects(data_dir)
+    sch_file = os.path.join('schedules', 'schedule.json')
+    assert unused[sch_file] == ['Orphan Schedule']
+
+    # all constructions used by the construction sets should be kept
+    with open(os.path.join(data_dir, 'constructionsets', '2019_data.json')) as f:
+        c_set = list(json.load(f).values())[0]
+    wall = c_set['wall_set']['exterior_construction']
+    opq_file = os.path.join('constructions', 'opaque_construction.json')
+    assert wall not in unused[opq_file]
+    assert not any(c.startswith('Adiabatic') for c in unused[opq_file])
+    assert any(c.startswith('Adiabatic') for c in find_unused_objects(
+        data_dir, keep=())[opq_file])
+
+    # materials used by kept constructions should be kept
+    with open(os.path.join(data_dir, opq_file)) as f:
+        wall_mats = json.load(f)[wall]['materials']
+    mat_file = os.path.join('constructions', 'opaque_material.json')
+    assert all(mat not in unused[mat_file] for mat in wall_mats)
+
+
+def test_find_unused_objects_shipped():
+    """Test that no object needed by honeybee-energy is unused in the shipped data."""
+    unused = find_unused_objects('./honeybee_energy_standards')
+    keep = default_keep()
+    assert all(obj_id in keep for obj_id in ADIABATIC_CONSTRUCTIONS)
+    assert 'Dry Sand' in keep and 'Grassy Lawn' in keep
+    for obj_ids in unused.values():
+        assert not any(obj_id in keep for obj_id in obj_ids)
+    opq_file = os.path.join('constructions', 'opaque_construction.json')
+    assert 'Typical Insulated Metal Building Wall' not in unused[opq_file]
+    mat_file = os.path.join('constructions', 'opaque_material.json')
+    assert 'Typical Insulation' not in unused[mat_file]
+    assert 'Adiabatic Material' not in unused[mat_file]
+
+
+def test_remove_unused_objects(tmpdir):
+    """Test that removing unused objects leaves nothing unused and nothing missing."""
+    data_dir = _make_data_dir(tmpdir)
+    report = remove_unused_objects(data_dir, remove=False)
+    assert find_unused_objects(data_dir) == report
+
+    remove_unused_objects(data_dir, remove=True)
+    assert all(len(v) == 0 for v in find_unused_objects(data_dir).values())
+    with open(os.path.join(data_dir, 'schedules', 'schedule.json')) as f:
+        schedules = json.load(f)
+    assert 'Always On' in schedules
+    assert 'Orphan Schedule' not in schedules
+
+    # every construction should still have all of its materials
+    mats = {}
+    for f_name in ('opaque_material.json', 'window_material.json'):
+        with open(os.path.join(data_dir, 'constructions', f_name)) as f:
+            mats.update(json.load(f))
+    for f_name in ('opaque_construction.json', 'window_construction.json'):
+        with open(os.path.join(data_dir, 'constructions', f_name)) as f:
+            for constr in json.load(f).values():
+                assert all(mat in mats for mat in constr.get('materials', []))
+
+
+def test_unused_objects_compressed(tmpdir):
+    """Test that compressed files are checked and that missing files raise errors."""
+    data_dir = _make_data_dir(tmpdir)
+    expected = find_unused_objects(data_dir)
+    compress_data(os.path.join(data_dir, 'schedules'))
+    compress_data(os.path.join(data_dir, 'constructions'))
+    assert find_unused_objects(data_dir) == expected
+    with pytest.raises(ValueError):
+        remove_unused_objects(data_dir, remove=True)
+
+    os.remove(os.path.join(data_dir, 'schedules', 'schedule.json.gz'))
+    with pytest.raises(FileNotFoundError):
+        find_unused_objects(data_dir)
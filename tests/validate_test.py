@@ -0,0 +1,51 @@
+# coding=utf-8
+from standards_update._util._validate import validate_data, check_data
+
+import os
+import sys
+import json
+import shutil
+import subprocess
+import pytest
+
+
+def test_validate_package_data():
+    """Test that all references in the packaged data resolve."""
+    assert validate_data('./honeybee_energy_standards') == []
+
+
+def test_validate_data_errors(tmpdir):
+    """Test that all broken references are reported together."""
+    data_dir = str(tmpdir.join('data'))
+    shutil.copytree('./honeybee_energy_standards', data_dir)
+
+    c_set_file = os.path.join(data_dir, 'constructionsets', '2019_data.json')
+    with open(c_set_file) as f:
+        c_sets = json.load(f)
+    c_set = list(c_sets.values())[0]
+    c_set['wall_set']['exterior_construction'] = 'Missing Wall'
+    with open(c_set_file, 'w') as fp:
+        json.dump(c_sets, fp)
+
+    mix_file = os.path.join(data_dir, 'building_mix.json')
+    with open(mix_file) as f:
+        building_mix = json.load(f)
+    building_mix['Office'] = {'2019::Office::Missing': 1.0}
+    with open(mix_file, 'w') as fp:
+        json.dump(building_mix, fp)
+
+    errors = validate_data(data_dir)
+    assert len(errors) == 2
+    assert '"Missing Wall"' in errors[0]
+    assert '"2019::Office::Missing"' in errors[1]
+    with pytest.raises(ValueError) as e:
+        check_data(data_dir)
+    assert '2 references failed' in str(e.value)
+
+
+def test_validate_import():
+    """Test that the validator can be imported without honeybee_energy."""
+    code = 'import sys; import standards_update._util._validate; ' \
+        'print("honeybee_energy" in sys.modules)'
+    result = subprocess.check_output([sys.executable, '-c', code], cwd=os.getcwd())
+    assert result.decode('utf-8').strip() == 'False'
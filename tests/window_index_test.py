@@ -0,0 +1,79 @@
+# coding=utf-8
+import honeybee_energy.lib.constructions as constr_lib
+from honeybee_energy.material.glazing import EnergyWindowMaterialGlazing, \
+    EnergyWindowMaterialSimpleGlazSys
+from honeybee_energy.material.gas import EnergyWindowMaterialGas
+from honeybee_energy.construction.window import WindowConstruction
+
+from standards_update._lib._window_index import WindowConstructionIndex, \
+    window_construction_index
+
+import pytest
+
+
+def test_window_construction_index():
+    """Test that the index matches the honeybee window construction objects."""
+    index = window_construction_index()
+    assert window_construction_index() is index
+    assert len(index) == 345
+    for constr_id in ('ASHRAE 189.1-2009 ExtWindow ClimateZone 1',
+                      'U 1.98 SHGC 0.39 Simple Glazing Skylight'):
+        constr = constr_lib.window_construction_by_identifier(constr_id)
+        vals = index.values(constr_id)
+        assert vals['u_factor'] == pytest.approx(constr.u_factor, rel=1e-9)
+        assert vals['shgc'] == pytest.approx(constr.shgc, rel=1e-9)
+        assert vals['visible_transmittance'] == \
+            pytest.approx(constr.visible_transmittance, rel=1e-9)
+    with pytest.raises(ValueError):
+        index.values('Not A Window')
+
+
+def test_window_construction_index_layers():
+    """Test the index of simple glazing and multi-layer constructions."""
+    simple = WindowConstruction(
+        'Simple Window', [EnergyWindowMaterialSimpleGlazSys('Simple', 1.8, 0.3, 0.6)])
+    lowe = EnergyWindowMaterialGlazing(
+        'Low-e Glass', 0.006, 0.4, 0.3, 0.7, 0.1, 0, 0.84, 0.05, 1)
+    clear = EnergyWindowMaterialGlazing('Clear Glass')
+    gap = EnergyWindowMaterialGas('Argon Gap', 0.0127, 'Argon')
+    double = WindowConstruction('Double Pane', [lowe, gap, clear])
+    index = WindowConstructionIndex.from_window_constructions([simple, double])
+    assert index.values('Simple Window') == {
+        'u_factor': simple.u_factor, 'shgc': simple.shgc,
+        'visible_transmittance': simple.visible_transmittance}
+    assert index.values('Double Pane')['u_factor'] == double.u_factor
+    assert index.values('Double Pane')['shgc'] == double.shgc
+
+
+def test_window_construction_index_query():
+    """Test querying the index against a filter of the honeybee objects."""
+    index = window_construction_index()
+    result = index.query(sort_by='u_factor', u_factor=(None, 2.5),
+                         shgc=(0.25, 0.4), visible_transmittance=(0.4, None))
+    expected = []
+    for constr_id in index.identifiers:
+        constr = constr_lib.window_construction_by_identifier(constr_id)
+        if constr.u_factor <= 2.5 and 0.25 <= constr.shgc <= 0.4 and \
+                constr.visible_transmittance >= 0.4:
+            expected.append((constr.u_factor, constr_id))
+    assert len(result) > 0
+    assert result == [c_id for _, c_id in sorted(expected, key=lambda x: x[0])]
+
+    assert index.query() == list(index.identifiers)
+    high_vt = index.query(sort_by='visible_transmittance', reverse=True)
+    assert high_vt[0] == max(index.identifiers,
+                             key=lambda c: index.values(c)['visible_transmittance'])
+    with pytest.raises(ValueError):
+        index.query(not_a_field=(0, 1))
+    with pytest.raises(ValueError):
+        index.query(sort_by='not_a_field')
+
+
+def test_window_construction_index_file(tmpdir):
+    """Test that the index file written with the package data is up to date."""
+    index = WindowConstructionIndex.from_data_folder('./honeybee_energy_standards')
+    assert WindowConstructionIndex.from_file(
+        './honeybee_energy_standards/window_construction_index.json').to_dict() == \
+        index.to_dict()
+    index_file = index.to_file(str(tmpdir.join('index.json')))
+    assert WindowConstructionIndex.from_file(index_file).to_dict() == index.to_dict()